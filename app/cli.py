@@ -0,0 +1,203 @@
+"""
+Command line entry point for VoteApp maintenance tasks.
+
+Commands:
+- reconcile     : Rebuild the materialized vote counters from the vote table.
+- shard-stats   : Print the votes and counters held by every vote shard.
+- migrate-shards: Move the votes of the main database to their vote shards.
+- audit-indexes : Run every service query on a scratch SQLite database and flag
+                  the ones whose `EXPLAIN QUERY PLAN` contains a table scan.
+
+Run with `poetry run manage <command>`.
+"""
+
+import argparse
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from sqlmodel import Session, SQLModel, func, select
+
+from .databases import build_engine, create_all_tables, vote_shards
+from .databases.database import engine
+from .models import Event, Vote, VoteCount
+from .schemas import EventCreate, UserCreate
+from .schemas.event_schema import ChoiceSchema
+from .services import EventService, UserService
+from .services.vote_writer import VoteWriter
+from .utils.query_audit import QueryRecorder, explain_queries
+
+
+def reconcile(args: argparse.Namespace) -> int:
+    """Rebuild vote counters for one event, or for every event."""
+    with Session(engine) as session:
+        rows = EventService.reconcile_vote_counts(session, args.event_id)
+
+    scope = f"event {args.event_id}" if args.event_id else "all events"
+    print(f"Rebuilt {rows} vote counter(s) for {scope}.")
+    return 0
+
+
+def shard_stats(args: argparse.Namespace) -> int:
+    """Print how many votes, events and counters every vote shard holds."""
+
+    def count(session: Session) -> tuple:
+        return (
+            session.exec(select(func.count(Vote.id))).one(),
+            session.exec(select(func.count(func.distinct(Vote.event_id)))).one(),
+            session.exec(select(func.count(VoteCount.choice_id))).one(),
+        )
+
+    with Session(engine) as session:
+        stats = vote_shards.scatter(session, count)
+
+    urls = vote_shards.urls or [str(engine.url)]
+    for shard, (url, (votes, events, counters)) in enumerate(zip(urls, stats)):
+        print(
+            f"shard {shard}: {votes} vote(s), {events} event(s), "
+            f"{counters} counter(s)  {url}"
+        )
+
+    total = sum(votes for votes, _, _ in stats)
+    print(f"{total} vote(s) across {len(stats)} shard(s).")
+    return 0
+
+
+def run_service_queries(audit_engine) -> list:
+    """Exercise every service query once against `audit_engine` and record the SQL."""
+    with Session(audit_engine) as session, QueryRecorder(audit_engine) as setup:
+        for name in ("audit", "voter"):
+            UserService.create_user(
+                session,
+                UserCreate(email=f"{name}@audit.io", username=name, password=name),
+                hashed_password=name,
+            )
+        creator_id = UserService.get_user_by_username(session, "audit").id
+        voter_id = UserService.get_user_by_username(session, "voter").id
+        UserService.get_user_by_id(session, creator_id)
+
+        EventService.create_event(
+            session,
+            creator_id,
+            EventCreate(
+                name="audit",
+                choices=[ChoiceSchema(choice="A"), ChoiceSchema(choice="B")],
+            ),
+        )
+        EventService.create_events_bulk(
+            session,
+            creator_id,
+            [
+                EventCreate(
+                    name="bulk",
+                    choices=[ChoiceSchema(choice="A"), ChoiceSchema(choice="B")],
+                )
+            ],
+        )
+
+    # Looking the event up is not a service query, so it happens between recordings.
+    with Session(audit_engine) as session:
+        event_id = session.exec(select(Event.id).where(Event.title == "audit")).one()
+
+    writer = VoteWriter(batch_size=10, batch_interval_ms=1)
+    with Session(audit_engine) as session, QueryRecorder(audit_engine) as usage:
+        EventService.create_vote(session, creator_id, event_id, "A")
+        EventService.get_event_by_id(session, event_id)
+        EventService.list_events(session, 10)
+        EventService.list_events(session, 10, after=event_id, creator_id=creator_id)
+        EventService.list_events(session, 10, status="active")
+        EventService.list_events(
+            session,
+            10,
+            after=event_id,
+            status="expired",
+            after_expires_at=datetime(2000, 1, 1),
+        )
+        EventService.list_events(
+            session, 10, status="expired", expires_after=datetime(2000, 1, 1)
+        )
+        EventService.get_event_results(session, event_id)
+        EventService.reconcile_vote_counts(session, event_id)
+        EventService.list_closing_events(session, datetime.now())
+        EventService.freeze_results(session, event_id)
+        list(EventService.export_votes(session, event_id, 10))
+
+        writer.start(audit_engine)
+        writer.create_vote(session, voter_id, event_id, "B")
+        writer.stop()
+
+    return setup.queries + usage.queries
+
+
+def migrate_shards(args: argparse.Namespace) -> int:
+    """Move pre-sharding votes to their shards and rebuild the shard counters."""
+    if not vote_shards.enabled:
+        print("VOTE_SHARDS is 0, nothing to migrate.")
+        return 1
+
+    moved = vote_shards.migrate(args.chunk_size)
+    with Session(engine) as session:
+        rows = EventService.reconcile_vote_counts(session)
+
+    print(
+        f"Moved {moved} vote(s) to {len(vote_shards.engines)} shard(s), "
+        f"rebuilt {rows} vote counter(s)."
+    )
+    return 0
+
+
+def audit_indexes(args: argparse.Namespace) -> int:
+    """Print the query plan of every service query and fail on table scans."""
+    audit_engine = build_engine("sqlite://")
+    SQLModel.metadata.create_all(audit_engine)
+
+    plans = explain_queries(audit_engine, run_service_queries(audit_engine))
+    for plan in plans:
+        status = "SCAN" if plan.scans else "ok"
+        print(f"[{status}] {plan.statement}")
+        for line in plan.plan:
+            print(f"        {line}")
+
+    flagged = [plan for plan in plans if plan.scans]
+    print(f"{len(plans)} queries audited, {len(flagged)} with table scans.")
+    return 1 if flagged else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="manage", description="VoteApp maintenance")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    reconcile_parser = commands.add_parser(
+        "reconcile", help="rebuild vote counters from the vote table"
+    )
+    reconcile_parser.add_argument(
+        "--event-id", type=UUID, default=None, help="only rebuild this event"
+    )
+    reconcile_parser.set_defaults(handler=reconcile)
+
+    shards_parser = commands.add_parser(
+        "shard-stats", help="count the votes held by every vote shard"
+    )
+    shards_parser.set_defaults(handler=shard_stats)
+
+    migrate_parser = commands.add_parser(
+        "migrate-shards", help="move the votes of DATABASE_URL to the vote shards"
+    )
+    migrate_parser.add_argument(
+        "--chunk-size", type=int, default=5000, help="votes moved per transaction"
+    )
+    migrate_parser.set_defaults(handler=migrate_shards)
+
+    audit_parser = commands.add_parser(
+        "audit-indexes", help="flag service queries that scan a whole table"
+    )
+    audit_parser.set_defaults(handler=audit_indexes)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    create_all_tables()
+    vote_shards.create_all()
+    return args.handler(args)
@@ -1,5 +1,7 @@
 """Configuration settings for the VoteApp application."""
 
+from typing import Literal, Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,14 +13,89 @@ class Config(BaseSettings):
     )
 
     DATABASE_URL: str = "sqlite:///./storage/app.db"
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: bool = False
+    THREADPOOL_SIZE: int = 40
+    ASYNC_DATABASE: bool = False
+    ASYNC_DATABASE_URL: Optional[str] = None
+    VOTE_SHARDS: int = 0
+    VOTE_SHARD_URL_TEMPLATE: str = "sqlite:///./storage/votes_{shard}.db"
+
+    SQLITE_JOURNAL_MODE: Optional[str] = "WAL"
+    SQLITE_SYNCHRONOUS: Optional[str] = "NORMAL"
+    SQLITE_CACHE_SIZE: Optional[int] = -64000
+    SQLITE_MMAP_SIZE: Optional[int] = 268435456
+    SQLITE_TEMP_STORE: Optional[str] = "MEMORY"
+    SQLITE_BUSY_TIMEOUT_MS: Optional[int] = 5000
     SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     ALGORITHM: str = "HS256"
+    AUTH_STATELESS: bool = False
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 60.0
+    HASH_POOL_WORKERS: int = 2
+    HASH_POOL_MAX_PENDING: int = 32
+    HASH_POOL_RETRY_AFTER_SECONDS: int = 1
+    LOGIN_RATE_LIMIT: int = 0
+    LOGIN_RATE_WINDOW_SECONDS: int = 60
     FRONTEND_HOST: str
 
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 1
+    SERVER_LOOP: Literal["auto", "asyncio", "uvloop"] = "auto"
+    SERVER_HTTP: Literal["auto", "h11", "httptools"] = "auto"
+    SERVER_KEEPALIVE_SECONDS: int = 5
+    SERVER_BACKLOG: int = 2048
+    SERVER_LIMIT_CONCURRENCY: Optional[int] = None
+    SERVER_GRACEFUL_SHUTDOWN_SECONDS: Optional[int] = 30
+    SERVER_ACCESS_LOG: bool = True
+    SERVER_FORWARDED_ALLOW_IPS: str = "127.0.0.1"
+    FAST_JSON: bool = False
+
+    METRICS_ENABLED: bool = True
+    HEALTH_MAX_DB_LATENCY_MS: float = 250.0
+    HEALTH_MAX_POOL_USAGE: float = 0.9
+    HEALTH_MAX_WAL_BYTES: int = 268435456
+    HEALTH_MAX_COMMIT_MS: float = 1000.0
+    HEALTH_COMMIT_WINDOW_SECONDS: float = 60.0
+
+    SQL_PROFILE_ENABLED: bool = False
+    SQL_PROFILE_N_PLUS_ONE: int = 5
+    SQL_PROFILE_HISTORY: int = 200
+    SQL_PROFILE_DIR: Optional[str] = None
+    SQL_PROFILE_SLOW_MS: float = 500.0
+
     APP_NAME: str = "VoteApp"
     APP_VERSION: str
     APP_DESCRIPTION: str = "Simple app to vote"
 
+    SHARED_STATE_URL: str = "memory://"
+    SHARED_STATE_MAX_KEYS: int = 100000
+    RESULTS_CACHE_TTL_SECONDS: float = 300.0
+    STREAM_TICK_MS: int = 500
+    STREAM_HEARTBEAT_SECONDS: float = 15.0
+    WS_PING_SECONDS: float = 20.0
+    WS_SEND_TIMEOUT_SECONDS: float = 5.0
+
+    CATALOG_CACHE_SIZE: int = 10000
+    EVENT_BULK_MAX: int = 1000
+    EVENT_PAGE_MAX: int = 100
+    HTTP_CACHE_SIZE: int = 10000
+    EVENT_INFO_MAX_AGE_SECONDS: int = 60
+    RESULTS_FINAL_GRACE_SECONDS: float = 60.0
+    VOTE_EXPORT_CHUNK_SIZE: int = 5000
+    EXPIRY_SCHEDULER_ENABLED: bool = True
+    EXPIRY_RESCAN_SECONDS: float = 30.0
+
+    VOTE_WRITE_BEHIND: bool = False
+    VOTE_BATCH_SIZE: int = 500
+    VOTE_BATCH_INTERVAL_MS: int = 5
+    VOTE_WRITE_TIMEOUT_SECONDS: float = 10.0
+
 
 config = Config()
@@ -1,3 +1,16 @@
-from .database import SessionDep, close_db, create_all_tables
+from .async_database import AsyncSessionDep, async_engine, close_async_db
+from .database import SessionDep, build_engine, close_db, create_all_tables, engine
+from .shards import ShardRouter, vote_shards
 
-__all__ = ["create_all_tables", "close_db", "SessionDep"]
+__all__ = [
+    "create_all_tables",
+    "close_db",
+    "close_async_db",
+    "build_engine",
+    "SessionDep",
+    "AsyncSessionDep",
+    "engine",
+    "async_engine",
+    "ShardRouter",
+    "vote_shards",
+]
@@ -0,0 +1,103 @@
+"""
+Async database setup and session management.
+
+- Builds an `AsyncEngine` from `Config` when `ASYNC_DATABASE` is enabled.
+- Provides an async generator dependency to yield `AsyncSession` objects.
+
+The async URL comes from `ASYNC_DATABASE_URL`, or is derived from `DATABASE_URL` by
+swapping in an async driver (`aiosqlite` for SQLite, `asyncpg` for PostgreSQL).
+Pool settings and SQLite pragmas are shared with the sync engine.
+
+In-memory SQLite (`sqlite://`) is rejected: each engine would get its own private
+database, and the tables, votes and background writers of the sync engine would not
+be seen by the async routes. Use a file-backed SQLite database instead.
+"""
+
+from typing import Annotated, AsyncGenerator, Optional
+
+from fastapi import Depends
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config import config
+from app.utils.metrics import TimedAsyncAdaptedQueuePool
+
+from .database import apply_sqlite_pragmas, engine_options, sqlite_pragmas
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+
+def async_database_url(database_url: Optional[str] = None) -> URL:
+    """
+    Resolve the async database URL.
+
+    Args:
+        database_url (Optional[str]): Explicit URL, defaults to the configured one.
+
+    Returns:
+        URL: The URL with an async driver.
+    """
+    if database_url or config.ASYNC_DATABASE_URL:
+        return make_url(database_url or config.ASYNC_DATABASE_URL)
+
+    url = make_url(config.DATABASE_URL)
+    return url.set(drivername=ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername))
+
+
+def build_async_engine(database_url: Optional[str] = None) -> AsyncEngine:
+    """
+    Create an async engine with the pool settings from `Config`.
+
+    Args:
+        database_url (Optional[str]): Async database URL, defaults to `async_database_url()`.
+
+    Returns:
+        AsyncEngine: The configured SQLAlchemy async engine.
+
+    Raises:
+        RuntimeError: If the URL is an in-memory SQLite database.
+    """
+    url = async_database_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        raise RuntimeError(
+            "ASYNC_DATABASE needs a file-backed database: in-memory SQLite gives the "
+            "async engine a separate, empty database from DATABASE_URL"
+        )
+
+    async_engine = create_async_engine(
+        url, **engine_options(url, queue_pool=TimedAsyncAdaptedQueuePool)
+    )
+
+    if url.get_backend_name() == "sqlite":
+        apply_sqlite_pragmas(async_engine.sync_engine, sqlite_pragmas())
+
+    return async_engine
+
+
+async_engine: Optional[AsyncEngine] = (
+    build_async_engine() if config.ASYNC_DATABASE else None
+)
+
+
+async def close_async_db() -> None:
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides an async database session.
+
+    Yields:
+        AsyncSession: A SQLModel async session for database operations.
+    """
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_db)]
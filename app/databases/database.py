@@ -1,25 +1,181 @@
 """
-Database setup and session management for SQLite.
+Database setup and session management.
 
-- Configures the database engine using `sqlite` driver.
+- Builds the database engine from `Config` through `build_engine`.
 - Creates a sessionmaker for ORM operations.
 - Provides a generator dependency to yield database sessions.
 
-The `DATABASE_URL` variable controls the SQLite file location.
+The `DATABASE_URL` setting controls the database location. File-backed SQLite and
+server databases get a sized `QueuePool`, while in-memory SQLite (`sqlite://`) shares
+one connection through a `StaticPool` so tests see a single database.
+
+SQLite connections get the pragma profile from `sqlite_pragmas` (WAL journal,
+synchronous level, cache, mmap, temp store and busy timeout) applied on connect.
+
+`create_all_tables` fills a newly created `vote_count` table from the votes already
+cast, so upgrading a database that predates the counters keeps its results.
 """
 
-from typing import Annotated, Generator
+from typing import Annotated, Any, Dict, Generator, Optional, Type
 
 from fastapi import Depends
+from sqlalchemy import Engine, event, func, insert, inspect, select
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.pool import Pool, StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
-DATABASE_URL = f"sqlite:///./storage/app.db"
-engine = create_engine(DATABASE_URL)
+from app.config import config
+from app.models import Vote, VoteCount
+from app.utils.metrics import TimedQueuePool
+
+
+def sqlite_pragmas() -> Dict[str, Any]:
+    """
+    Build the SQLite pragma profile from `Config`.
+
+    `busy_timeout` comes first so the journal mode switch can wait on other connections.
+    A `None` value leaves that pragma at the SQLite default.
+
+    Returns:
+        Dict[str, Any]: Pragma names mapped to their values.
+    """
+    return {
+        "busy_timeout": config.SQLITE_BUSY_TIMEOUT_MS,
+        "journal_mode": config.SQLITE_JOURNAL_MODE,
+        "synchronous": config.SQLITE_SYNCHRONOUS,
+        "cache_size": config.SQLITE_CACHE_SIZE,
+        "mmap_size": config.SQLITE_MMAP_SIZE,
+        "temp_store": config.SQLITE_TEMP_STORE,
+    }
+
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: Dict[str, Any]) -> None:
+    """
+    Register a connect hook that applies the pragmas to every new DBAPI connection.
+
+    Args:
+        engine (Engine)          : The SQLite engine to configure.
+        pragmas (Dict[str, Any]) : Pragma names mapped to their values.
+    """
+    statements = [
+        f"PRAGMA {name}={value}" for name, value in pragmas.items() if value is not None
+    ]
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def engine_options(url: URL, queue_pool: Type[Pool] = TimedQueuePool) -> Dict[str, Any]:
+    """
+    Build the `create_engine` keyword arguments for a database URL from `Config`.
+
+    Args:
+        url (URL)              : Parsed database URL.
+        queue_pool (Type[Pool]): Pool class for file-backed and server databases,
+                                 timed so checkout waits show up in `/metrics`.
+
+    Returns:
+        Dict[str, Any]: Engine keyword arguments.
+    """
+    pool_size = config.DB_POOL_SIZE or config.THREADPOOL_SIZE
+
+    options: Dict[str, Any] = {"echo": config.DB_ECHO}
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+
+        if url.database in (None, "", ":memory:"):
+            options["poolclass"] = StaticPool
+        else:
+            options.update(
+                poolclass=queue_pool,
+                pool_size=pool_size,
+                max_overflow=config.DB_MAX_OVERFLOW,
+                pool_timeout=config.DB_POOL_TIMEOUT,
+            )
+    else:
+        options.update(
+            poolclass=queue_pool,
+            pool_size=pool_size,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_timeout=config.DB_POOL_TIMEOUT,
+            pool_recycle=config.DB_POOL_RECYCLE,
+            pool_pre_ping=config.DB_POOL_PRE_PING,
+        )
+
+    return options
+
+
+def build_engine(
+    database_url: Optional[str] = None,
+    pragmas: Optional[Dict[str, Any]] = None,
+    **overrides: Any,
+) -> Engine:
+    """
+    Create an engine with the pool settings from `Config`.
+
+    Args:
+        database_url (Optional[str])      : Database URL, defaults to `config.DATABASE_URL`.
+        pragmas (Optional[Dict[str, Any]]): SQLite pragmas, defaults to `sqlite_pragmas()`.
+        **overrides (Any)                 : Extra keyword arguments passed to `create_engine`.
+
+    Returns:
+        Engine: The configured SQLAlchemy engine.
+    """
+    url = make_url(database_url or config.DATABASE_URL)
+
+    options = engine_options(url)
+    options.update(overrides)
+    engine = create_engine(url, **options)
+
+    if url.get_backend_name() == "sqlite":
+        apply_sqlite_pragmas(engine, sqlite_pragmas() if pragmas is None else pragmas)
+
+    return engine
+
+
+engine = build_engine()
 
 
 def create_all_tables() -> None:
+    backfill_counts = not inspect(engine).has_table(VoteCount.__tablename__)
     SQLModel.metadata.create_all(engine)
 
+    # create_all skips existing tables, so indexes added to a model later are created here.
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+    if backfill_counts:
+        backfill_vote_counts(engine)
+
+
+def backfill_vote_counts(target: Engine) -> int:
+    """
+    Count the votes of every choice into an empty `vote_count` table.
+
+    Args:
+        target (Engine): Engine whose `vote` table is counted into its `vote_count`.
+
+    Returns:
+        int: The number of counter rows written.
+    """
+    count_statment = select(
+        Vote.choice_id, Vote.event_id, func.count(Vote.id)
+    ).group_by(Vote.choice_id, Vote.event_id)
+    with target.begin() as connection:
+        result = connection.execute(
+            insert(VoteCount).from_select(
+                ["choice_id", "event_id", "count"], count_statment
+            )
+        )
+    return result.rowcount
+
 
 def close_db() -> None:
     engine.dispose()
@@ -0,0 +1,194 @@
+"""
+Vote storage split by event across several databases.
+
+SQLite allows one writer per file, so with every vote in `DATABASE_URL` the inserts
+of all events queue on a single write lock. With `VOTE_SHARDS` set, the `vote` and
+`vote_count` tables of an event live in shard `event_id.int % VOTE_SHARDS`, a database
+built from `VOTE_SHARD_URL_TEMPLATE` with its own engine and pool, so votes on events
+of different shards are written concurrently. Users, events and choices stay in
+`DATABASE_URL`; a vote is checked against the catalog cache before it reaches its
+shard, and the foreign keys of the shard tables are not enforced (SQLite leaves
+`foreign_keys` off).
+
+Lazy `Event.votes`, `Users.votes` and `Choice.votes` relationships read the main
+database and do not see sharded votes.
+
+Votes cast before `VOTE_SHARDS` was set stay in `DATABASE_URL` until
+`manage migrate-shards` moves them; the app refuses to start while any are left, as
+the router would never read them.
+
+Classes:
+- ShardRouter: Engines of the vote shards and the event to shard mapping.
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Engine
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session, SQLModel, delete, select
+
+from app.config import config
+from app.models import Vote, VoteCount
+
+from .database import build_engine, engine
+
+T = TypeVar("T")
+
+SHARDED_TABLES = [Vote.__table__, VoteCount.__table__]
+INSERT_DIALECTS = {"sqlite": sqlite_insert, "postgresql": pg_insert}
+
+
+class ShardRouter:
+
+    def __init__(self, urls: List[str], default: Engine):
+        self.urls = urls
+        self.default = default
+        self.engines = [build_engine(url) for url in urls]
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.engines)
+
+    def shard_of(self, event_id: UUID) -> int:
+        """Shard number of an event; uuid4 ids spread evenly over the shards."""
+        return event_id.int % len(self.engines)
+
+    def engine_for(self, event_id: UUID) -> Engine:
+        """Engine holding the votes of an event, the default one when not sharded."""
+        if not self.enabled:
+            return self.default
+        return self.engines[self.shard_of(event_id)]
+
+    @contextmanager
+    def vote_session(self, session: Session, event_id: UUID) -> Iterator[Session]:
+        """
+        Session on the shard of an event, or the caller's session when not sharded.
+
+        Args:
+            session (Session): The caller's session on the main database.
+            event_id (UUID)  : ID of the event whose votes are read or written.
+
+        Yields:
+            Session: A session owning the event's `vote` and `vote_count` rows.
+        """
+        if not self.enabled:
+            yield session
+            return
+
+        with Session(self.engine_for(event_id)) as shard_session:
+            yield shard_session
+
+    def scatter(self, session: Session, call: Callable[[Session], T]) -> List[T]:
+        """
+        Run a query on every shard, one after the other.
+
+        Args:
+            session (Session)            : The caller's session, used when not sharded.
+            call (Callable[[Session], T]): Query to run with a session on one shard.
+
+        Returns:
+            List[T]: The result of every shard in shard order.
+        """
+        if not self.enabled:
+            return [call(session)]
+
+        results = []
+        for shard_engine in self.engines:
+            with Session(shard_engine) as shard_session:
+                results.append(call(shard_session))
+        return results
+
+    def create_all(self) -> None:
+        """Create the vote tables and their indexes on every shard."""
+        for shard_engine in self.engines:
+            SQLModel.metadata.create_all(shard_engine, tables=SHARDED_TABLES)
+            for table in SHARDED_TABLES:
+                for index in table.indexes:
+                    index.create(shard_engine, checkfirst=True)
+
+    def has_unsharded_votes(self) -> bool:
+        """Whether sharding is on while votes are left in the main database."""
+        if not self.enabled:
+            return False
+
+        with Session(self.default) as session:
+            return session.exec(select(Vote.id).limit(1)).first() is not None
+
+    def require_migrated(self) -> None:
+        """
+        Refuse to run sharded while votes are left in the main database.
+
+        Raises:
+            RuntimeError: If the main database still holds votes.
+        """
+        if self.has_unsharded_votes():
+            raise RuntimeError(
+                "VOTE_SHARDS is set but DATABASE_URL still holds votes the shards "
+                "never read; run `manage migrate-shards` first"
+            )
+
+    def migrate(self, chunk_size: int = 5000) -> int:
+        """
+        Move the votes of the main database to their shards, in id order.
+
+        Every chunk is committed on its shards before it is deleted from the main
+        database, and votes already on a shard are skipped, so an interrupted
+        migration is resumed by running it again. Counters of the main database are
+        dropped; rebuild them on the shards afterwards.
+
+        Args:
+            chunk_size (int): Votes moved per transaction.
+
+        Returns:
+            int: The number of votes moved.
+        """
+        if not self.enabled:
+            return 0
+
+        moved = 0
+        with Session(self.default) as session:
+            while True:
+                votes = session.exec(
+                    select(Vote).order_by(Vote.id).limit(chunk_size)
+                ).all()
+                if not votes:
+                    break
+
+                by_shard: Dict[int, List[dict]] = defaultdict(list)
+                for vote in votes:
+                    by_shard[self.shard_of(vote.event_id)].append(vote.model_dump())
+
+                for shard, rows in by_shard.items():
+                    shard_engine = self.engines[shard]
+                    insert = INSERT_DIALECTS[shard_engine.dialect.name]
+                    with Session(shard_engine) as shard_session:
+                        shard_session.execute(
+                            insert(Vote).on_conflict_do_nothing(), rows
+                        )
+                        shard_session.commit()
+
+                session.exec(delete(Vote).where(Vote.id <= votes[-1].id))
+                session.commit()
+                moved += len(votes)
+
+            session.exec(delete(VoteCount))
+            session.commit()
+
+        return moved
+
+    def dispose(self) -> None:
+        for shard_engine in self.engines:
+            shard_engine.dispose()
+
+
+vote_shards = ShardRouter(
+    [
+        config.VOTE_SHARD_URL_TEMPLATE.format(shard=shard)
+        for shard in range(config.VOTE_SHARDS)
+    ],
+    engine,
+)
@@ -3,41 +3,80 @@ Main application module for the FastAPI RESTful API.
 
 - Sets up the FastAPI app with metadata (title, description, version).
 - Defines the lifespan event handler for app startup/shutdown database connections.
-- Includes API routers for users, event and health endpoints.
+- Includes API routers for users, event and health endpoints (async variants when enabled).
 - Configures CORS middleware to allow requests from the frontend host.
+- Records per-route latency and DB timing for `/metrics` when `METRICS_ENABLED`.
+- Profiles the SQL of every request when `SQL_PROFILE_ENABLED` (development only).
+- Answers with 503 when the password hashing queue is full.
 
-This serves as the entry point for running the API server.
+This serves as the entry point for running the API server:
+- run  : Development server with auto-reload on localhost (`poetry run start`).
+- serve: Production server configured from `Config` (`poetry run serve`).
 """
 
+import logging
 from contextlib import asynccontextmanager
 
 import uvicorn
-from fastapi import FastAPI
+from anyio import to_thread
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse
 
 from .config import config
-from .databases import close_db, create_all_tables
-from .routes import event_router, health_router, users_router
+from .databases import (
+    close_async_db,
+    close_db,
+    create_all_tables,
+    engine,
+    vote_shards,
+)
+from .routes import api_routers
+from .services import expiry_scheduler, vote_writer
+from .utils import (
+    HashPoolBusy,
+    default_response_class,
+    password_hasher,
+    shared_state,
+)
+from .utils.metrics import MetricsMiddleware
+from .utils.sql_profiler import SQLProfilerMiddleware, profile_endpoints, sql_profiler
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Sync routes each hold a pooled connection, so the pool is sized to this limit.
+    to_thread.current_default_thread_limiter().total_tokens = config.THREADPOOL_SIZE
     create_all_tables()
+    vote_shards.create_all()
+    vote_shards.require_migrated()
+    password_hasher.start()
+    if config.VOTE_WRITE_BEHIND:
+        vote_writer.start(engine)
+    if config.EXPIRY_SCHEDULER_ENABLED:
+        expiry_scheduler.start()
     yield
+    await expiry_scheduler.stop()
+    vote_writer.stop()
+    password_hasher.shutdown()
+    await close_async_db()
+    vote_shards.dispose()
     close_db()
+    shared_state.close()
 
 
 app = FastAPI(
     lifespan=lifespan,
+    default_response_class=default_response_class(),
     title=config.APP_NAME,
     version=config.APP_VERSION,
     description=config.APP_DESCRIPTION,
 )
 
-app.include_router(health_router)
-app.include_router(users_router)
-app.include_router(event_router)
+for router in api_routers():
+    app.include_router(router)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=config.FRONTEND_HOST,
@@ -45,6 +84,23 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if config.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+if config.SQL_PROFILE_ENABLED:
+    logger.warning("SQL_PROFILE_ENABLED is set, every statement is recorded")
+    sql_profiler.install()
+    app.add_middleware(SQLProfilerMiddleware)
+    if config.SQL_PROFILE_DIR:
+        profile_endpoints(app.routes)
+
+
+@app.exception_handler(HashPoolBusy)
+async def hash_pool_busy_handler(request: Request, exc: HashPoolBusy):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server is busy, please retry later"},
+        headers={"Retry-After": str(config.HASH_POOL_RETRY_AFTER_SECONDS)},
+    )
 
 
 @app.get("/", tags=["Root"], include_in_schema=False)
@@ -54,3 +110,38 @@ async def read_root():
 
 def run():
     uvicorn.run("app.main:app", host="localhost", port=8000, reload=True)
+
+
+def serve():
+    """
+    Run the production server with the `SERVER_*` settings.
+
+    Each of the `SERVER_WORKERS` processes gets its own event loop, database pool,
+    hashing pool and `THREADPOOL_SIZE` threads for the sync routes.
+
+    Several workers need a shared `SHARED_STATE_URL`: with `memory://` each worker
+    only sees its own vote versions, so cached tallies, 304s and the results stream
+    of the others would stay stale for up to `RESULTS_CACHE_TTL_SECONDS`.
+    """
+    if config.SERVER_WORKERS > 1 and not shared_state.shared:
+        raise SystemExit(
+            f"SERVER_WORKERS={config.SERVER_WORKERS} needs a shared SHARED_STATE_URL "
+            f"such as redis://, not {config.SHARED_STATE_URL}: vote versions, cached "
+            "results and rate limits are per process with it"
+        )
+
+    uvicorn.run(
+        "app.main:app",
+        host=config.SERVER_HOST,
+        port=config.SERVER_PORT,
+        workers=config.SERVER_WORKERS,
+        loop=config.SERVER_LOOP,
+        http=config.SERVER_HTTP,
+        timeout_keep_alive=config.SERVER_KEEPALIVE_SECONDS,
+        backlog=config.SERVER_BACKLOG,
+        limit_concurrency=config.SERVER_LIMIT_CONCURRENCY,
+        timeout_graceful_shutdown=config.SERVER_GRACEFUL_SHUTDOWN_SECONDS,
+        access_log=config.SERVER_ACCESS_LOG,
+        proxy_headers=True,
+        forwarded_allow_ips=config.SERVER_FORWARDED_ALLOW_IPS,
+    )
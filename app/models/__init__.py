@@ -1,6 +1,8 @@
 from .choice_model import Choice
 from .event_model import Event
+from .result_snapshot_model import ResultSnapshot
 from .users_model import Users
+from .vote_count_model import VoteCount
 from .vote_model import Vote
 
-__all__ = ["Users", "Event", "Choice", "Vote"]
+__all__ = ["Users", "Event", "Choice", "Vote", "VoteCount", "ResultSnapshot"]
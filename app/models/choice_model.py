@@ -7,7 +7,7 @@ This module defines the data model for a Choice, which is associated with an Eve
 import uuid
 from typing import List, Optional
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 
 class Choice(SQLModel, table=True):
@@ -22,6 +22,9 @@ class Choice(SQLModel, table=True):
     Relationships:
         event (Event)       : The event to which this choice belongs.
         votes (List[Vote])  : A list of vote associated with the event and user.
+
+    Indexes:
+        ix_choice_event_id_choice: Choice lookup by event and text when voting.
     """
 
     id: int = Field(default=None, primary_key=True)
@@ -31,3 +34,5 @@ class Choice(SQLModel, table=True):
 
     event: Optional["Event"] = Relationship(back_populates="choices")  # type: ignore
     votes: List["Vote"] = Relationship(back_populates="choice")  # type: ignore
+
+    __table_args__ = (Index("ix_choice_event_id_choice", "event_id", "choice"),)
@@ -8,7 +8,7 @@ import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 
 class Event(SQLModel, table=True):
@@ -26,6 +26,11 @@ class Event(SQLModel, table=True):
         creator (Users)         : The user who created the event.
         choices (List[Choice])  : A list of choices associated with the event.
         votes (List[Vote])      : A list of vote associated with the event and user.
+
+    Indexes:
+        ix_event_creator_id_id: Keyset pages of the events of one creator.
+        ix_event_expires_at_id: Keyset pages of the active, expired and `expires_at`
+                                range filters, ordered by (expires_at, id).
     """
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
@@ -40,3 +45,8 @@ class Event(SQLModel, table=True):
     creator: Optional["Users"] = Relationship(back_populates="events")  # type: ignore
     choices: List["Choice"] = Relationship(back_populates="event")  # type: ignore
     votes: List["Vote"] = Relationship(back_populates="event")  # type: ignore
+
+    __table_args__ = (
+        Index("ix_event_creator_id_id", "creator_id", "id"),
+        Index("ix_event_expires_at_id", "expires_at", "id"),
+    )
@@ -0,0 +1,33 @@
+"""
+SQLModel to represent ResultSnapshot entity.
+
+This module are used for data modeling of the frozen final results of closed events.
+"""
+
+import uuid
+from datetime import datetime
+from typing import List
+
+from sqlmodel import JSON, Column, Field, SQLModel
+
+
+class ResultSnapshot(SQLModel, table=True):
+    """
+    SQLModel representing the ResultSnapshot entity.
+
+    Written once by the expiry scheduler when an event closes and never updated, so
+    every later read of the event's results is a primary key lookup.
+
+    Attributes:
+        event_id (UUID)     : The primary key and foreign key linking to the closed event.
+        results (List[List]): The final `[choice, votes]` pairs in choice creation order.
+        total_votes (int)   : The number of votes cast on the event.
+        frozen_at (datetime): When the results were frozen.
+    """
+
+    __tablename__ = "result_snapshot"
+
+    event_id: uuid.UUID = Field(foreign_key="event.id", primary_key=True)
+    results: List[List] = Field(sa_column=Column(JSON, nullable=False))
+    total_votes: int = Field(nullable=False)
+    frozen_at: datetime = Field(default_factory=datetime.now, nullable=False)
@@ -0,0 +1,29 @@
+"""
+SQLModel to represent VoteCount entity.
+
+This module are used for data modeling of the materialized per-choice vote counters.
+"""
+
+import uuid
+
+from sqlmodel import Field, SQLModel
+
+
+class VoteCount(SQLModel, table=True):
+    """
+    SQLModel representing the VoteCount entity.
+
+    One row is kept per Choice and bumped in the same transaction as the Vote insert,
+    so reading the results of an event never has to aggregate the vote table.
+
+    Attributes:
+        choice_id (int) : The primary key and foreign key linking to the counted choice.
+        event_id (UUID) : The foreign key linking to the associated event.
+        count (int)     : The number of votes cast on the choice.
+    """
+
+    __tablename__ = "vote_count"
+
+    choice_id: int = Field(foreign_key="choice.id", primary_key=True)
+    event_id: uuid.UUID = Field(foreign_key="event.id", index=True, nullable=False)
+    count: int = Field(default=0, nullable=False)
@@ -8,7 +8,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlmodel import Field, Relationship, SQLModel, UniqueConstraint, func
+from sqlmodel import Field, Index, Relationship, SQLModel, UniqueConstraint, func
 
 
 class Vote(SQLModel, table=True):
@@ -28,6 +28,11 @@ class Vote(SQLModel, table=True):
         event (Event)   : A list of vote associated with the event and user.
 
     Constraints: A user can vote only once per event.
+
+    Indexes:
+        ix_vote_event_id_choice_id: Per-event and per-choice aggregates of an event.
+        ix_vote_event_id_id       : Keyset walk of the votes of an event in id order.
+        ix_vote_choice_id         : Per-choice lookups across events.
     """
 
     id: int = Field(default=None, primary_key=True)
@@ -45,4 +50,9 @@ class Vote(SQLModel, table=True):
     choice: Optional["Choice"] = Relationship(back_populates="votes")  # type: ignore
     event: Optional["Event"] = Relationship(back_populates="votes")  # type: ignore
 
-    __table_args__ = (UniqueConstraint("user_id", "event_id", name="uix_user_event"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "event_id", name="uix_user_event"),
+        Index("ix_vote_event_id_choice_id", "event_id", "choice_id"),
+        Index("ix_vote_event_id_id", "event_id", "id"),
+        Index("ix_vote_choice_id", "choice_id"),
+    )
@@ -1,9 +1,61 @@
+from typing import List
+
+from fastapi import APIRouter
+
+from app.config import config
+
+from .async_event_route import router as async_event_router
+from .async_users_route import router as async_users_router
+from .debug_route import router as debug_router
 from .event_route import router as event_router
 from .health_route import router as health_router
+from .metrics_route import router as metrics_router
 from .users_route import router as users_router
+from .ws_route import router as ws_router
+
+
+def api_routers() -> List[APIRouter]:
+    """
+    Routers to mount on the app.
+
+    With `ASYNC_DATABASE` enabled the async routes replace their sync twins, and the
+    sync routes that have no async version are still served.
+    """
+    routers = [health_router, users_router, event_router, ws_router]
+    if config.METRICS_ENABLED:
+        routers.append(metrics_router)
+    if config.SQL_PROFILE_ENABLED:
+        routers.append(debug_router)
+    if not config.ASYNC_DATABASE:
+        return routers
+
+    replacements = [async_users_router, async_event_router]
+    replaced = {
+        (route.path, frozenset(route.methods))
+        for router in replacements
+        for route in router.routes
+    }
+
+    remaining = APIRouter()
+    for router in routers:
+        remaining.routes.extend(
+            route
+            for route in router.routes
+            if (route.path, frozenset(getattr(route, "methods", None) or ()))
+            not in replaced
+        )
+
+    return [*replacements, remaining]
+
 
 __all__ = [
+    "api_routers",
     "health_router",
+    "metrics_router",
+    "debug_router",
     "users_router",
     "event_router",
+    "ws_router",
+    "async_users_router",
+    "async_event_router",
 ]
@@ -0,0 +1,167 @@
+"""
+Async API routes for managing event resources.
+
+Served instead of the matching routes in `event_route` when `ASYNC_DATABASE` is
+enabled, so these requests run on the event loop without taking a threadpool slot.
+
+Features:
+- Standard HTTP status codes and error handling.
+
+Endpoints:
+- POST /events                  : Create a new event.
+- POST /vote/{event_id}/{choice}: Create a new vote on event.
+- GET  /event/{event_id}        : Retrieve event info.
+"""
+
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Header, HTTPException
+
+from app.databases import AsyncSessionDep
+from app.schemas import EventCreate, EventInfo, Feedback
+from app.services import AsyncEventService
+from app.utils import (
+    conditional_response,
+    encode_response,
+    feedback_response,
+    info_cache_control,
+    response_cache,
+)
+
+from .deps import AsyncCurrentUserDep
+
+router = APIRouter(tags=["Events"])
+
+
+# POST -------------------------------------------------------------------------
+@router.post(
+    "/events/",
+    status_code=201,
+    response_model=Feedback,
+    summary="creates a new Event",
+    description="Allows an authenticated user to create vote with 2-4 choices",
+)
+async def create_event(
+    session: AsyncSessionDep, user: AsyncCurrentUserDep, event_data: EventCreate
+):
+    """
+    Endpoint to create a new voting event.
+
+    Args:
+        session (AsyncSessionDep) : Async database session dependency.
+        user (AsyncCurrentUserDep): The currently authenticated user from the JWT token.
+        event_data (EventCreate)  : Data for the event to be created.
+
+    Raises:
+        HTTPException: 400 Bad Request if event creation fails.
+    """
+
+    if await AsyncEventService.create_event(session, user.id, event_data):
+        return feedback_response("Successfully create event", status_code=201)
+
+    raise HTTPException(
+        status_code=400,
+        detail="Failed to create event, choices must be between 2 and 4!",
+    )
+
+
+@router.post(
+    "/vote/{event_id}/{choice}",
+    response_model=Feedback,
+    summary="vote on an Event",
+    description="Allows an authenticated user to vote on a specific choice for a given event.",
+)
+async def user_votes(
+    session: AsyncSessionDep, user: AsyncCurrentUserDep, event_id: str, choice: str
+):
+    """
+    Endpoint to votes the event.
+
+    Args:
+        session (AsyncSessionDep) : Async database session dependency.
+        user (AsyncCurrentUserDep): The currently authenticated user from the JWT token.
+        event_id (str)            : UUID of the event (as a string path parameter).
+        choice (str)              : The choice text selected by the user.
+
+    Raises HTTPException:
+        - 422: If the event ID is not a valid UUID.
+        - 404: If the event or choice is not found.
+        - 403: If the event's voting period has expired.
+        - 409: If the user has already voted in the event.
+        - 504: If the vote timed out while being written and may still be recorded.
+        - 400: For other unexpected errors.
+    """
+
+    try:
+        event_id = UUID(event_id)
+    except ValueError:
+        raise HTTPException(status_code=422, detail="Invalid event UUID")
+
+    success, message = await AsyncEventService.create_vote(
+        session, user.id, event_id, choice
+    )
+
+    if success:
+        return feedback_response(message)
+
+    error_status_map = {
+        "Event not found.": 404,
+        "The selected choice does not exist for this event.": 404,
+        "Voting for this event has ended.": 403,
+        "You have already voted in this event.": 409,
+        "Your vote may still be recorded.": 504,
+    }
+
+    status_code = error_status_map.get(message, 400)
+    raise HTTPException(status_code=status_code, detail=message)
+
+
+# GET -------------------------------------------------------------------------
+@router.get(
+    "/event/{event_id}",
+    response_model=EventInfo,
+    summary="retrieve event info",
+    description="Allows user to get event information based on given UUID.",
+)
+async def get_event(
+    session: AsyncSessionDep,
+    event_id: str,
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    Endpoint to retrieve event info.
+
+    Answers from the encoded `response_cache` when possible, with 304 Not Modified if
+    the client's `If-None-Match` is current.
+
+    Args:
+        session (AsyncSessionDep)    : Async database session dependency.
+        event_id (str)               : UUID of the event (as a string path parameter).
+        if_none_match (Optional[str]): ETag of the client's cached copy.
+
+    Raises
+        HTTPException: 404 Not Found If the event is not found.
+    """
+    try:
+        event_id = UUID(event_id)
+    except ValueError:
+        raise HTTPException(status_code=422, detail="Invalid event UUID")
+
+    encoded = response_cache.get(("info", event_id))
+    if encoded is None:
+        result = await AsyncEventService.get_catalog_entry(session, event_id)
+        if not result:
+            raise HTTPException(status_code=404, detail="Event not found.")
+
+        encoded = encode_response(
+            EventInfo(
+                title=result.title, desc=result.desc, expires_at=result.expires_at
+            ),
+            result.expires_at,
+        )
+        response_cache.set(("info", event_id), encoded)
+
+    return conditional_response(
+        encoded, if_none_match, info_cache_control(encoded.expires_at)
+    )
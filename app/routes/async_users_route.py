@@ -0,0 +1,76 @@
+"""
+Async API route for managing users resources.
+
+Served instead of the matching routes in `users_route` when `ASYNC_DATABASE` is
+enabled, so these requests run on the event loop without taking a threadpool slot.
+
+Features:
+- Standard HTTP status codes and error handling.
+
+Endpoints:
+- POST /users/     : Register a new user account.
+- POST /users/login: Log in a user and return an access token.
+"""
+
+from fastapi import APIRouter, HTTPException
+
+from app.databases import AsyncSessionDep
+from app.schemas import Feedback, TokenSchema, UserCreate
+from app.services import AsyncUserService
+from app.utils import feedback_response, model_response
+
+from .deps import LoginFormDep
+
+router = APIRouter(tags=["Users"])
+
+
+# POST -------------------------------------------------------------------------
+@router.post(
+    "/users/",
+    status_code=201,
+    response_model=Feedback,
+    summary="creates a new User",
+    description="Allows user to create an account to access the service",
+)
+async def register_user(session: AsyncSessionDep, user_data: UserCreate):
+    """
+    Endpoint to create a new user.
+
+    Args:
+        session (AsyncSessionDep): Async database session dependency.
+        user_data (UserCreate)   : User data for registration.
+
+    Raises:
+        HTTPException: HTTP 400 Bad Request if user registration fails.
+    """
+    if await AsyncUserService.create_user(session, user_data):
+        return feedback_response("Successfully registered user", status_code=201)
+
+    raise HTTPException(
+        status_code=400,
+        detail="User registration failed, email or username already exists",
+    )
+
+
+@router.post(
+    "/users/login",
+    response_model=TokenSchema,
+    summary="login user",
+    description="Allows an user to login and get jwt token in return",
+)
+async def login_user(session: AsyncSessionDep, user_data: LoginFormDep):
+    """
+    Endpoint to log in a user and return an access token.
+
+    Args:
+        session (AsyncSessionDep)            : Async database session dependency.
+        user_data (OAuth2PasswordRequestForm): User data for login.
+
+    Raises:
+        HTTPException: HTTP 400 Bad Request if login fails, 429 when rate limited.
+    """
+    token = await AsyncUserService.login_user(session, user_data)
+    if not token:
+        raise HTTPException(status_code=400, detail="Invalid username or password")
+
+    return model_response(TokenSchema(access_token=token, token_type="bearer"))
@@ -0,0 +1,41 @@
+"""
+Debug API route for the SQL profiler.
+
+Only mounted with `SQL_PROFILE_ENABLED`, which is meant for development.
+
+Endpoints:
+- GET /debug/sql-profiles   : Latest request profiles, newest first.
+- DELETE /debug/sql-profiles: Forget the kept profiles.
+"""
+
+from typing import List
+
+from fastapi import APIRouter, Query
+
+from app.schemas import Feedback, RequestProfile
+from app.utils.sql_profiler import sql_profiler
+
+router = APIRouter(tags=["Debug"])
+
+
+@router.get("/debug/sql-profiles", response_model=List[RequestProfile])
+def sql_profiles(
+    limit: int = Query(50, ge=1, le=1000), n_plus_one: bool = Query(False)
+):
+    """
+    Endpoint to list the SQL profiles of recent requests.
+
+    Args:
+        limit (int)      : Number of profiles to return.
+        n_plus_one (bool): Only return requests with suspected N+1 queries.
+    """
+    return sql_profiler.recent(limit, n_plus_one)
+
+
+@router.delete("/debug/sql-profiles", response_model=Feedback)
+def clear_sql_profiles():
+    """
+    Endpoint to forget the kept profiles.
+    """
+    sql_profiler.clear()
+    return Feedback(detail="Profiles cleared")
@@ -5,30 +5,61 @@ Provides a dependency for JWT token validation.
 
 Features:
 - Uses standard HTTP status codes and consistent error handling.
+- Verified principals are cached by user ID, so most requests skip the user lookup.
+- With `AUTH_STATELESS` the principal is built from the token claims alone.
+- Login attempts are rate limited per username across workers through `shared_state`.
 
 Functions:
-- get_current_user: Validates JWT tokens and retrieves the authenticated user.
+- decode_token           : Validates a JWT token and returns the user ID it was issued for.
+- get_current_user       : Validates JWT tokens and retrieves the authenticated user.
+- get_current_user_async : Same as `get_current_user` on the async request path.
+- resolve_principal      : Returns the principal of a user ID, from the cache when possible.
+- resolve_principal_async: Same as `resolve_principal` with an async session.
+- authenticate_token     : Resolves a token outside of a request, e.g. for websockets.
+- limit_login            : Rejects login attempts over `LOGIN_RATE_LIMIT`.
 """
 
-from typing import Annotated
+from typing import Annotated, Optional
 from uuid import UUID
 
 import jwt
 from fastapi import Depends, HTTPException
-from fastapi.security import OAuth2PasswordBearer
+from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from pydantic import ValidationError
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.config import config
-from app.databases import SessionDep
+from app.databases import AsyncSessionDep, SessionDep, engine
 from app.models import Users
-from app.schemas import TokenPayload
-from app.services import UserService
+from app.schemas import Principal, TokenPayload
+from app.services import AsyncUserService, UserService
+from app.utils import login_rate_limiter, principal_cache
 
 reusable_oauth2 = OAuth2PasswordBearer(tokenUrl=f"users/login")
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 
-def get_current_user(session: SessionDep, token: TokenDep) -> Users:
+def decode_token(token: str) -> UUID:
+    """
+    Checks the validity of a JWT token and returns the user ID it was issued for.
+
+    Args:
+        token (str): Encoded JWT token.
+
+    Raises:
+        HTTPException: 403 Forbidden if the token is invalid.
+    """
+
+    try:
+        payload = jwt.decode(token, config.SECRET_KEY, algorithms=[config.ALGORITHM])
+        token_data = TokenPayload(**payload)
+        return UUID(token_data.sub)
+    except (jwt.InvalidTokenError, ValidationError, TypeError, ValueError):
+        raise HTTPException(status_code=403, detail="Could not validate credentials")
+
+
+def get_current_user(session: SessionDep, token: TokenDep) -> Principal:
     """
     Checks the validity of a JWT token and retrieves the associated user.
 
@@ -42,17 +73,128 @@ def get_current_user(session: SessionDep, token: TokenDep) -> Users:
         - 403 Forbidden if the token is invalid.
     """
 
-    try:
-        payload = jwt.decode(token, config.SECRET_KEY, algorithms=[config.ALGORITHM])
-        token_data = TokenPayload(**payload)
-    except (jwt.InvalidTokenError, ValidationError):
-        raise HTTPException(status_code=403, detail="Could not validate credentials")
+    return resolve_principal(session, decode_token(token))
+
+
+async def get_current_user_async(
+    session: AsyncSessionDep, token: TokenDep
+) -> Principal:
+    """
+    Checks the validity of a JWT token and retrieves the associated user asynchronously.
+
+    Args:
+        session (AsyncSessionDep): Async database session dependency.
+        token (TokenDep): JWT token dependency.
+
+    Raises:
+        HTTPException:
+        - 404 Not Found if the user does not exist.
+        - 403 Forbidden if the token is invalid.
+    """
+
+    return await resolve_principal_async(session, decode_token(token))
+
+
+def resolve_principal(session: Session, user_id: UUID) -> Principal:
+    """
+    Returns the principal of a verified user ID.
+
+    Args:
+        session (Session): Database session, only used on a principal cache miss.
+        user_id (UUID)   : ID from a verified token.
+
+    Raises:
+        HTTPException: 404 Not Found if the user does not exist.
+    """
 
-    user_id = UUID(token_data.sub)
-    user = UserService.get_user_by_id(session, user_id)
+    principal = _known_principal(user_id)
+    if principal is None:
+        user = UserService.get_user_by_id(session, user_id)
+        principal = _cache_principal(user_id, user)
+    return principal
+
+
+async def resolve_principal_async(session: AsyncSession, user_id: UUID) -> Principal:
+    """
+    Returns the principal of a verified user ID, looking it up on an async session.
+
+    Args:
+        session (AsyncSession): Async database session, only used on a cache miss.
+        user_id (UUID)        : ID from a verified token.
+
+    Raises:
+        HTTPException: 404 Not Found if the user does not exist.
+    """
+
+    principal = _known_principal(user_id)
+    if principal is None:
+        user = await AsyncUserService.get_user_by_id(session, user_id)
+        principal = _cache_principal(user_id, user)
+    return principal
+
+
+def _known_principal(user_id: UUID) -> Optional[Principal]:
+    """Principal of a user ID without a lookup: from the token alone or the cache."""
+    if config.AUTH_STATELESS:
+        return Principal(id=user_id)
+    return principal_cache.get(user_id)
+
+
+def _cache_principal(user_id: UUID, user: Optional[Users]) -> Principal:
+    """Cache the principal of a looked up user, raising 404 if there is none."""
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
+
+    principal = Principal(id=user.id, username=user.username, email=user.email)
+    principal_cache.set(user_id, principal)
+    return principal
+
+
+def authenticate_token(token: str) -> Principal:
+    """
+    Checks a JWT token with the same rules as `get_current_user`.
+
+    For connections that outlive a request (websockets): the session only opens a
+    connection on a principal cache miss and is closed right away.
+
+    Args:
+        token (str): Encoded JWT token.
+
+    Raises:
+        HTTPException:
+        - 404 Not Found if the user does not exist.
+        - 403 Forbidden if the token is invalid.
+    """
+
+    user_id = decode_token(token)
+    with Session(engine) as session:
+        return resolve_principal(session, user_id)
+
+
+def limit_login(
+    user_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+) -> OAuth2PasswordRequestForm:
+    """
+    Counts a login attempt for the submitted username.
+
+    Args:
+        user_data (OAuth2PasswordRequestForm): User data for login.
+
+    Raises:
+        HTTPException: 429 Too Many Requests if the username is over its limit.
+    """
+
+    retry_after = login_rate_limiter.hit(user_data.username.lower())
+    if retry_after:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many login attempts, try again later",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    return user_data
 
 
-CurrentUserDep = Annotated[Users, Depends(get_current_user)]
+CurrentUserDep = Annotated[Principal, Depends(get_current_user)]
+AsyncCurrentUserDep = Annotated[Principal, Depends(get_current_user_async)]
+LoginFormDep = Annotated[OAuth2PasswordRequestForm, Depends(limit_login)]
@@ -7,17 +7,58 @@ Features:
 - Standard HTTP status codes and error handling.
 
 Endpoints:
-- POST /events                  : Create a new event.
-- POST /vote/{event_id}/{choice}: Create a new vote on event.
+- POST /events                       : Create a new event.
+- POST /events/bulk                  : Create many events in one transaction.
+- POST /vote/{event_id}/{choice}     : Create a new vote on event.
+- GET  /events                       : List events with their choices, one keyset page at a time.
+- GET  /event/{event_id}             : Retrieve event info.
+- GET  /event/{event_id}/results     : Retrieve the live vote tally of an event.
+- GET  /event/{event_id}/stream      : Stream the live vote tally of an event as server-sent events.
+- GET  /event/{event_id}/votes/export: Stream every vote of an event as NDJSON or CSV.
 """
 
+import base64
+import binascii
+from datetime import datetime
+from typing import Annotated, List, Literal, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Body, Header, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session
 
-from app.databases import SessionDep
-from app.schemas import EventCreate, EventInfo, Feedback
-from app.services import EventService
+from app.config import config
+from app.databases import SessionDep, engine
+from app.schemas import (
+    ChoiceResult,
+    ChoiceSchema,
+    EventBulkError,
+    EventBulkItem,
+    EventBulkResult,
+    EventCreate,
+    EventInfo,
+    EventPage,
+    EventResults,
+    EventSummary,
+    Feedback,
+)
+from app.services import EventService, results_broadcaster, vote_writer
+from app.utils import (
+    EXPORT_MEDIA_TYPES,
+    accepts_gzip,
+    cached_results,
+    conditional_response,
+    encode_response,
+    encode_votes,
+    feedback_response,
+    gzip_stream,
+    info_cache_control,
+    is_final,
+    model_response,
+    response_cache,
+    results_cache_control,
+)
 
 from .deps import CurrentUserDep
 
@@ -46,7 +87,7 @@ def create_event(session: SessionDep, user: CurrentUserDep, event_data: EventCre
     """
 
     if EventService.create_event(session, user.id, event_data):
-        return Feedback(detail="Successfully create event")
+        return feedback_response("Successfully create event", status_code=201)
 
     raise HTTPException(
         status_code=400,
@@ -54,6 +95,53 @@ def create_event(session: SessionDep, user: CurrentUserDep, event_data: EventCre
     )
 
 
+@router.post(
+    "/events/bulk",
+    status_code=201,
+    response_model=EventBulkResult,
+    summary="creates many Events",
+    description="Allows an authenticated user to create many events in one transaction",
+)
+def create_events_bulk(
+    session: SessionDep,
+    user: CurrentUserDep,
+    events_data: Annotated[List[EventCreate], Body(min_length=1)],
+):
+    """
+    Endpoint to create many voting events at once.
+
+    Args:
+        session (SessionDep)             : Database session dependency.
+        user (CurrentDep)                : The currently authenticated user from the JWT token.
+        events_data (List[EventCreate])  : Data for the events to be created.
+
+    Raises:
+        HTTPException:
+        - 422: If no event is sent.
+        - 413: If more than `EVENT_BULK_MAX` events are sent.
+        - 400: If every event was rejected, with the per-item errors as detail.
+    """
+
+    if len(events_data) > config.EVENT_BULK_MAX:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {config.EVENT_BULK_MAX} events can be created at once",
+        )
+
+    created, errors = EventService.create_events_bulk(session, user.id, events_data)
+    result = EventBulkResult(
+        created=[
+            EventBulkItem(index=index, id=event_id) for index, event_id in created
+        ],
+        errors=[EventBulkError(index=index, detail=detail) for index, detail in errors],
+    )
+
+    if not created and errors:
+        raise HTTPException(status_code=400, detail=result.model_dump()["errors"])
+
+    return model_response(result, status_code=201)
+
+
 @router.post(
     "/vote/{event_id}/{choice}",
     response_model=Feedback,
@@ -75,6 +163,7 @@ def user_votes(session: SessionDep, user: CurrentUserDep, event_id: str, choice:
         - 404: If the event or choice is not found.
         - 403: If the event's voting period has expired.
         - 409: If the user has already voted in the event.
+        - 504: If the vote timed out while being written and may still be recorded.
         - 400: For other unexpected errors.
     """
 
@@ -83,16 +172,20 @@ def user_votes(session: SessionDep, user: CurrentUserDep, event_id: str, choice:
     except ValueError:
         raise HTTPException(status_code=422, detail="Invalid event UUID")
 
-    success, message = EventService.create_vote(session, user.id, event_id, choice)
+    if vote_writer.running:
+        success, message = vote_writer.create_vote(session, user.id, event_id, choice)
+    else:
+        success, message = EventService.create_vote(session, user.id, event_id, choice)
 
     if success:
-        return Feedback(detail=message)
+        return feedback_response(message)
 
     error_status_map = {
         "Event not found.": 404,
         "The selected choice does not exist for this event.": 404,
         "Voting for this event has ended.": 403,
         "You have already voted in this event.": 409,
+        "Your vote may still be recorded.": 504,
     }
 
     status_code = error_status_map.get(message, 400)
@@ -100,19 +193,136 @@ def user_votes(session: SessionDep, user: CurrentUserDep, event_id: str, choice:
 
 
 # GET -------------------------------------------------------------------------
+@router.get(
+    "/events/",
+    response_model=EventPage,
+    summary="list Events",
+    description="Allows user to page through events and their choices with a cursor.",
+)
+def list_events(
+    session: SessionDep,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=config.EVENT_PAGE_MAX),
+    creator_id: Optional[UUID] = None,
+    status: Optional[Literal["active", "expired"]] = None,
+    expires_after: Optional[datetime] = None,
+    expires_before: Optional[datetime] = None,
+):
+    """
+    Endpoint to list events.
+
+    Args:
+        session (SessionDep)               : Database session dependency.
+        cursor (Optional[str])             : `next_cursor` of the previous page.
+        limit (int)                        : Page size, at most `EVENT_PAGE_MAX`.
+        creator_id (Optional[UUID])        : Only events created by this user.
+        status (Optional[Literal])         : Only "active" or only "expired" events.
+        expires_after (Optional[datetime]) : Only events expiring at or after this.
+        expires_before (Optional[datetime]): Only events expiring before this.
+
+    Raises:
+        HTTPException: 422 Unprocessable Entity if the cursor is invalid.
+    """
+    after, after_expires_at = decode_cursor(cursor) if cursor else (None, None)
+    events, has_more = EventService.list_events(
+        session,
+        limit,
+        after=after,
+        after_expires_at=after_expires_at,
+        creator_id=creator_id,
+        status=status,
+        expires_after=expires_after,
+        expires_before=expires_before,
+    )
+
+    page = EventPage(
+        items=[
+            EventSummary(
+                id=event.id,
+                title=event.title,
+                desc=event.desc,
+                expires_at=event.expires_at,
+                creator_id=event.creator_id,
+                choices=[
+                    ChoiceSchema(choice=choice.choice) for choice in event.choices
+                ],
+            )
+            for event in events
+        ],
+        next_cursor=(
+            encode_cursor(events[-1].id, events[-1].expires_at) if has_more else None
+        ),
+    )
+    return model_response(page)
+
+
 @router.get(
     "/event/{event_id}",
     response_model=EventInfo,
     summary="retrieve event info",
     description="Allows user to get event information based on given UUID.",
 )
-def get_event(session: SessionDep, event_id: str):
+def get_event(
+    session: SessionDep, event_id: str, if_none_match: Optional[str] = Header(None)
+):
     """
     Endpoint to retrieve event info.
 
+    Answers from the encoded `response_cache` when possible, with 304 Not Modified if
+    the client's `If-None-Match` is current.
+
     Args:
-        session (SessionDep): Database session dependency.
-        event_id (str)      : UUID of the event (as a string path parameter).
+        session (SessionDep)         : Database session dependency.
+        event_id (str)               : UUID of the event (as a string path parameter).
+        if_none_match (Optional[str]): ETag of the client's cached copy.
+
+    Raises
+        HTTPException: 404 Not Found If the event is not found.
+    """
+    try:
+        event_id = UUID(event_id)
+    except ValueError:
+        raise HTTPException(status_code=422, detail="Invalid event UUID")
+
+    encoded = response_cache.get(("info", event_id))
+    if encoded is None:
+        result = EventService.get_catalog_entry(session, event_id)
+        if not result:
+            raise HTTPException(status_code=404, detail="Event not found.")
+
+        encoded = encode_response(
+            EventInfo(
+                title=result.title, desc=result.desc, expires_at=result.expires_at
+            ),
+            result.expires_at,
+        )
+        response_cache.set(("info", event_id), encoded)
+
+    return conditional_response(
+        encoded, if_none_match, info_cache_control(encoded.expires_at)
+    )
+
+
+@router.get(
+    "/event/{event_id}/results",
+    response_model=EventResults,
+    summary="retrieve event results",
+    description="Allows user to get the live vote tally of an event based on given UUID.",
+)
+def get_event_results(
+    session: SessionDep, event_id: str, if_none_match: Optional[str] = Header(None)
+):
+    """
+    Endpoint to retrieve the vote tally of an event.
+
+    Encoded tallies are reused while the event's vote version is unchanged, and for
+    good when encoded after the results became final. A current `If-None-Match` gets
+    304 Not Modified.
+
+    Args:
+        session (SessionDep)         : Database session dependency.
+        event_id (str)               : UUID of the event (as a string path parameter).
+        if_none_match (Optional[str]): ETag of the client's cached copy.
 
     Raises
         HTTPException: 404 Not Found If the event is not found.
@@ -122,10 +332,158 @@ def get_event(session: SessionDep, event_id: str):
     except ValueError:
         raise HTTPException(status_code=422, detail="Invalid event UUID")
 
-    result = EventService.get_event_by_id(session, event_id)
-    if result:
-        return EventInfo(
-            title=result.title, desc=result.desc, expires_at=result.expires_at
+    encoded, version = cached_results(event_id)
+    if encoded is None:
+        entry = EventService.get_catalog_entry(session, event_id)
+        # Decided before the tally is read, so a tally read while votes could still
+        # land is never cached or served as immutable.
+        final = entry is not None and is_final(entry.expires_at)
+        tally = EventService.get_event_results(session, event_id)
+        if not tally:
+            raise HTTPException(status_code=404, detail="Event not found.")
+
+        encoded = encode_response(
+            EventResults(
+                total_votes=sum(votes for _, votes in tally),
+                results=[
+                    ChoiceResult(choice=choice, votes=votes) for choice, votes in tally
+                ],
+            ),
+            entry.expires_at if entry else None,
+            version,
+            final,
         )
+        if version is not None or final:
+            response_cache.set(("results", event_id), encoded)
+
+    return conditional_response(encoded, if_none_match, results_cache_control(encoded))
+
+
+@router.get(
+    "/event/{event_id}/stream",
+    response_class=StreamingResponse,
+    summary="stream event results",
+    description="Pushes the vote tally of an event as server-sent events whenever it changes.",
+)
+async def stream_event_results(event_id: str):
+    """
+    Endpoint to stream the vote tally of an event.
+
+    Every subscriber of an event shares one tally computation per `STREAM_TICK_MS`.
+
+    Args:
+        event_id (str): UUID of the event (as a string path parameter).
+
+    Raises
+        HTTPException: 404 Not Found If the event is not found.
+    """
+    try:
+        event_id = UUID(event_id)
+    except ValueError:
+        raise HTTPException(status_code=422, detail="Invalid event UUID")
+
+    initial = results_broadcaster.latest(event_id) or await run_in_threadpool(
+        results_broadcaster.load_results, event_id
+    )
+    if initial is None:
+        raise HTTPException(status_code=404, detail="Event not found.")
+
+    return StreamingResponse(
+        results_broadcaster.stream(event_id, initial),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 
-    raise HTTPException(status_code=404, detail="Event not found.")
+@router.get(
+    "/event/{event_id}/votes/export",
+    response_class=StreamingResponse,
+    summary="export event votes",
+    description="Allows the creator of an event to download every vote cast on it.",
+)
+def export_event_votes(
+    session: SessionDep,
+    user: CurrentUserDep,
+    event_id: str,
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    accept_encoding: Optional[str] = Header(None),
+):
+    """
+    Endpoint to export the vote log of an event.
+
+    Votes are read in keyset chunks of `VOTE_EXPORT_CHUNK_SIZE` on a session of the
+    stream's own, encoded and gzip-compressed (when accepted) as they are sent, so
+    memory stays constant whatever the number of votes and votes keep being written
+    during the export.
+
+    Args:
+        session (SessionDep)           : Database session dependency.
+        user (CurrentDep)              : The currently authenticated user from the JWT token.
+        event_id (str)                 : UUID of the event (as a string path parameter).
+        export_format (Literal)        : "ndjson" or "csv", from the `format` query parameter.
+        accept_encoding (Optional[str]): Codings accepted by the client.
+
+    Raises:
+        HTTPException:
+        - 422: If the event ID is not a valid UUID.
+        - 404: If the event is not found.
+        - 403: If the user is not the creator of the event.
+    """
+    try:
+        event_id = UUID(event_id)
+    except ValueError:
+        raise HTTPException(status_code=422, detail="Invalid event UUID")
+
+    entry = EventService.get_catalog_entry(session, event_id)
+    if not entry:
+        raise HTTPException(status_code=404, detail="Event not found.")
+    if entry.creator_id != user.id:
+        raise HTTPException(
+            status_code=403,
+            detail="Only the creator of the event can export its votes.",
+        )
+
+    def chunks():
+        # The request's session is closed once the endpoint returns, before streaming.
+        with Session(engine) as export_session:
+            yield from EventService.export_votes(
+                export_session, event_id, config.VOTE_EXPORT_CHUNK_SIZE
+            )
+
+    body = encode_votes(chunks(), export_format)
+    headers = {
+        "Content-Disposition": f'attachment; filename="votes-{event_id}.{export_format}"',
+        "Cache-Control": "no-store",
+        "Vary": "Accept-Encoding",
+    }
+    if accepts_gzip(accept_encoding):
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        body, media_type=EXPORT_MEDIA_TYPES[export_format], headers=headers
+    )
+
+
+# UTILS -------------------------------------------------------------------------
+def encode_cursor(event_id: UUID, expires_at: Optional[datetime]) -> str:
+    """Opaque page cursor of the last event of a page: its id, then its expiry."""
+    key = event_id.bytes
+    if expires_at is not None:
+        key += expires_at.isoformat().encode()
+    return base64.urlsafe_b64encode(key).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[UUID, Optional[datetime]]:
+    """
+    Event id and expiry behind a page cursor.
+
+    Raises:
+        HTTPException: 422 Unprocessable Entity if the cursor is invalid.
+    """
+    try:
+        key = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        expires_at = datetime.fromisoformat(key[16:].decode()) if key[16:] else None
+        return UUID(bytes=key[:16]), expires_at
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=422, detail="Invalid cursor")
@@ -3,11 +3,23 @@ Health check API route.
 
 Defines a simple endpoint to verify that the service is up and running.
 Returns a JSON response with a "status" key set to "ok".
+
+`/health/ready` checks the database and pool and answers 503 when a `HEALTH_*`
+threshold is exceeded, so load balancers drain traffic away from degraded workers.
+
+Endpoints:
+- GET /health          : Liveness check.
+- GET /health/ready    : Readiness check with DB latency, pool and commit statistics.
+- GET /health/hash-pool: Password hashing queue depth and latency.
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+from fastapi.concurrency import run_in_threadpool
 
-from app.schemas import Feedback
+from app.databases import engine
+from app.schemas import Feedback, HashPoolStats, ReadinessStatus
+from app.services import HealthService
+from app.utils import password_hasher
 
 router = APIRouter(tags=["Health"])
 
@@ -19,3 +31,29 @@ def health_check():
     Returns a JSON response with a detail "OK".
     """
     return Feedback(detail="OK")
+
+
+@router.get(
+    "/health/ready",
+    response_model=ReadinessStatus,
+    responses={503: {"model": ReadinessStatus}},
+)
+async def readiness_check(response: Response):
+    """
+    Readiness endpoint.
+    Returns the database and pool measurements, with 503 if any threshold is exceeded.
+    The checks run on the threadpool so a slow database does not block the event loop.
+    """
+    status = await run_in_threadpool(HealthService.readiness, engine)
+    if not status.ready:
+        response.status_code = 503
+    return status
+
+
+@router.get("/health/hash-pool", response_model=HashPoolStats)
+def hash_pool_stats():
+    """
+    Password hashing pool endpoint.
+    Returns the queue depth, rejections and hash latency of the pool.
+    """
+    return HashPoolStats(**password_hasher.stats())
@@ -0,0 +1,47 @@
+"""
+Metrics API route.
+
+Exposes the in-process metrics registry for Prometheus to scrape.
+
+Endpoints:
+- GET /metrics: Metrics in the Prometheus text exposition format.
+"""
+
+from anyio import to_thread
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.databases import engine
+from app.utils import password_hasher
+from app.utils.metrics import (
+    db_pool_connections,
+    password_hash_pending,
+    registry,
+    threadpool_threads,
+)
+
+router = APIRouter(tags=["Health"])
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """
+    Metrics endpoint.
+    Samples the threadpool, connection pool and hashing queue, then renders every metric.
+    """
+    limiter = to_thread.current_default_thread_limiter()
+    threadpool_threads.set(limiter.borrowed_tokens, state="busy")
+    threadpool_threads.set(limiter.total_tokens, state="limit")
+
+    pool = engine.pool
+    if hasattr(pool, "checkedout"):
+        db_pool_connections.set(pool.checkedout(), state="checked_out")
+        db_pool_connections.set(pool.checkedin(), state="idle")
+        db_pool_connections.set(pool.size(), state="size")
+
+    stats = password_hasher.stats()
+    password_hash_pending.set(stats["pending"])
+
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
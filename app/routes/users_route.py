@@ -5,20 +5,23 @@ Provides endpoints to create Users entities.
 
 Features:
 - Standard HTTP status codes and error handling.
+- bcrypt runs in the bounded `password_hasher` pool, database work in the threadpool,
+  so a login storm does not hold request threads while hashing.
 
 Endpoints:
 - POST /users/     : Register a new user account.
 - POST /users/login: Log in a user and return an access token.
 """
 
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import OAuth2PasswordRequestForm
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 
 from app.databases import SessionDep
 from app.schemas import Feedback, TokenSchema, UserCreate
 from app.services import UserService
+from app.utils import feedback_response, model_response, password_hasher
+
+from .deps import LoginFormDep
 
 router = APIRouter(tags=["Users"])
 
@@ -31,7 +34,7 @@ router = APIRouter(tags=["Users"])
     summary="creates a new User",
     description="Allows user to create an account to access the service",
 )
-def register_user(session: SessionDep, user_data: UserCreate):
+async def register_user(session: SessionDep, user_data: UserCreate):
     """
     Endpoint to create a new user.
 
@@ -41,9 +44,13 @@ def register_user(session: SessionDep, user_data: UserCreate):
 
     Raises:
         HTTPException: HTTP 400 Bad Request if user registration fails.
+        HashPoolBusy : Answered with 503 when the hashing queue is full.
     """
-    if UserService.create_user(session, user_data):
-        return Feedback(detail="Successfully registered user")
+    hashed_password = await password_hasher.hash(user_data.password)
+    if await run_in_threadpool(
+        UserService.create_user, session, user_data, hashed_password
+    ):
+        return feedback_response("Successfully registered user", status_code=201)
 
     raise HTTPException(
         status_code=400,
@@ -57,9 +64,7 @@ def register_user(session: SessionDep, user_data: UserCreate):
     summary="login user",
     description="Allows an user to login and get jwt token in return",
 )
-def login_user(
-    session: SessionDep, user_data: Annotated[OAuth2PasswordRequestForm, Depends()]
-):
+async def login_user(session: SessionDep, user_data: LoginFormDep):
     """
     Endpoint to log in a user and return an access token.
 
@@ -68,10 +73,14 @@ def login_user(
         user_data (OAuth2PasswordRequestForm): User data for login.
 
     Raises:
-        HTTPException: HTTP 400 Bad Request if login fails.
+        HTTPException: HTTP 400 Bad Request if login fails, 429 when rate limited.
+        HashPoolBusy : Answered with 503 when the hashing queue is full.
     """
-    token = UserService.login_user(session, user_data)
-    if not token:
+    user = await run_in_threadpool(
+        UserService.get_user_by_username, session, user_data.username
+    )
+    if not user or not await password_hasher.verify(user_data.password, user.password):
         raise HTTPException(status_code=400, detail="Invalid username or password")
 
-    return TokenSchema(access_token=token, token_type="bearer")
+    token = UserService.issue_token(user.id)
+    return model_response(TokenSchema(access_token=token, token_type="bearer"))
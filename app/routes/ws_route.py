@@ -0,0 +1,145 @@
+"""
+WebSocket API route for live event results.
+
+Features:
+- Authenticates with the same JWT rules as `get_current_user`, from the `token` query
+  parameter or the `Authorization: Bearer` header.
+- Shares the event's `results_broadcaster` topic with the SSE stream, so every
+  connection of an event costs one tally computation per tick.
+- Slow consumers only ever get the latest tally, and a send that stalls longer than
+  `WS_SEND_TIMEOUT_SECONDS` closes the connection instead of buffering.
+
+Endpoints:
+- WS /ws/event/{event_id}: Live vote tally of an event.
+
+Messages:
+- Server: `{"type": "results", "data": EventResults}` on connect and on every change,
+          `{"type": "ping"}` after `WS_PING_SECONDS` without updates,
+          `{"type": "pong"}` in reply to a client ping.
+- Client: `ping` or `{"type": "ping"}`, anything else is ignored.
+"""
+
+import asyncio
+import json
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import config
+from app.services import results_broadcaster
+
+from .deps import authenticate_token
+
+router = APIRouter(tags=["Events"])
+
+PING = '{"type":"ping"}'
+PONG = '{"type":"pong"}'
+
+
+def results_message(payload: str) -> str:
+    """Wrap a serialized tally without decoding and re-encoding it."""
+    return f'{{"type":"results","data":{payload}}}'
+
+
+def bearer_token(websocket: WebSocket, token: Optional[str]) -> Optional[str]:
+    """Token from the query parameter, or from an `Authorization: Bearer` header."""
+    if token:
+        return token
+
+    scheme, _, credentials = websocket.headers.get("authorization", "").partition(" ")
+    return credentials if scheme.lower() == "bearer" and credentials else None
+
+
+@router.websocket("/ws/event/{event_id}")
+async def event_results_ws(
+    websocket: WebSocket, event_id: str, token: Optional[str] = None
+):
+    """
+    WebSocket channel pushing the vote tally of an event.
+
+    Args:
+        websocket (WebSocket): The connection.
+        event_id (str)       : UUID of the event (as a string path parameter).
+        token (Optional[str]): JWT token, when not sent as a header.
+
+    Closes with 1008 (policy violation) before accepting if the token is missing or
+    invalid, the user does not exist, or the event is not found.
+    """
+    token = bearer_token(websocket, token)
+    if not token:
+        await websocket.close(status.WS_1008_POLICY_VIOLATION, "Not authenticated")
+        return
+
+    try:
+        await run_in_threadpool(authenticate_token, token)
+        event_id = UUID(event_id)
+    except HTTPException as exc:
+        await websocket.close(status.WS_1008_POLICY_VIOLATION, exc.detail)
+        return
+    except ValueError:
+        await websocket.close(status.WS_1008_POLICY_VIOLATION, "Invalid event UUID")
+        return
+
+    initial = results_broadcaster.latest(event_id) or await run_in_threadpool(
+        results_broadcaster.load_results, event_id
+    )
+    if initial is None:
+        await websocket.close(status.WS_1008_POLICY_VIOLATION, "Event not found.")
+        return
+
+    await websocket.accept()
+    try:
+        await websocket.send_text(results_message(initial))
+        async with results_broadcaster.subscribe(event_id) as queue:
+            sender = asyncio.create_task(send_updates(websocket, queue, initial))
+            receiver = asyncio.create_task(receive_messages(websocket))
+            done, pending = await asyncio.wait(
+                {sender, receiver}, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in pending:
+                task.cancel()
+            for task in done:
+                task.result()
+
+    except (WebSocketDisconnect, TimeoutError):
+        pass
+
+
+async def send_updates(websocket: WebSocket, queue: asyncio.Queue, last: str) -> None:
+    """Forward new tallies from the topic queue, pinging when the event is quiet."""
+    while True:
+        try:
+            async with asyncio.timeout(config.WS_PING_SECONDS):
+                payload = await queue.get()
+        except TimeoutError:
+            message = PING
+        else:
+            if payload == last:
+                continue
+            last = payload
+            message = results_message(payload)
+
+        # A consumer that stops reading fills the transport buffer; drop it.
+        async with asyncio.timeout(config.WS_SEND_TIMEOUT_SECONDS):
+            await websocket.send_text(message)
+
+
+def is_ping(message: str) -> bool:
+    if message.strip() == "ping":
+        return True
+
+    try:
+        data = json.loads(message)
+    except ValueError:
+        return False
+
+    return isinstance(data, dict) and data.get("type") == "ping"
+
+
+async def receive_messages(websocket: WebSocket) -> None:
+    """Answer client pings until the client disconnects."""
+    while True:
+        if is_ping(await websocket.receive_text()):
+            await websocket.send_text(PONG)
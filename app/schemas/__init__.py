@@ -1,6 +1,19 @@
-from .auth_schema import TokenPayload, TokenSchema
-from .event_schema import EventCreate, EventInfo
+from .auth_schema import Principal, TokenPayload, TokenSchema
+from .event_schema import (
+    ChoiceResult,
+    ChoiceSchema,
+    EventBulkError,
+    EventBulkItem,
+    EventBulkResult,
+    EventCreate,
+    EventInfo,
+    EventPage,
+    EventResults,
+    EventSummary,
+)
 from .feedback_schema import Feedback
+from .health_schema import HashPoolStats, PoolStats, ReadinessStatus
+from .profile_schema import RequestProfile, StatementProfile
 from .users_scema import UserCreate
 
 __all__ = [
@@ -8,6 +21,20 @@ __all__ = [
     "Feedback",
     "TokenSchema",
     "TokenPayload",
+    "Principal",
     "EventCreate",
+    "ChoiceSchema",
     "EventInfo",
+    "EventResults",
+    "EventSummary",
+    "EventPage",
+    "ChoiceResult",
+    "EventBulkItem",
+    "EventBulkError",
+    "EventBulkResult",
+    "HashPoolStats",
+    "PoolStats",
+    "ReadinessStatus",
+    "RequestProfile",
+    "StatementProfile",
 ]
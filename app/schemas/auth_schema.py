@@ -1,6 +1,7 @@
 """Schema for user login token."""
 
 from typing import Optional
+from uuid import UUID
 
 from pydantic import BaseModel
 
@@ -16,3 +17,11 @@ class TokenPayload(BaseModel):
     """Schema for token payload."""
 
     sub: Optional[str] = None
+
+
+class Principal(BaseModel):
+    """Schema for the authenticated user of a request."""
+
+    id: UUID
+    username: Optional[str] = None
+    email: Optional[str] = None
@@ -6,6 +6,7 @@ Used for database CRUD operations in the application.
 
 from datetime import datetime
 from typing import List, Optional
+from uuid import UUID
 
 from pydantic import BaseModel
 
@@ -29,5 +30,58 @@ class EventInfo(BaseModel):
     """Pydantic schema for public Event."""
 
     title: str
-    desc: str
+    desc: Optional[str]
     expires_at: Optional[datetime]
+
+
+class EventSummary(BaseModel):
+    """Pydantic schema for an Event in a listing page."""
+
+    id: UUID
+    title: str
+    desc: Optional[str]
+    expires_at: Optional[datetime]
+    creator_id: UUID
+    choices: List[ChoiceSchema]
+
+
+class EventPage(BaseModel):
+    """Pydantic schema for a page of Events and the cursor of the next one."""
+
+    items: List[EventSummary]
+    next_cursor: Optional[str]
+
+
+class ChoiceResult(BaseModel):
+    """Pydantic schema for the vote tally of a single choice."""
+
+    choice: str
+    votes: int
+
+
+class EventResults(BaseModel):
+    """Pydantic schema for public Event results."""
+
+    total_votes: int
+    results: List[ChoiceResult]
+
+
+class EventBulkItem(BaseModel):
+    """Pydantic schema for an Event created by a bulk request."""
+
+    index: int
+    id: UUID
+
+
+class EventBulkError(BaseModel):
+    """Pydantic schema for an Event rejected by a bulk request."""
+
+    index: int
+    detail: str
+
+
+class EventBulkResult(BaseModel):
+    """Pydantic schema for the outcome of a bulk Event creation."""
+
+    created: List[EventBulkItem]
+    errors: List[EventBulkError]
@@ -0,0 +1,41 @@
+"""Schemas for health and diagnostics endpoints."""
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class HashPoolStats(BaseModel):
+    """Schema for password hashing pool queue depth and latency."""
+
+    workers: int
+    max_pending: int
+    pending: int
+    completed: int
+    rejected: int
+    avg_latency_ms: float
+    max_latency_ms: float
+
+
+class PoolStats(BaseModel):
+    """Schema for database connection pool occupancy, `capacity` is None when unbounded."""
+
+    size: int
+    checked_out: int
+    overflow: int
+    capacity: Optional[int]
+
+
+class ReadinessStatus(BaseModel):
+    """
+    Schema for the readiness probe, `problems` lists every exceeded threshold.
+
+    `commit_p95_ms` covers the commits of the recent window, None if there were none.
+    """
+
+    ready: bool
+    db_latency_ms: Optional[float]
+    pool: Optional[PoolStats]
+    wal_bytes: Optional[int]
+    commit_p95_ms: Optional[float]
+    problems: List[str]
@@ -0,0 +1,30 @@
+"""Schemas for the per-request SQL profiler of `SQL_PROFILE_ENABLED`."""
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class StatementProfile(BaseModel):
+    """Schema for one distinct SQL statement executed during a request."""
+
+    statement: str
+    count: int
+    total_ms: float
+    n_plus_one: bool
+
+
+class RequestProfile(BaseModel):
+    """Schema for the SQL profile of one HTTP request."""
+
+    id: int
+    method: str
+    path: str
+    route: Optional[str]
+    status: int
+    duration_ms: float
+    queries: int
+    query_ms: float
+    n_plus_one: int
+    statements: List[StatementProfile]
+    cprofile: Optional[str] = None
@@ -1,7 +1,19 @@
+from .async_event_service import AsyncEventService
+from .async_users_service import AsyncUserService
 from .event_service import EventService
+from .expiry_scheduler import expiry_scheduler
+from .health_service import HealthService
+from .results_broadcaster import results_broadcaster
 from .users_service import UserService
+from .vote_writer import vote_writer
 
 __all__ = [
     "UserService",
     "EventService",
+    "HealthService",
+    "AsyncUserService",
+    "AsyncEventService",
+    "vote_writer",
+    "results_broadcaster",
+    "expiry_scheduler",
 ]
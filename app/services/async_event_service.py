@@ -0,0 +1,256 @@
+"""
+Async CRUD operations for Event and Vote entities using SQLModel.
+
+Mirrors `EventService` on an `AsyncSession` for the async request path.
+
+Functions:
+- create_event       : Add a new Event to the database.
+- create_vote        : Add a new Vote to the database.
+- get_event_by_id    : Retrieve an Event by id.
+- get_catalog_entry  : Retrieve the cached catalog entry of an Event.
+- create_sharded_vote: Utility function to cast a vote on a vote shard.
+- validate_vote      : Utility function to run the checks a vote must pass.
+- verify_choice      : Utility function to verify choice.
+- is_vote            : Utility function to verify is user already vote or not.
+
+Handles SQLAlchemy exceptions with transaction rollback and logs errors.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config import config
+from app.databases import engine, vote_shards
+from app.models import Choice, Event, Vote
+from app.schemas import EventCreate
+from app.utils import CatalogEntry, catalog_cache
+
+from .event_service import EventService
+from .vote_writer import vote_writer
+
+
+class AsyncEventService:
+
+    @staticmethod
+    async def create_event(
+        session: AsyncSession, user_id: UUID, event_data: EventCreate
+    ) -> bool:
+        """
+        Create a new event in the database.
+
+        Args:
+            session (AsyncSession)  : Async database session for operations.
+            user_id (UUID)          : ID of the user creating the event.
+            event_data (EventCreate): Input event data.
+
+        Returns:
+            bool: True if event was created successfully, False if choices is not between 2 and 4.
+        """
+
+        if not 2 <= len(event_data.choices) <= 4:
+            return False
+
+        db_obj = Event(
+            title=event_data.name,
+            desc=event_data.description,
+            creator_id=user_id,
+            expires_at=event_data.expires_at,
+        )
+
+        try:
+            session.add(db_obj)
+            session.add_all(
+                Choice(choice=choice.choice, event_id=db_obj.id)
+                for choice in event_data.choices
+            )
+            await session.commit()
+            return True
+
+        except Exception:
+            await session.rollback()
+            return False
+
+    @staticmethod
+    async def create_vote(
+        session: AsyncSession, user_id: UUID, event_id: UUID, choice: str
+    ) -> Tuple[bool, str]:
+        """
+        votes an event and save it in the database.
+
+        Args:
+            session (AsyncSession): Async database session for operations.
+            user_id (UUID)        : ID of the user votes the event.
+            event_id (UUID)       : ID of the event .
+            choice (str)          : ID of the choice.
+
+        Returns:
+            Tuple[bool, str]:
+                - `True` and a success message if the vote is successfully cast.
+                - `False` and an error message if any validation fails or an exception occurs.
+        """
+        if vote_shards.enabled:
+            # Vote shards only have sync engines, so the vote runs in the threadpool.
+            await session.close()
+            return await run_in_threadpool(
+                AsyncEventService.create_sharded_vote, user_id, event_id, choice
+            )
+
+        if not vote_writer.running:
+            return await session.run_sync(
+                EventService.create_vote, user_id, event_id, choice
+            )
+
+        choice_id, message = await AsyncEventService.validate_vote(
+            session, user_id, event_id, choice
+        )
+        if choice_id is None:
+            return False, message
+
+        await session.close()
+        future = vote_writer.submit(user_id, event_id, choice_id)
+        try:
+            # Shielded, so the timeout does not cancel the vote behind the writer's back.
+            return await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)),
+                config.VOTE_WRITE_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            return vote_writer.abandon(future)
+
+    @staticmethod
+    async def get_event_by_id(session: AsyncSession, event_id: UUID) -> Optional[Event]:
+        """
+        Retrieve event information based on event_id from database.
+
+        Args:
+            session (AsyncSession): Async database session for operations.
+            event_id (UUID)       : ID of the event.
+
+        Returns:
+            Optional[Event]: The Event entity if found, otherwise None.
+        """
+        return await session.get(Event, event_id)
+
+    @staticmethod
+    async def get_catalog_entry(
+        session: AsyncSession, event_id: UUID
+    ) -> Optional[CatalogEntry]:
+        """
+        Retrieve an event and its choices through the process-local catalog cache.
+
+        Args:
+            session (AsyncSession): Async database session for operations.
+            event_id (UUID)       : ID of the event.
+
+        Returns:
+            Optional[CatalogEntry]: The catalog entry if the event is found, otherwise None.
+        """
+        entry = catalog_cache.get(event_id)
+        if entry is not None:
+            return entry
+
+        return await session.run_sync(EventService.get_catalog_entry, event_id)
+
+    # UTILS -------------------------------------------------------------------------
+    @staticmethod
+    def create_sharded_vote(
+        user_id: UUID, event_id: UUID, choice: str
+    ) -> Tuple[bool, str]:
+        """
+        Cast a vote on its shard with a sync session, through the writer if running.
+
+        Args:
+            user_id (UUID)     : ID of the user votes the event.
+            event_id (UUID)    : ID of the event.
+            choice (str)       : The choice user choose.
+
+        Returns:
+            Tuple[bool, str]: Same outcomes as `EventService.create_vote`.
+        """
+        with Session(engine) as session:
+            if vote_writer.running:
+                return vote_writer.create_vote(session, user_id, event_id, choice)
+            return EventService.create_vote(session, user_id, event_id, choice)
+
+    @staticmethod
+    async def validate_vote(
+        session: AsyncSession, user_id: UUID, event_id: UUID, choice: str
+    ) -> Tuple[Optional[int], str]:
+        """
+        Run the read-only checks a vote must pass before it is written.
+
+        Args:
+            session (AsyncSession): Async database session for operations.
+            user_id (UUID)        : ID of the user votes the event.
+            event_id (UUID)       : ID of the event.
+            choice (str)          : The choice user choose.
+
+        Returns:
+            Tuple[Optional[int], str]:
+                - The choice ID and an empty message if the vote may be written.
+                - `None` and an error message if any validation fails.
+        """
+        entry = await AsyncEventService.get_catalog_entry(session, event_id)
+
+        if not entry:
+            return None, "Event not found."
+
+        elif entry.expires_at and datetime.now() > entry.expires_at:
+            return None, "Voting for this event has ended."
+
+        choice_id = entry.choices.get(choice)
+        if choice_id is None:
+            return None, "The selected choice does not exist for this event."
+
+        if await AsyncEventService.is_vote(session, user_id, event_id):
+            return None, "You have already voted in this event."
+
+        return choice_id, ""
+
+    @staticmethod
+    async def verify_choice(
+        session: AsyncSession, event_id: UUID, choice: str
+    ) -> Optional[Choice]:
+        """
+        Verify a choice by event id from the database.
+
+        Args:
+            session (AsyncSession): Async database session for operations.
+            event_id (UUID)       : ID of the event.
+            choice (str)          : The choice user choose.
+
+        Returns:
+            Optional[Choice]: The Choice entity if found, otherwise None.
+        """
+
+        statment = select(Choice).where(
+            Choice.event_id == event_id, Choice.choice == choice
+        )
+
+        return (await session.exec(statment)).first()
+
+    @staticmethod
+    async def is_vote(
+        session: AsyncSession, user_id: UUID, event_id: UUID
+    ) -> Optional[Vote]:
+        """
+        Verify is a user already vote or not.
+
+        Args:
+            session (AsyncSession): Async database session for operations.
+            user_id (UUID)        : ID of the user votes the event.
+            event_id (str)        : ID of the event.
+
+        Returns:
+            Optional[Vote]: The Vote entity if found, otherwise None.
+        """
+        statment = select(Vote).where(
+            Vote.user_id == user_id, Vote.event_id == event_id
+        )
+        return (await session.exec(statment)).first()
@@ -0,0 +1,110 @@
+"""
+Async CRUD operations for Users entities using SQLModel.
+
+Mirrors `UserService` on an `AsyncSession` for the async request path. Password
+hashing is CPU bound, so it runs in the bounded `password_hasher` pool.
+
+Functions:
+- create_user         : Add a new User to the database.
+- login_user          : Authenticate a User and return an access token.
+- get_user_by_id      : Retrieve a User by id.
+- get_user_by_username: Retrieve a User by username.
+
+Handles SQLAlchemy exceptions with transaction rollback and logs errors.
+"""
+
+from typing import Optional
+from uuid import UUID
+
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import Users
+from app.schemas import UserCreate
+from app.utils import password_hasher
+
+from .users_service import UserService
+
+
+class AsyncUserService:
+
+    @staticmethod
+    async def create_user(session: AsyncSession, user: UserCreate) -> bool:
+        """
+        Create a new user in the database.
+
+        Args:
+            session (AsyncSession): Async database session for operations.
+            user (UserCreate)     : User data to be created.
+
+        Returns:
+            bool: True if user was created successfully, False if email or username already exists.
+        """
+
+        hashed_password = await password_hasher.hash(user.password)
+        db_obj = Users.model_validate(user, update={"password": hashed_password})
+
+        try:
+            session.add(db_obj)
+            await session.commit()
+            return True
+
+        except IntegrityError:
+            await session.rollback()
+            return False
+
+    @staticmethod
+    async def login_user(
+        session: AsyncSession, user_data: OAuth2PasswordRequestForm
+    ) -> Optional[str]:
+        """
+        Log in a user and return an access token.
+
+        Args:
+            session (AsyncSession)               : Async database session for operations.
+            user_data (OAuth2PasswordRequestForm): User credentials for login.
+
+        Returns:
+            Optional[str]: The access token if login is successful, otherwise None.
+        """
+        user = await AsyncUserService.get_user_by_username(session, user_data.username)
+        if not user or not await password_hasher.verify(
+            user_data.password, user.password
+        ):
+            return None
+
+        return UserService.issue_token(user.id)
+
+    # UTILS -------------------------------------------------------------------------
+    @staticmethod
+    async def get_user_by_id(session: AsyncSession, user_id: UUID) -> Optional[Users]:
+        """
+        Retrieve a user by ID from the database.
+
+        Args:
+            session (AsyncSession): Async database session for operations.
+            user_id (UUID)        : The ID of the user to retrieve.
+
+        Returns:
+            Optional[Users]: The Users entity if found, otherwise None.
+        """
+        return await session.get(Users, user_id)
+
+    @staticmethod
+    async def get_user_by_username(
+        session: AsyncSession, username: str
+    ) -> Optional[Users]:
+        """
+        Retrieve a user by username from the database.
+
+        Args:
+            session (AsyncSession): Async database session for operations.
+            username (str)        : The username of the user to retrieve.
+
+        Returns:
+            Optional[Users]: The Users entity if found, otherwise None.
+        """
+        statement = select(Users).where(Users.username == username)
+        return (await session.exec(statement)).first()
@@ -2,22 +2,54 @@
 CRUD operations for Event and Vote entities using SQLModel.
 
 Functions:
-- create_event  : Add a new Event to the database.
-- create_vote   : Add a new Vote to the database.
-- verify_choice : Utility function to verify choice.
-- is_vote       : Utility function to verify is user already vote or not.
+- create_event         : Add a new Event to the database.
+- create_events_bulk   : Add many Events and their Choices in one transaction.
+- create_vote          : Add a new Vote to the database.
+- get_event_by_id      : Retrieve an Event by id.
+- list_events          : Retrieve a keyset page of Events with their Choices.
+- get_catalog_entry    : Retrieve the cached catalog entry of an Event.
+- get_event_results    : Retrieve the vote tally of an Event from its snapshot or counters.
+- reconcile_vote_counts: Rebuild the vote counters from the Vote table.
+- list_closing_events  : Retrieve the events closing before a time without a snapshot.
+- freeze_results       : Write the final results of a closed Event to its snapshot.
+- export_votes         : Retrieve every Vote of an Event in keyset chunks.
+- insert_vote          : Utility function to validate and insert a vote in one statement.
+- validate_vote        : Utility function to run the checks a vote must pass.
+- verify_choice        : Utility function to verify choice.
+- is_vote              : Utility function to verify is user already vote or not.
+- increment_vote_count : Utility function to bump the counter of a choice.
+- count_votes          : Utility function to read the tally of an event from its counters.
+
+Vote and counter queries run on the vote shard of the event through `vote_shards`.
 
 Handles SQLAlchemy exceptions with transaction rollback and logs errors.
 """
 
+import uuid
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Iterator, List, Literal, Optional, Tuple
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlalchemy import tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, delete, func, insert, literal, or_, select, update
 
-from app.models import Choice, Event, Vote
+from app.databases import vote_shards
+from app.models import Choice, Event, ResultSnapshot, Vote, VoteCount
 from app.schemas import EventCreate
+from app.utils import (
+    CatalogEntry,
+    cache_results,
+    catalog_cache,
+    get_results,
+    is_final,
+    track_vote_counts,
+)
+
+UPSERT_DIALECTS = {"sqlite": sqlite_insert, "postgresql": pg_insert}
 
 
 class EventService:
@@ -47,21 +79,79 @@ class EventService:
         )
 
         try:
+            # One transaction, so no reader sees the event without its choices.
             session.add(db_obj)
+            session.add_all(
+                Choice(choice=choice.choice, event_id=db_obj.id)
+                for choice in event_data.choices
+            )
             session.commit()
-            session.refresh(db_obj)
+            return True
+
+        except Exception:
+            session.rollback()
+            return False
+
+    @staticmethod
+    def create_events_bulk(
+        session: Session, user_id: UUID, events: List[EventCreate]
+    ) -> Tuple[List[Tuple[int, UUID]], List[Tuple[int, str]]]:
+        """
+        Create many events in a single transaction.
+
+        Event IDs are generated here so every event and choice row can be written
+        with one executemany insert per table, followed by a single commit.
 
-            # Add each choice
-            for choice in event_data.choices:
-                db_choice = Choice(choice=choice.choice, event_id=db_obj.id)
-                session.add(db_choice)
+        Args:
+            session (Session)        : Database session for operations.
+            user_id (UUID)           : ID of the user creating the events.
+            events (List[EventCreate]): Input event data.
 
+        Returns:
+            Tuple[List[Tuple[int, UUID]], List[Tuple[int, str]]]:
+                - (index, event ID) of every created event.
+                - (index, error message) of every rejected event.
+        """
+        created: List[Tuple[int, UUID]] = []
+        errors: List[Tuple[int, str]] = []
+        event_rows: List[dict] = []
+        choice_rows: List[dict] = []
+
+        for index, event_data in enumerate(events):
+            if not 2 <= len(event_data.choices) <= 4:
+                errors.append((index, "Choices must be between 2 and 4!"))
+                continue
+
+            event_id = uuid.uuid4()
+            event_rows.append(
+                {
+                    "id": event_id,
+                    "title": event_data.name,
+                    "desc": event_data.description,
+                    "creator_id": user_id,
+                    "expires_at": event_data.expires_at,
+                }
+            )
+            choice_rows.extend(
+                {"choice": choice.choice, "event_id": event_id}
+                for choice in event_data.choices
+            )
+            created.append((index, event_id))
+
+        if not event_rows:
+            return created, errors
+
+        try:
+            session.exec(insert(Event), params=event_rows)
+            session.exec(insert(Choice), params=choice_rows)
             session.commit()
-            return True
+            return created, errors
 
         except Exception:
             session.rollback()
-            return False
+            errors.extend((index, "Failed to create event.") for index, _ in created)
+            errors.sort()
+            return [], errors
 
     @staticmethod
     def create_vote(
@@ -81,48 +171,501 @@ class EventService:
                 - `True` and a success message if the vote is successfully cast.
                 - `False` and an error message if any validation fails or an exception occurs.
         """
-        is_event = session.get(Event, event_id)
+        with vote_shards.vote_session(session, event_id) as votes:
+            if votes.get_bind().dialect.name not in UPSERT_DIALECTS:
+                choice_id, message = EventService.validate_vote(
+                    session, user_id, event_id, choice
+                )
+                if choice_id is None:
+                    return False, message
+
+                try:
+                    votes.add(
+                        Vote(user_id=user_id, event_id=event_id, choice_id=choice_id)
+                    )
+                    EventService.increment_vote_count(votes, event_id, choice_id)
+                    votes.commit()
+
+                    return True, "Successfully votes event"
+
+                except Exception:
+                    votes.rollback()
+                    return False, "Something wrong."
+
+            try:
+                # A shard has no choice or event table to join, so its votes are
+                # always checked against the catalog entry.
+                entry = None
+                if votes is not session:
+                    entry = EventService.get_catalog_entry(session, event_id)
+                    if entry is None:
+                        return False, "Event not found."
+
+                choice_id = EventService.insert_vote(
+                    votes, user_id, event_id, choice, entry
+                )
+                if choice_id is None:
+                    # Nothing was written, so only now pay for finding out why.
+                    votes.rollback()
+                    _, message = EventService.validate_vote(
+                        session, user_id, event_id, choice
+                    )
+                    return False, message or "Something wrong."
+
+                EventService.increment_vote_count(votes, event_id, choice_id)
+                votes.commit()
+
+                return True, "Successfully votes event"
+
+            except Exception:
+                votes.rollback()
+                return False, "Something wrong."
+
+    @staticmethod
+    def get_event_by_id(session: Session, event_id: UUID) -> Optional[Event]:
+        """
+        Retrieve event information based on event_id from database.
+
+        Args:
+            session (Session)  : Database session for operations.
+            event_id (UUID)    : ID of the event.
+
+        Returns:
+            Optional[Event]: The Event entity if found, otherwise None.
+        """
+        statment = select(Event).where(Event.id == event_id)
+        return session.exec(statment).first()
 
-        if not is_event:
-            return False, "Event not found."
+    @staticmethod
+    def list_events(
+        session: Session,
+        limit: int,
+        after: Optional[UUID] = None,
+        creator_id: Optional[UUID] = None,
+        status: Optional[Literal["active", "expired"]] = None,
+        expires_after: Optional[datetime] = None,
+        expires_before: Optional[datetime] = None,
+        after_expires_at: Optional[datetime] = None,
+    ) -> Tuple[List[Event], bool]:
+        """
+        Retrieve a page of events with their choices.
 
-        elif is_event.expires_at and datetime.now() > is_event.expires_at:
-            return False, "Voting for this event has ended."
+        Pages are keyset based: the next page starts after the last event of the
+        previous one, so every page costs the same however deep it is. Choices are
+        loaded with one `IN` query for the whole page instead of one lazy load per event.
 
-        choice_check = EventService.verify_choice(session, choice, event_id)
-        if not choice_check:
-            return False, "The selected choice does not exist for this event."
+        Events are ordered by id, or by (expires_at, id) when an expiry filter is given
+        without `creator_id`, so the page is read straight off `ix_event_expires_at_id`
+        instead of filtering or sorting the table. "active" pages list the events that
+        never expire first, by id. A creator's events are paged on
+        `ix_event_creator_id_id` whatever the filters.
 
-        if EventService.is_vote(session, user_id, event_id):
-            return False, "You have already voted in this event."
+        Args:
+            session (Session)                    : Database session for operations.
+            limit (int)                          : Maximum number of events returned.
+            after (Optional[UUID])               : Last event id of the previous page.
+            creator_id (Optional[UUID])          : Only events created by this user.
+            status (Optional[Literal])           : Only "active" or only "expired" events.
+            expires_after (Optional[datetime])   : Only events expiring at or after this.
+            expires_before (Optional[datetime])  : Only events expiring before this.
+            after_expires_at (Optional[datetime]): `expires_at` of the last event of the
+                                                   previous page.
+
+        Returns:
+            Tuple[List[Event], bool]: The events and whether more pages follow.
+        """
+        now = datetime.now()
+        statment = select(Event).options(selectinload(Event.choices))
+        if expires_before is not None:
+            statment = statment.where(Event.expires_at < expires_before)
+        if status == "expired":
+            statment = statment.where(Event.expires_at < now)
+
+        by_expiry = creator_id is None and (
+            status is not None
+            or expires_after is not None
+            or expires_before is not None
+        )
+        if not by_expiry:
+            if after is not None:
+                statment = statment.where(Event.id > after)
+            if creator_id is not None:
+                statment = statment.where(Event.creator_id == creator_id)
+            if expires_after is not None:
+                statment = statment.where(Event.expires_at >= expires_after)
+            if status == "active":
+                statment = statment.where(
+                    or_(Event.expires_at.is_(None), Event.expires_at >= now)
+                )
+
+            # One extra row tells whether another page follows.
+            events = session.exec(statment.order_by(Event.id).limit(limit + 1)).all()
+            return list(events[:limit]), len(events) > limit
+
+        events: List[Event] = []
+        undated = (
+            status == "active" and expires_after is None and expires_before is None
+        )
+        if undated and after_expires_at is None:
+            # Events without an expiry sort first, as NULLs do in the index.
+            undated_statment = statment.where(Event.expires_at.is_(None))
+            if after is not None:
+                undated_statment = undated_statment.where(Event.id > after)
+            events = list(
+                session.exec(undated_statment.order_by(Event.id).limit(limit + 1)).all()
+            )
+            after = None
+
+        if len(events) <= limit:
+            bounds = [expires_after, now if status == "active" else None]
+            lower = max((bound for bound in bounds if bound is not None), default=None)
+            if after is not None and after_expires_at is not None:
+                if lower is None or after_expires_at >= lower:
+                    # Only one lower bound, or SQLite stops seeking to the cursor.
+                    lower = None
+                    statment = statment.where(
+                        tuple_(Event.expires_at, Event.id)
+                        > tuple_(after_expires_at, after)
+                    )
+            if lower is not None:
+                statment = statment.where(Event.expires_at >= lower)
+
+            statment = statment.order_by(Event.expires_at, Event.id)
+            events += session.exec(statment.limit(limit + 1 - len(events))).all()
+
+        return events[:limit], len(events) > limit
+
+    @staticmethod
+    def get_catalog_entry(session: Session, event_id: UUID) -> Optional[CatalogEntry]:
+        """
+        Retrieve an event and its choices through the process-local catalog cache.
+
+        Args:
+            session (Session)  : Database session for operations.
+            event_id (UUID)    : ID of the event.
+
+        Returns:
+            Optional[CatalogEntry]: The catalog entry if the event is found, otherwise None.
+        """
+        entry = catalog_cache.get(event_id)
+        if entry is not None:
+            return entry
+
+        statment = (
+            select(
+                Event.title,
+                Event.desc,
+                Event.expires_at,
+                Event.creator_id,
+                Choice.id,
+                Choice.choice,
+            )
+            .outerjoin(Choice, Choice.event_id == Event.id)
+            .where(Event.id == event_id)
+        )
+        rows = session.exec(statment).all()
+        if not rows:
+            return None
+
+        title, desc, expires_at, creator_id, _, _ = rows[0]
+        entry = CatalogEntry(
+            title=title,
+            desc=desc,
+            expires_at=expires_at,
+            creator_id=creator_id,
+            choices={choice: choice_id for *_, choice_id, choice in rows if choice_id},
+        )
+        # Every event is created with its choices, so an entry without any is a read
+        # of a half-written event and must not outlive this request.
+        if entry.choices:
+            catalog_cache.set(event_id, entry)
+        return entry
+
+    @staticmethod
+    def get_event_results(session: Session, event_id: UUID) -> List[Tuple[str, int]]:
+        """
+        Retrieve the vote tally of an event from the shared results cache, from its
+        snapshot once the event is closed and frozen, or from the materialized counter
+        table when the cached tally is missing or outdated.
+
+        Args:
+            session (Session)  : Database session for operations.
+            event_id (UUID)    : ID of the event.
+
+        Returns:
+            List[Tuple[str, int]]: (choice, votes) pairs in creation order, empty if the event is not found.
+        """
+        version, results = get_results(event_id)
+        if results is not None:
+            return results
+
+        entry = EventService.get_catalog_entry(session, event_id)
+        if not entry:
+            return []
+
+        snapshot = (
+            session.get(ResultSnapshot, event_id)
+            if is_final(entry.expires_at)
+            else None
+        )
+        if snapshot is not None:
+            results = [(choice, votes) for choice, votes in snapshot.results]
+        else:
+            results = EventService.count_votes(session, event_id, entry)
+
+        cache_results(event_id, version, results)
+        return results
+
+    @staticmethod
+    def reconcile_vote_counts(session: Session, event_id: Optional[UUID] = None) -> int:
+        """
+        Rebuild the vote counters from the Vote table to repair any drift.
+
+        With vote shards, one event is rebuilt on its shard and all events on every
+        shard, one shard after the other.
+
+        Args:
+            session (Session)         : Database session for operations.
+            event_id (Optional[UUID]) : ID of the event to rebuild, all events if None.
+
+        Returns:
+            int: The number of counter rows written.
+        """
+
+        def rebuild(votes: Session) -> int:
+            clear_statment = delete(VoteCount)
+            count_statment = select(
+                Vote.choice_id, Vote.event_id, func.count(Vote.id)
+            ).group_by(Vote.choice_id, Vote.event_id)
+
+            if event_id:
+                clear_statment = clear_statment.where(VoteCount.event_id == event_id)
+                count_statment = count_statment.where(Vote.event_id == event_id)
+
+            try:
+                votes.exec(clear_statment)
+                track_vote_counts(votes, event_id)
+                result = votes.exec(
+                    insert(VoteCount).from_select(
+                        ["choice_id", "event_id", "count"], count_statment
+                    )
+                )
+                votes.commit()
+                return result.rowcount
+
+            except Exception:
+                votes.rollback()
+                raise
+
+        if event_id:
+            with vote_shards.vote_session(session, event_id) as votes:
+                return rebuild(votes)
+        return sum(vote_shards.scatter(session, rebuild))
+
+    @staticmethod
+    def list_closing_events(
+        session: Session, before: datetime
+    ) -> List[Tuple[UUID, datetime]]:
+        """
+        Retrieve the events expiring before a time whose results are not frozen yet.
+
+        Args:
+            session (Session)  : Database session for operations.
+            before (datetime)  : Only events expiring before this.
+
+        Returns:
+            List[Tuple[UUID, datetime]]: (event ID, expires_at) pairs, soonest first.
+        """
+        statment = (
+            select(Event.id, Event.expires_at)
+            .outerjoin(ResultSnapshot, ResultSnapshot.event_id == Event.id)
+            .where(Event.expires_at < before, ResultSnapshot.event_id.is_(None))
+            .order_by(Event.expires_at)
+        )
+        return list(session.exec(statment).all())
+
+    @staticmethod
+    def freeze_results(session: Session, event_id: UUID) -> Optional[ResultSnapshot]:
+        """
+        Compute the final tally of a closed event once and store it as its snapshot.
+
+        Freezing is idempotent, so several workers closing the same event keep the
+        snapshot written first.
+
+        Args:
+            session (Session)  : Database session for operations.
+            event_id (UUID)    : ID of the event.
+
+        Returns:
+            Optional[ResultSnapshot]: The snapshot, None if the event is not found or its
+                                      results are not final yet.
+        """
+        snapshot = session.get(ResultSnapshot, event_id)
+        if snapshot is not None:
+            return snapshot
+
+        entry = EventService.get_catalog_entry(session, event_id)
+        if not entry or not is_final(entry.expires_at):
+            return None
+
+        results = EventService.count_votes(session, event_id, entry)
+        snapshot = ResultSnapshot(
+            event_id=event_id,
+            results=[[choice, votes] for choice, votes in results],
+            total_votes=sum(votes for _, votes in results),
+        )
 
-        db_obj = Vote(user_id=user_id, event_id=event_id, choice_id=choice_check.id)
         try:
-            session.add(db_obj)
+            session.add(snapshot)
             session.commit()
-            session.refresh(db_obj)
-
-            return True, "Successfully votes event"
+            return snapshot
 
-        except Exception:
+        except IntegrityError:
             session.rollback()
-            return False, "Something wrong."
+            return session.get(ResultSnapshot, event_id)
 
-    def get_event_by_id(session: Session, event_id: UUID) -> Optional[Event]:
+    @staticmethod
+    def export_votes(
+        session: Session, event_id: UUID, chunk_size: int
+    ) -> Iterator[List[Tuple[UUID, int, Optional[datetime]]]]:
         """
-        Retrieve event information based on event_id from database.
+        Walk the votes of an event in id order, one bounded query per chunk.
+
+        Each chunk starts after the last id of the previous one and its read transaction
+        ends before the chunk is handed out, so memory stays at one chunk and no read
+        transaction stays open while the caller is slow (an open SQLite reader keeps the
+        WAL from being checkpointed).
 
         Args:
             session (Session)  : Database session for operations.
             event_id (UUID)    : ID of the event.
+            chunk_size (int)   : Maximum number of votes per chunk.
 
-        Returns:
-            Optional[Event]: The Event entity if found, otherwise None.
+        Yields:
+            List[Tuple[UUID, int, Optional[datetime]]]: (user_id, choice_id, time_logs) rows.
         """
-        statment = select(Event).where(Event.id == event_id)
-        return session.exec(statment).first()
+        after = 0
+        with vote_shards.vote_session(session, event_id) as votes:
+            while True:
+                statment = (
+                    select(Vote.id, Vote.user_id, Vote.choice_id, Vote.time_logs)
+                    .where(Vote.event_id == event_id, Vote.id > after)
+                    .order_by(Vote.id)
+                    .limit(chunk_size)
+                )
+                rows = votes.exec(statment).all()
+                votes.rollback()
+                if not rows:
+                    return
+
+                after = rows[-1][0]
+                yield [
+                    (user_id, choice_id, time_logs)
+                    for _, user_id, choice_id, time_logs in rows
+                ]
+                if len(rows) < chunk_size:
+                    return
 
     # UTILS -------------------------------------------------------------------------
+    @staticmethod
+    def insert_vote(
+        session: Session,
+        user_id: UUID,
+        event_id: UUID,
+        choice: str,
+        entry: Optional[CatalogEntry] = None,
+    ) -> Optional[int]:
+        """
+        Validate and insert a vote with a single `INSERT ... ON CONFLICT DO NOTHING`.
+
+        With the event in the catalog cache the choice and expiry are checked in memory
+        and the row is inserted directly. Otherwise the row is selected from `choice`
+        joined to `event`, so an unknown choice or an expired event inserts nothing.
+        `uix_user_event` turns a repeated vote into a no-op instead of an error.
+
+        Only supported on the dialects in `UPSERT_DIALECTS`.
+
+        Args:
+            session (Session)              : Database session for operations.
+            user_id (UUID)                 : ID of the user votes the event.
+            event_id (UUID)                : ID of the event.
+            choice (str)                   : The choice user choose.
+            entry (Optional[CatalogEntry]) : Catalog entry of the event if already known.
+
+        Returns:
+            Optional[int]: The choice ID if the vote was inserted, otherwise None.
+        """
+        upsert = UPSERT_DIALECTS[session.get_bind().dialect.name]
+        entry = entry or catalog_cache.get(event_id)
+
+        if entry is not None:
+            choice_id = entry.choices.get(choice)
+            if choice_id is None or (
+                entry.expires_at and datetime.now() > entry.expires_at
+            ):
+                return None
+
+            statment = upsert(Vote).values(
+                user_id=user_id, event_id=event_id, choice_id=choice_id
+            )
+        else:
+            source = (
+                select(
+                    literal(user_id, Vote.__table__.c.user_id.type),
+                    Choice.event_id,
+                    Choice.id,
+                )
+                .join(Event, Event.id == Choice.event_id)
+                .where(
+                    Choice.event_id == event_id,
+                    Choice.choice == choice,
+                    or_(Event.expires_at.is_(None), Event.expires_at >= datetime.now()),
+                )
+            )
+            statment = upsert(Vote).from_select(
+                ["user_id", "event_id", "choice_id"], source
+            )
+
+        statment = statment.on_conflict_do_nothing(
+            index_elements=["user_id", "event_id"]
+        ).returning(Vote.choice_id)
+        return session.exec(statment).scalar_one_or_none()
+
+    @staticmethod
+    def validate_vote(
+        session: Session, user_id: UUID, event_id: UUID, choice: str
+    ) -> Tuple[Optional[int], str]:
+        """
+        Run the read-only checks a vote must pass before it is written.
+
+        Args:
+            session (Session)  : Database session for operations.
+            user_id (UUID)     : ID of the user votes the event.
+            event_id (UUID)    : ID of the event.
+            choice (str)       : The choice user choose.
+
+        Returns:
+            Tuple[Optional[int], str]:
+                - The choice ID and an empty message if the vote may be written.
+                - `None` and an error message if any validation fails.
+        """
+        entry = EventService.get_catalog_entry(session, event_id)
+
+        if not entry:
+            return None, "Event not found."
+
+        elif entry.expires_at and datetime.now() > entry.expires_at:
+            return None, "Voting for this event has ended."
+
+        choice_id = entry.choices.get(choice)
+        if choice_id is None:
+            return None, "The selected choice does not exist for this event."
+
+        if EventService.is_vote(session, user_id, event_id):
+            return None, "You have already voted in this event."
+
+        return choice_id, ""
+
     @staticmethod
     def verify_choice(
         session: Session, event_id: UUID, choice: str
@@ -148,7 +691,7 @@ class EventService:
     @staticmethod
     def is_vote(session: Session, user_id: UUID, event_id: UUID) -> Optional[Vote]:
         """
-        Verify is a user already vote or not.
+        Verify is a user already vote or not, on the shard of the event if sharded.
 
         Args:
             session (Session) : Database session for operations.
@@ -161,4 +704,68 @@ class EventService:
         statment = select(Vote).where(
             Vote.user_id == user_id, Vote.event_id == event_id
         )
-        return session.exec(statment).first()
+        with vote_shards.vote_session(session, event_id) as votes:
+            return votes.exec(statment).first()
+
+    @staticmethod
+    def increment_vote_count(
+        session: Session, event_id: UUID, choice_id: int, amount: int = 1
+    ) -> None:
+        """
+        Bump the counter of a choice inside the caller's transaction.
+
+        Uses a single upsert on SQLite and PostgreSQL, falling back to update-then-insert elsewhere.
+
+        Args:
+            session (Session)  : Database session for operations.
+            event_id (UUID)    : ID of the event.
+            choice_id (int)    : ID of the choice.
+            amount (int)       : Number of votes to add.
+        """
+        track_vote_counts(session, event_id, amount)
+
+        dialect = session.get_bind().dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            upsert = sqlite_insert if dialect == "sqlite" else pg_insert
+            statment = (
+                upsert(VoteCount)
+                .values(choice_id=choice_id, event_id=event_id, count=amount)
+                .on_conflict_do_update(
+                    index_elements=["choice_id"],
+                    set_={"count": VoteCount.count + amount},
+                )
+            )
+            session.exec(statment)
+            return
+
+        statment = (
+            update(VoteCount)
+            .where(VoteCount.choice_id == choice_id)
+            .values(count=VoteCount.count + amount)
+        )
+        if session.exec(statment).rowcount == 0:
+            session.add(VoteCount(choice_id=choice_id, event_id=event_id, count=amount))
+
+    @staticmethod
+    def count_votes(
+        session: Session, event_id: UUID, entry: CatalogEntry
+    ) -> List[Tuple[str, int]]:
+        """
+        Read the tally of an event from its materialized counters.
+
+        Args:
+            session (Session)    : Database session for operations.
+            event_id (UUID)      : ID of the event.
+            entry (CatalogEntry) : Catalog entry of the event.
+
+        Returns:
+            List[Tuple[str, int]]: (choice, votes) pairs in creation order.
+        """
+        statment = select(VoteCount.choice_id, VoteCount.count).where(
+            VoteCount.event_id == event_id
+        )
+        with vote_shards.vote_session(session, event_id) as votes:
+            counts = dict(votes.exec(statment).all())
+
+        choices = sorted(entry.choices.items(), key=lambda item: item[1])
+        return [(choice, counts.get(choice_id, 0)) for choice, choice_id in choices]
@@ -0,0 +1,133 @@
+"""
+Background freezing of the final results of expiring events.
+
+An event closes `RESULTS_FINAL_GRACE_SECONDS` after its `expires_at` (the grace covers
+votes accepted before the deadline and committed after it). The scheduler keeps a
+min-heap of upcoming close times and, at each one, computes the event's tally once and
+writes it to `result_snapshot`, which every later result read uses.
+
+The heap is filled by a scan of the events expiring within the next two
+`EXPIRY_RESCAN_SECONDS` that have no snapshot yet, repeated every
+`EXPIRY_RESCAN_SECONDS`. The first scan at startup catches up on events that closed
+while the app was down, and the rescans pick up events created since, in any worker.
+Every worker runs its own scheduler; the first snapshot written for an event wins.
+
+Classes:
+- ExpiryScheduler: Heap of close times and the task freezing results.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional, Set, Tuple
+from uuid import UUID
+
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import Session
+
+from app.config import config
+from app.databases.database import engine
+
+from .event_service import EventService
+
+logger = logging.getLogger(__name__)
+
+
+class ExpiryScheduler:
+
+    def __init__(self, rescan_seconds: float, grace_seconds: float):
+        self.rescan = rescan_seconds
+        self.grace = timedelta(seconds=grace_seconds)
+        self._heap: List[Tuple[datetime, UUID]] = []
+        self._scheduled: Set[UUID] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the scheduler task on the running event loop."""
+        if self.running:
+            return
+
+        self._task = asyncio.create_task(self._run(), name="expiry-scheduler")
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._heap.clear()
+        self._scheduled.clear()
+
+    def pending(self) -> int:
+        """Number of events waiting in the heap."""
+        return len(self._heap)
+
+    def load(self) -> List[Tuple[UUID, datetime]]:
+        """Events closing before the next two scans whose results are not frozen."""
+        before = datetime.now() + timedelta(seconds=2 * self.rescan) - self.grace
+        with Session(engine) as session:
+            return EventService.list_closing_events(session, before)
+
+    @staticmethod
+    def freeze(event_ids: List[UUID]) -> int:
+        """Freeze the results of closed events, returning how many were written."""
+        frozen = 0
+        with Session(engine) as session:
+            for event_id in event_ids:
+                try:
+                    if EventService.freeze_results(session, event_id) is not None:
+                        frozen += 1
+                except Exception:
+                    session.rollback()
+                    logger.exception("Failed to freeze results of event %s", event_id)
+        return frozen
+
+    async def _run(self) -> None:
+        next_scan = time.monotonic()
+        while True:
+            try:
+                if time.monotonic() >= next_scan:
+                    next_scan = time.monotonic() + self.rescan
+                    for event_id, expires_at in await run_in_threadpool(self.load):
+                        if event_id not in self._scheduled:
+                            self._scheduled.add(event_id)
+                            heapq.heappush(
+                                self._heap, (expires_at + self.grace, event_id)
+                            )
+
+                due: List[UUID] = []
+                while self._heap and self._heap[0][0] < datetime.now():
+                    _, event_id = heapq.heappop(self._heap)
+                    self._scheduled.discard(event_id)
+                    due.append(event_id)
+
+                if due:
+                    frozen = await run_in_threadpool(self.freeze, due)
+                    logger.info("Froze the results of %d closed event(s)", frozen)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # A failed scan is retried at the next one; unfrozen events are found again.
+                logger.exception("Expiry scheduler iteration failed")
+
+            wait = next_scan - time.monotonic()
+            if self._heap:
+                until_close = (self._heap[0][0] - datetime.now()).total_seconds()
+                wait = min(wait, until_close)
+            await asyncio.sleep(max(wait, 0.01))
+
+
+expiry_scheduler = ExpiryScheduler(
+    config.EXPIRY_RESCAN_SECONDS, config.RESULTS_FINAL_GRACE_SECONDS
+)
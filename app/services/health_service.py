@@ -0,0 +1,138 @@
+"""
+Readiness checks for the database behind the app.
+
+Functions:
+- pool_stats       : Occupancy of the engine's connection pool.
+- database_latency : Time a trivial query takes, skipped when the pool is exhausted.
+- wal_size         : Size of the SQLite write-ahead log file.
+- readiness        : Run every check and compare it with the `HEALTH_*` thresholds.
+"""
+
+import os
+import time
+from typing import Optional
+
+from sqlalchemy import Engine, text
+
+from app.config import config
+from app.schemas import PoolStats, ReadinessStatus
+from app.utils.metrics import recent_commit_seconds
+
+
+class HealthService:
+
+    @staticmethod
+    def pool_stats(engine: Engine) -> Optional[PoolStats]:
+        """
+        Report how many pooled connections are in use.
+
+        Args:
+            engine (Engine): Engine whose pool is inspected.
+
+        Returns:
+            Optional[PoolStats]: Pool occupancy, None for pools without a size (e.g. in-memory SQLite).
+        """
+        pool = engine.pool
+        if not hasattr(pool, "checkedout"):
+            return None
+
+        max_overflow = getattr(pool, "_max_overflow", 0)
+        return PoolStats(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            capacity=pool.size() + max_overflow if max_overflow >= 0 else None,
+        )
+
+    @staticmethod
+    def database_latency(engine: Engine) -> float:
+        """
+        Time a `SELECT 1` on a pooled connection.
+
+        Args:
+            engine (Engine): Engine to query.
+
+        Returns:
+            float: Round trip in seconds, including the connection checkout.
+
+        Raises:
+            Exception: Any error raised while connecting or querying.
+        """
+        started = time.perf_counter()
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        return time.perf_counter() - started
+
+    @staticmethod
+    def wal_size(engine: Engine) -> Optional[int]:
+        """
+        Size of the write-ahead log of a file-backed SQLite database.
+
+        Args:
+            engine (Engine): Engine whose database is inspected.
+
+        Returns:
+            Optional[int]: Bytes in the `-wal` file, None for other databases.
+        """
+        url = engine.url
+        if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+            return None
+
+        try:
+            return os.path.getsize(f"{url.database}-wal")
+        except OSError:
+            return 0
+
+    @staticmethod
+    def readiness(engine: Engine) -> ReadinessStatus:
+        """
+        Check the database and pool against the configured thresholds.
+
+        The timed query is skipped when every pooled connection is checked out, so
+        the probe reports the exhausted pool instead of queueing behind it. Commits
+        are judged on the p95 of the last `HEALTH_COMMIT_WINDOW_SECONDS`, so one slow
+        maintenance commit (a reconcile, a results freeze) does not fail the probe
+        for good.
+
+        Args:
+            engine (Engine): Engine serving the app's requests.
+
+        Returns:
+            ReadinessStatus: The measurements and every threshold they exceed.
+        """
+        problems = []
+
+        pool = HealthService.pool_stats(engine)
+        bounded = pool is not None and pool.capacity is not None
+        if bounded and pool.checked_out >= pool.capacity * config.HEALTH_MAX_POOL_USAGE:
+            problems.append(f"pool usage {pool.checked_out}/{pool.capacity}")
+
+        latency = None
+        if bounded and pool.checked_out >= pool.capacity:
+            problems.append("pool exhausted, database check skipped")
+        else:
+            try:
+                latency = HealthService.database_latency(engine) * 1000
+            except Exception as exc:
+                problems.append(f"database unavailable: {type(exc).__name__}")
+
+        if latency is not None and latency > config.HEALTH_MAX_DB_LATENCY_MS:
+            problems.append(f"database latency {latency:.1f} ms")
+
+        wal_bytes = HealthService.wal_size(engine)
+        if wal_bytes is not None and wal_bytes > config.HEALTH_MAX_WAL_BYTES:
+            problems.append(f"WAL size {wal_bytes} bytes")
+
+        commit = recent_commit_seconds(config.HEALTH_COMMIT_WINDOW_SECONDS)
+        commit_ms = commit * 1000 if commit is not None else None
+        if commit_ms is not None and commit_ms > config.HEALTH_MAX_COMMIT_MS:
+            problems.append(f"commit p95 {commit_ms:.1f} ms")
+
+        return ReadinessStatus(
+            ready=not problems,
+            db_latency_ms=round(latency, 2) if latency is not None else None,
+            pool=pool,
+            wal_bytes=wal_bytes,
+            commit_p95_ms=round(commit_ms, 2) if commit_ms is not None else None,
+            problems=problems,
+        )
@@ -0,0 +1,168 @@
+"""
+In-process pub/sub of live event results.
+
+Every streaming client of an event subscribes to one topic. A single ticker per
+topic checks the event's vote version in `shared_state` every `STREAM_TICK_MS` and,
+only when it moved, computes the tally once and hands it to every subscriber. So
+10k subscribers of one event cost one computation per tick, and a quiet event costs
+one version lookup per tick.
+
+Subscribers keep only the latest tally: a slow client skips intermediate updates
+instead of queueing them.
+
+Classes:
+- ResultsBroadcaster: Topics, subscriptions and the per-topic tickers.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Optional, Set
+from uuid import UUID
+
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import Session
+
+from app.config import config
+from app.databases.database import engine
+from app.schemas import ChoiceResult, EventResults
+from app.utils import vote_version
+
+from .event_service import EventService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Topic:
+    """Subscribers of one event and the last tally sent to them."""
+
+    subscribers: Set[asyncio.Queue] = field(default_factory=set)
+    version: Optional[tuple] = None
+    payload: Optional[str] = None
+    ticker: Optional[asyncio.Task] = None
+
+
+class ResultsBroadcaster:
+
+    def __init__(self, tick_ms: int, heartbeat_seconds: float):
+        self.tick = tick_ms / 1000
+        self.heartbeat = heartbeat_seconds
+        self._topics: Dict[UUID, Topic] = {}
+
+    @staticmethod
+    def load_results(event_id: UUID) -> Optional[str]:
+        """
+        Compute the tally of an event as `EventResults` JSON.
+
+        Args:
+            event_id (UUID): ID of the event.
+
+        Returns:
+            Optional[str]: The serialized tally, None if the event is not found.
+        """
+        with Session(engine) as session:
+            tally = EventService.get_event_results(session, event_id)
+
+        if not tally:
+            return None
+
+        return EventResults(
+            total_votes=sum(votes for _, votes in tally),
+            results=[
+                ChoiceResult(choice=choice, votes=votes) for choice, votes in tally
+            ],
+        ).model_dump_json()
+
+    def latest(self, event_id: UUID) -> Optional[str]:
+        """Last tally sent to the subscribers of an event, if it has any."""
+        topic = self._topics.get(event_id)
+        return topic.payload if topic else None
+
+    def subscriber_count(self, event_id: Optional[UUID] = None) -> int:
+        """Number of subscribers of one event, or of every event."""
+        if event_id is not None:
+            topic = self._topics.get(event_id)
+            return len(topic.subscribers) if topic else 0
+
+        return sum(len(topic.subscribers) for topic in self._topics.values())
+
+    @asynccontextmanager
+    async def subscribe(self, event_id: UUID) -> AsyncIterator[asyncio.Queue]:
+        """
+        Subscribe to the tallies of an event for the duration of the context.
+
+        Yields:
+            asyncio.Queue: Holds at most the latest serialized tally.
+        """
+        topic = self._topics.get(event_id)
+        if topic is None:
+            topic = self._topics[event_id] = Topic()
+            topic.ticker = asyncio.create_task(self._run(event_id, topic))
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        if topic.payload is not None:
+            queue.put_nowait(topic.payload)
+        topic.subscribers.add(queue)
+
+        try:
+            yield queue
+        finally:
+            topic.subscribers.discard(queue)
+            if not topic.subscribers and self._topics.get(event_id) is topic:
+                del self._topics[event_id]
+                topic.ticker.cancel()
+
+    async def stream(self, event_id: UUID, initial: str) -> AsyncIterator[str]:
+        """
+        Server-sent events of an event's tally, starting with `initial`.
+
+        Sends a `results` event on every change and a comment line as heartbeat
+        when nothing changed for `STREAM_HEARTBEAT_SECONDS`.
+        """
+        last = initial
+        yield f"event: results\ndata: {initial}\n\n"
+
+        async with self.subscribe(event_id) as queue:
+            while True:
+                try:
+                    async with asyncio.timeout(self.heartbeat):
+                        payload = await queue.get()
+                except TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+
+                if payload != last:
+                    last = payload
+                    yield f"event: results\ndata: {payload}\n\n"
+
+    async def _run(self, event_id: UUID, topic: Topic) -> None:
+        while True:
+            try:
+                version = await run_in_threadpool(vote_version, event_id)
+                if version != topic.version:
+                    payload = await run_in_threadpool(self.load_results, event_id)
+                    topic.version = version
+                    if payload is not None:
+                        topic.payload = payload
+                        self._publish(topic, payload)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Failed to refresh results of event %s", event_id)
+
+            await asyncio.sleep(self.tick)
+
+    @staticmethod
+    def _publish(topic: Topic, payload: str) -> None:
+        for queue in topic.subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(payload)
+
+
+results_broadcaster = ResultsBroadcaster(
+    config.STREAM_TICK_MS, config.STREAM_HEARTBEAT_SECONDS
+)
@@ -4,6 +4,7 @@ CRUD operations for Users entities using SQLModel.
 Functions:
 - create_user         : Add a new User to the database.
 - login_user          : Authenticate a User and return an access token.
+- issue_token         : Create the access token of an authenticated User.
 - get_user_by_id      : Retrieve a User by id.
 - get_user_by_username: Retrieve a User by username.
 
@@ -12,6 +13,7 @@ Handles SQLAlchemy exceptions with transaction rollback and logs errors.
 
 from datetime import timedelta
 from typing import Optional
+from uuid import UUID
 
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.exc import IntegrityError
@@ -26,13 +28,17 @@ from app.utils import AuthUtils
 class UserService:
 
     @staticmethod
-    def create_user(session: Session, user: UserCreate) -> bool:
+    def create_user(
+        session: Session, user: UserCreate, hashed_password: Optional[str] = None
+    ) -> bool:
         """
         Create a new user in the database.
 
         Args:
-            session (Session): Database session for operations.
-            user (UserCreate): User data to be created.
+            session (Session)              : Database session for operations.
+            user (UserCreate)              : User data to be created.
+            hashed_password (Optional[str]): Password already hashed by the caller,
+                                             hashed inline when not given.
 
         Returns:
             bool: True if user was created successfully, False if email or username already exists.
@@ -40,7 +46,10 @@ class UserService:
 
         db_obj = Users.model_validate(
             user,
-            update={"password": AuthUtils.encrypted_password(user.password)},
+            update={
+                "password": hashed_password
+                or AuthUtils.encrypted_password(user.password)
+            },
         )
 
         try:
@@ -71,8 +80,21 @@ class UserService:
         if not user or not AuthUtils.verify_password(user_data.password, user.password):
             return None
 
+        return UserService.issue_token(user.id)
+
+    @staticmethod
+    def issue_token(user_id: UUID) -> str:
+        """
+        Create the access token of an authenticated user.
+
+        Args:
+            user_id (UUID): The ID of the authenticated user.
+
+        Returns:
+            str: The encoded JWT access token.
+        """
         access_token_expires = timedelta(minutes=config.ACCESS_TOKEN_EXPIRE_MINUTES)
-        return AuthUtils.login_token(user.id, access_token_expires)
+        return AuthUtils.login_token(user_id, access_token_expires)
 
     # UTILS -------------------------------------------------------------------------
     @staticmethod
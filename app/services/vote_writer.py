@@ -0,0 +1,272 @@
+"""
+Write-behind ingestion pipeline for Vote entities.
+
+Accepted votes are put on an in-process queue and a background thread flushes them
+in batches: one multi-row INSERT and one commit per batch instead of one per vote.
+Each request waits on a future that resolves to the same (success, message) tuple
+`EventService.create_vote` returns, so routes map outcomes exactly as before.
+With vote shards, a batch is split and written as one transaction per shard.
+
+A request that stops waiting after `VOTE_WRITE_TIMEOUT_SECONDS` cancels its vote,
+which the writer then skips. A vote already being flushed cannot be cancelled, and
+the request answers that its outcome is unknown instead of reporting a failure.
+
+Classes:
+- VoteWriter: Queue and background writer, enabled with `VOTE_WRITE_BEHIND`.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, TimeoutError
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, insert, select
+
+from app.config import config
+from app.databases import vote_shards
+from app.models import Vote
+
+from .event_service import EventService
+
+logger = logging.getLogger(__name__)
+
+SUCCESS = "Successfully votes event"
+ALREADY_VOTED = "You have already voted in this event."
+FAILED = "Something wrong."
+UNKNOWN = "Your vote may still be recorded."
+
+
+@dataclass
+class PendingVote:
+    """A validated vote waiting to be flushed, with the future its request waits on."""
+
+    user_id: UUID
+    event_id: UUID
+    choice_id: int
+    future: Future = field(default_factory=Future)
+
+
+class VoteWriter:
+
+    def __init__(self, batch_size: int, batch_interval_ms: int):
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval_ms / 1000
+        self._queue: "queue.Queue[Optional[PendingVote]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._engine: Optional[Engine] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, engine: Engine) -> None:
+        """Start the background writer thread against the given engine."""
+        if self.running:
+            return
+
+        self._engine = engine
+        self._thread = threading.Thread(
+            target=self._run, name="vote-writer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Flush everything already queued, then stop the writer thread."""
+        if not self.running:
+            return
+
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def submit(self, user_id: UUID, event_id: UUID, choice_id: int) -> Future:
+        """Queue a validated vote and return the future of its outcome."""
+        pending = PendingVote(user_id=user_id, event_id=event_id, choice_id=choice_id)
+        self._queue.put(pending)
+        return pending.future
+
+    def create_vote(
+        self, session: Session, user_id: UUID, event_id: UUID, choice: str
+    ) -> Tuple[bool, str]:
+        """
+        Validate a vote on the request's session, then hand the insert to the writer.
+
+        Args:
+            session (Session)  : Database session for the read-only checks.
+            user_id (UUID)     : ID of the user votes the event.
+            event_id (UUID)    : ID of the event.
+            choice (str)       : The choice user choose.
+
+        Returns:
+            Tuple[bool, str]: Same outcomes as `EventService.create_vote`.
+        """
+        choice_id, message = EventService.validate_vote(
+            session, user_id, event_id, choice
+        )
+        if choice_id is None:
+            return False, message
+
+        # Release the pooled connection while the request waits on the batch.
+        session.close()
+
+        future = self.submit(user_id, event_id, choice_id)
+        try:
+            return future.result(timeout=config.VOTE_WRITE_TIMEOUT_SECONDS)
+        except TimeoutError:
+            return self.abandon(future)
+
+    @staticmethod
+    def abandon(future: Future) -> Tuple[bool, str]:
+        """
+        Give up on a vote whose request stopped waiting for it.
+
+        Args:
+            future (Future): The future returned by `submit`.
+
+        Returns:
+            Tuple[bool, str]: `FAILED` if the vote was cancelled before the writer took
+                              it, its outcome if it was settled meanwhile, otherwise
+                              `UNKNOWN` as it may still commit.
+        """
+        if future.cancel():
+            return False, FAILED
+        if future.done():
+            return future.result()
+        return False, UNKNOWN
+
+    # WRITER ------------------------------------------------------------------------
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                break
+
+            batch = [first]
+            deadline = time.monotonic() + self.batch_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                try:
+                    item = (
+                        self._queue.get(timeout=timeout)
+                        if timeout > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._flush(batch)
+
+    def _flush(self, batch: List[PendingVote]) -> None:
+        """Write one batch in a transaction per shard and resolve every future."""
+        accepted: Dict[Engine, List[PendingVote]] = {}
+        seen = set()
+        for vote in batch:
+            # Skips votes cancelled by a timed out request; the rest can't be cancelled.
+            if not vote.future.set_running_or_notify_cancel():
+                continue
+
+            key = (vote.user_id, vote.event_id)
+            if key in seen:
+                vote.future.set_result((False, ALREADY_VOTED))
+                continue
+            seen.add(key)
+
+            engine = (
+                vote_shards.engine_for(vote.event_id)
+                if vote_shards.enabled
+                else self._engine
+            )
+            accepted.setdefault(engine, []).append(vote)
+
+        for engine, votes in accepted.items():
+            self._flush_shard(engine, votes)
+
+    def _flush_shard(self, engine: Engine, accepted: List[PendingVote]) -> None:
+        fresh: List[PendingVote] = []
+        with Session(engine) as session:
+            try:
+                statment = select(Vote.user_id, Vote.event_id).where(
+                    Vote.user_id.in_({vote.user_id for vote in accepted}),
+                    Vote.event_id.in_({vote.event_id for vote in accepted}),
+                )
+                existing = set(session.exec(statment).all())
+
+                for vote in accepted:
+                    if (vote.user_id, vote.event_id) in existing:
+                        vote.future.set_result((False, ALREADY_VOTED))
+                    else:
+                        fresh.append(vote)
+
+                if not fresh:
+                    return
+
+                self._insert(session, fresh)
+                session.commit()
+
+            except IntegrityError:
+                # Lost a race with a vote written outside the batch; settle one by one.
+                session.rollback()
+                for vote in fresh:
+                    vote.future.set_result(self._flush_one(session, vote))
+                return
+
+            except Exception:
+                # `accepted`, not `fresh`: the duplicate check itself may have failed.
+                session.rollback()
+                logger.exception("Failed to flush a batch of %d votes", len(accepted))
+                for vote in accepted:
+                    if not vote.future.done():
+                        vote.future.set_result((False, FAILED))
+                return
+
+        for vote in fresh:
+            vote.future.set_result((True, SUCCESS))
+
+    def _flush_one(self, session: Session, vote: PendingVote) -> Tuple[bool, str]:
+        try:
+            self._insert(session, [vote])
+            session.commit()
+            return True, SUCCESS
+
+        except IntegrityError:
+            session.rollback()
+            return False, ALREADY_VOTED
+
+        except Exception:
+            session.rollback()
+            return False, FAILED
+
+    @staticmethod
+    def _insert(session: Session, votes: List[PendingVote]) -> None:
+        session.exec(
+            insert(Vote).values(
+                [
+                    {
+                        "user_id": vote.user_id,
+                        "event_id": vote.event_id,
+                        "choice_id": vote.choice_id,
+                    }
+                    for vote in votes
+                ]
+            )
+        )
+
+        tally = Counter((vote.event_id, vote.choice_id) for vote in votes)
+        for (event_id, choice_id), amount in tally.items():
+            EventService.increment_vote_count(session, event_id, choice_id, amount)
+
+
+vote_writer = VoteWriter(config.VOTE_BATCH_SIZE, config.VOTE_BATCH_INTERVAL_MS)
@@ -1,3 +1,78 @@
 from .auth_utils import AuthUtils
+from .cache import LRUCache
+from .catalog_cache import CatalogEntry, catalog_cache, invalidate_event
+from .fast_json import (
+    default_response_class,
+    feedback_response,
+    model_response,
+)
+from .hash_pool import HashPoolBusy, password_hasher
+from .http_cache import (
+    cached_results,
+    conditional_response,
+    encode_response,
+    info_cache_control,
+    is_final,
+    response_cache,
+    results_cache_control,
+)
+from .principal_cache import invalidate_principal, principal_cache
+from .rate_limit import RateLimiter, login_rate_limiter
+from .results_cache import (
+    cache_results,
+    get_results,
+    track_vote_counts,
+    vote_version,
+)
+from .shared_state import (
+    MemoryBackend,
+    RedisBackend,
+    SharedCache,
+    SharedStateBackend,
+    create_backend,
+    shared_state,
+)
+from .vote_export import (
+    EXPORT_MEDIA_TYPES,
+    accepts_gzip,
+    encode_votes,
+    gzip_stream,
+)
 
-__all__ = ["AuthUtils"]
+__all__ = [
+    "AuthUtils",
+    "LRUCache",
+    "CatalogEntry",
+    "catalog_cache",
+    "invalidate_event",
+    "default_response_class",
+    "feedback_response",
+    "model_response",
+    "HashPoolBusy",
+    "password_hasher",
+    "response_cache",
+    "encode_response",
+    "cached_results",
+    "conditional_response",
+    "info_cache_control",
+    "is_final",
+    "results_cache_control",
+    "principal_cache",
+    "invalidate_principal",
+    "RateLimiter",
+    "login_rate_limiter",
+    "track_vote_counts",
+    "vote_version",
+    "get_results",
+    "cache_results",
+    "SharedStateBackend",
+    "MemoryBackend",
+    "RedisBackend",
+    "SharedCache",
+    "create_backend",
+    "shared_state",
+    "EXPORT_MEDIA_TYPES",
+    "accepts_gzip",
+    "encode_votes",
+    "gzip_stream",
+]
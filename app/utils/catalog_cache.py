@@ -0,0 +1,74 @@
+"""
+Process-local cache of the event catalog used to validate votes.
+
+An event and its choices do not change once `EventService.create_event` commits,
+so each vote re-reading them is wasted work. `catalog_cache` maps an event ID to a
+`CatalogEntry` holding what vote validation and `GET /event/{id}` need. It is bounded
+by `CATALOG_CACHE_SIZE` with LRU eviction.
+
+Invalidation:
+- ORM inserts, updates and deletes of `Event` or `Choice` are noted at flush time
+  and drop the event's entry once the transaction commits, so a read racing the
+  transaction cannot cache the event as it was before the commit.
+- Code that changes events with Core statements must call `invalidate_event`.
+- Both also drop the event's encoded reads from `response_cache`.
+- Entries are only cached with their choices (see `EventService.get_catalog_entry`).
+"""
+
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import config
+from app.models import Choice, Event
+
+from .cache import LRUCache
+from .http_cache import response_cache
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """Immutable snapshot of an event and its choice texts mapped to choice IDs."""
+
+    title: str
+    desc: Optional[str]
+    expires_at: Optional[datetime]
+    creator_id: uuid.UUID
+    choices: Dict[str, int]
+
+
+PENDING_KEY = "changed_events"
+
+catalog_cache: LRUCache[CatalogEntry] = LRUCache(config.CATALOG_CACHE_SIZE)
+
+
+def invalidate_event(event_id: uuid.UUID) -> None:
+    """Drop the cached catalog entry and encoded reads of an event."""
+    catalog_cache.delete(event_id)
+    response_cache.delete(("info", event_id))
+    response_cache.delete(("results", event_id))
+
+
+@event.listens_for(Session, "after_flush")
+def _note_changed_events(session: Session, flush_context) -> None:
+    changed = session.info.setdefault(PENDING_KEY, set())
+    for target in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(target, Event):
+            changed.add(target.id)
+        elif isinstance(target, Choice):
+            changed.add(target.event_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_events(session: Session) -> None:
+    for event_id in session.info.pop(PENDING_KEY, ()):
+        invalidate_event(event_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_events(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
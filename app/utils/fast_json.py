@@ -0,0 +1,113 @@
+"""
+Opt-in fast JSON responses, enabled with `FAST_JSON`.
+
+A route that returns a model under a `response_model` pays three times per request:
+FastAPI validates the model again against the response field, turns it into plain
+data with `jsonable_encoder`, and `JSONResponse` encodes that with `json.dumps`.
+With `FAST_JSON`:
+- Routes returning a model they just built send `model.model_dump_json()`, encoded
+  in one pass by pydantic-core, as a `Response`, which FastAPI sends untouched.
+- Fixed `Feedback` messages such as "Successfully votes event" are encoded once and
+  their bytes reused.
+- `ORJSONResponse` is the default response class of the remaining routes, or a
+  compact stdlib encoder without the `orjson` package.
+
+`response_model` stays declared on every route, so the OpenAPI schema is unchanged.
+Without `FAST_JSON` the helpers return the model as before.
+
+Classes:
+- CompactJSONResponse: `JSONResponse` without whitespace, the fallback of `orjson`.
+
+Functions:
+- default_response_class: Default response class of the app.
+- model_response        : A validated model as a response, encoded once.
+- feedback_response     : A `Feedback` message as a response, from its cached bytes.
+"""
+
+import functools
+import importlib.util
+import json
+import logging
+from typing import Any, Type, Union
+
+from fastapi import Response
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel
+
+from app.config import config
+from app.schemas import Feedback
+
+logger = logging.getLogger(__name__)
+
+
+class CompactJSONResponse(JSONResponse):
+
+    def render(self, content: Any) -> bytes:
+        return json.dumps(
+            content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode()
+
+
+def default_response_class() -> Type[JSONResponse]:
+    """`ORJSONResponse` with `FAST_JSON` and `orjson` installed, else a stdlib class."""
+    if not config.FAST_JSON:
+        return JSONResponse
+
+    if importlib.util.find_spec("orjson") is None:
+        logger.warning(
+            "FAST_JSON is set without the `orjson` package, using stdlib json"
+        )
+        return CompactJSONResponse
+
+    return ORJSONResponse
+
+
+def model_response(
+    model: BaseModel, status_code: int = 200
+) -> Union[BaseModel, Response]:
+    """
+    Send a model the route just built without validating it again.
+
+    Args:
+        model (BaseModel): Response model, already validated on construction.
+        status_code (int): Status code of the response, as declared on the route.
+
+    Returns:
+        Union[BaseModel, Response]: The encoded response with `FAST_JSON`, else the model.
+    """
+    if not config.FAST_JSON:
+        return model
+
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _feedback_body(message: str) -> bytes:
+    return Feedback(detail=message).model_dump_json().encode()
+
+
+def feedback_response(
+    message: str, status_code: int = 200
+) -> Union[Feedback, Response]:
+    """
+    Send a fixed `Feedback` message.
+
+    Args:
+        message (str)    : The feedback detail, one of the messages of the routes.
+        status_code (int): Status code of the response, as declared on the route.
+
+    Returns:
+        Union[Feedback, Response]: The pre-encoded response with `FAST_JSON`, else the model.
+    """
+    if not config.FAST_JSON:
+        return Feedback(detail=message)
+
+    return Response(
+        content=_feedback_body(message),
+        status_code=status_code,
+        media_type="application/json",
+    )
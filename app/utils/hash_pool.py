@@ -0,0 +1,123 @@
+"""
+Bounded executor for bcrypt password hashing and verification.
+
+bcrypt takes hundreds of milliseconds per call, so running it on request threads
+lets a login storm starve vote traffic. `PasswordHasher` runs it in a small process
+pool instead and admits at most `HASH_POOL_MAX_PENDING` calls at a time. Callers
+past that limit get `HashPoolBusy` right away, and the app turns it into a 503.
+
+Classes:
+- HashPoolBusy  : Raised when the hashing queue is full.
+- PasswordHasher: Process pool with admission control and latency stats.
+"""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import config
+
+from .auth_utils import AuthUtils
+from .metrics import password_hash_rejected, password_hash_seconds
+
+
+class HashPoolBusy(Exception):
+    """Raised when the password hashing queue is full."""
+
+
+class PasswordHasher:
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_seconds = 0.0
+        self._max_seconds = 0.0
+
+    def start(self) -> None:
+        """Start the worker processes, hashing runs in the threadpool until then."""
+        if self._executor is None and self.workers > 0:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def hash(self, password: str) -> str:
+        """
+        Hashes a plain text password using bcrypt off the request thread.
+
+        Raises:
+            HashPoolBusy: If the hashing queue is full.
+        """
+        return await self._run(AuthUtils.encrypted_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verifies a plain text password against a hashed password off the request thread.
+
+        Raises:
+            HashPoolBusy: If the hashing queue is full.
+        """
+        return await self._run(
+            AuthUtils.verify_password, plain_password, hashed_password
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Current queue depth and hash latency counters."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_latency_ms": (
+                    round(self._total_seconds / self._completed * 1000, 2)
+                    if self._completed
+                    else 0.0
+                ),
+                "max_latency_ms": round(self._max_seconds * 1000, 2),
+            }
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                password_hash_rejected.inc()
+                raise HashPoolBusy()
+            self._pending += 1
+
+        started = time.perf_counter()
+        try:
+            if self._executor is None:
+                return await run_in_threadpool(func, *args)
+            return await asyncio.wrap_future(self._executor.submit(func, *args))
+
+        finally:
+            elapsed = time.perf_counter() - started
+            password_hash_seconds.observe(
+                elapsed,
+                operation="hash" if func is AuthUtils.encrypted_password else "verify",
+            )
+            with self._lock:
+                self._pending -= 1
+                self._completed += 1
+                self._total_seconds += elapsed
+                self._max_seconds = max(self._max_seconds, elapsed)
+
+
+password_hasher = PasswordHasher(config.HASH_POOL_WORKERS, config.HASH_POOL_MAX_PENDING)
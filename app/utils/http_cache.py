@@ -0,0 +1,173 @@
+"""
+Conditional GET support and process-local cache of encoded event reads.
+
+An event never changes after creation and its tally is final once it has been expired
+for `RESULTS_FINAL_GRACE_SECONDS` (the grace covers votes accepted before the deadline
+and committed after it). `response_cache` keeps the encoded JSON body of
+`GET /event/{id}` and `GET /event/{id}/results` with a strong ETag, so a matching
+`If-None-Match` is answered with 304 without the database or re-serialization.
+
+Cache-Control:
+- Event info   : `max-age=EVENT_INFO_MAX_AGE_SECONDS` while the event is open,
+                 `public, max-age=31536000, immutable` once it expired.
+- Event results: `no-cache` while votes can still change it, so clients revalidate,
+                 immutable once final.
+
+Invalidation:
+- Info entries are dropped with the catalog entry (`invalidate_event`).
+- Results entries carry the vote version they were encoded at and are only served
+  while it is current. Only entries encoded once the event was already final are
+  served forever; an entry encoded while votes could still land is never promoted.
+
+Classes:
+- EncodedResponse: Encoded body with its ETag, expiry, vote version and finality.
+
+Functions:
+- encode_response      : Encode a schema and compute its ETag.
+- is_final             : Whether an event's results can no longer change.
+- cached_results       : Encoded results of an event if still current.
+- info_cache_control   : Cache-Control of an event's info.
+- results_cache_control: Cache-Control of an event's results.
+- etag_matches         : Whether an `If-None-Match` header matches an ETag.
+- conditional_response : 304 or 200 response for an encoded body.
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+from uuid import UUID
+
+from fastapi import Response
+from pydantic import BaseModel
+
+from app.config import config
+
+from .cache import LRUCache
+from .results_cache import Version, vote_version
+
+logger = logging.getLogger(__name__)
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+@dataclass(frozen=True)
+class EncodedResponse:
+    """JSON body of an event read, its ETag and what decides its freshness."""
+
+    body: bytes
+    etag: str
+    expires_at: Optional[datetime]
+    version: Optional[Version] = None
+    final: bool = False
+
+
+response_cache: LRUCache[EncodedResponse] = LRUCache(config.HTTP_CACHE_SIZE)
+
+
+def encode_response(
+    model: BaseModel,
+    expires_at: Optional[datetime],
+    version: Optional[Version] = None,
+    final: bool = False,
+) -> EncodedResponse:
+    """
+    Encode a response schema once and derive a strong ETag from the bytes.
+
+    `final` must only be set when the event was already final before the encoded
+    data was read, so the body can be served as immutable.
+    """
+    body = model.model_dump_json().encode()
+    etag = f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+    return EncodedResponse(
+        body=body, etag=etag, expires_at=expires_at, version=version, final=final
+    )
+
+
+def is_final(expires_at: Optional[datetime]) -> bool:
+    """Whether an event expired long enough ago that its results cannot change."""
+    grace = timedelta(seconds=config.RESULTS_FINAL_GRACE_SECONDS)
+    return expires_at is not None and datetime.now() > expires_at + grace
+
+
+def cached_results(
+    event_id: UUID,
+) -> Tuple[Optional[EncodedResponse], Optional[Version]]:
+    """
+    Look up the encoded results of an event.
+
+    Args:
+        event_id (UUID): ID of the event.
+
+    Returns:
+        Tuple[Optional[EncodedResponse], Optional[Version]]:
+            - The encoded results if encoded as final or at the current vote version.
+            - The version to cache freshly encoded results at, None if unknown.
+    """
+    encoded = response_cache.get(("results", event_id))
+    if encoded is not None and encoded.final:
+        return encoded, encoded.version
+
+    try:
+        version = vote_version(event_id)
+    except Exception:
+        logger.warning("Vote version read failed", exc_info=True)
+        return None, None
+
+    if encoded is not None and encoded.version == version:
+        return encoded, version
+    return None, version
+
+
+def info_cache_control(expires_at: Optional[datetime]) -> str:
+    if expires_at is not None and datetime.now() > expires_at:
+        return IMMUTABLE
+    return f"public, max-age={config.EVENT_INFO_MAX_AGE_SECONDS}"
+
+
+def results_cache_control(encoded: EncodedResponse) -> str:
+    return IMMUTABLE if encoded.final else "public, no-cache"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an `If-None-Match` header matches an ETag (weak comparison, RFC 9110).
+
+    Args:
+        if_none_match (Optional[str]): Header value, a list of ETags or `*`.
+        etag (str)                   : Current ETag of the resource.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_response(
+    encoded: EncodedResponse, if_none_match: Optional[str], cache_control: str
+) -> Response:
+    """
+    Answer a conditional GET from an encoded body.
+
+    Args:
+        encoded (EncodedResponse)    : Body and ETag of the current representation.
+        if_none_match (Optional[str]): The request's `If-None-Match` header.
+        cache_control (str)          : `Cache-Control` of the response.
+
+    Returns:
+        Response: 304 without a body if the client's copy is current, otherwise 200.
+    """
+    headers = {"ETag": encoded.etag, "Cache-Control": cache_control}
+    if etag_matches(if_none_match, encoded.etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(
+        content=encoded.body, media_type="application/json", headers=headers
+    )
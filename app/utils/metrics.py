@@ -0,0 +1,391 @@
+"""
+In-process metrics in the Prometheus text exposition format.
+
+A small registry with counters, gauges and histograms, so the app can expose
+`/metrics` without a client library. Metrics are per worker process; with several
+`SERVER_WORKERS`, scrape each one (e.g. one port per worker, or a `pid` relabel).
+
+Instrumentation:
+- MetricsMiddleware     : Request count and latency per route template, in-flight
+                          requests, and DB query count and time per request.
+- Engine events         : Every statement's duration on any engine.
+- Session events        : Every commit's duration, the recent ones for `/health/ready`.
+- TimedQueuePool and
+  TimedAsyncAdaptedQueuePool: Time spent waiting for a pooled connection.
+- `PasswordHasher`      : Records bcrypt time in `password_hash_seconds`.
+- `GET /metrics`        : Samples threadpool, connection pool and hashing queue gauges.
+
+Classes:
+- Counter, Gauge, Histogram: Metric types, labelled by keyword arguments.
+- Registry                 : Renders every registered metric.
+"""
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50, 100)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def _labels(self, values: LabelValues, **extra: str) -> str:
+        pairs = [*zip(self.labels, values), *extra.items()]
+        if not pairs:
+            return ""
+        return (
+            "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+        )
+
+    def samples(self) -> Iterable[str]:
+        return ()
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            yield f"{self.name}{self._labels(key)} {_format_value(value)}"
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            yield f"{self.name}{self._labels(key)} {_format_value(value)}"
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: per-bucket counts (last one is +Inf), sum.
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key) or self._values.setdefault(
+                key, ([0] * (len(self.buckets) + 1), [0.0])
+            )
+            counts[index] += 1
+            total[0] += value
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            values = [
+                (key, list(counts), total[0])
+                for key, (counts, total) in self._values.items()
+            ]
+        for key, counts, total in values:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                yield (
+                    f"{self.name}_bucket{self._labels(key, le=_format_value(bound))} "
+                    f"{cumulative}"
+                )
+            yield f"{self.name}_sum{self._labels(key)} {_format_value(total)}"
+            yield f"{self.name}_count{self._labels(key)} {cumulative}"
+
+
+class Registry:
+
+    def __init__(self):
+        self._metrics: List[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, help, labels))
+
+    def histogram(
+        self, name: str, help: str, labels: Sequence[str] = (), **kwargs
+    ) -> Histogram:
+        return self.register(Histogram(name, help, labels, **kwargs))
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self._metrics) + "\n"
+
+
+registry = Registry()
+
+http_requests = registry.counter(
+    "http_requests_total", "HTTP requests served.", ("method", "route", "status")
+)
+http_request_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route"),
+)
+http_in_flight = registry.gauge(
+    "http_requests_in_flight", "HTTP requests being served."
+)
+db_query_seconds = registry.histogram(
+    "db_query_duration_seconds",
+    "Duration of single SQL statements.",
+    buckets=QUERY_BUCKETS,
+)
+db_commit_seconds = registry.histogram(
+    "db_commit_duration_seconds",
+    "Duration of session commits including the final flush.",
+    buckets=QUERY_BUCKETS,
+)
+db_queries_per_request = registry.histogram(
+    "db_queries_per_request",
+    "SQL statements executed per HTTP request.",
+    ("route",),
+    buckets=COUNT_BUCKETS,
+)
+db_seconds_per_request = registry.histogram(
+    "db_query_seconds_per_request",
+    "Total SQL time per HTTP request.",
+    ("route",),
+    buckets=QUERY_BUCKETS,
+)
+db_pool_wait_seconds = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled database connection.",
+    buckets=QUERY_BUCKETS,
+)
+threadpool_threads = registry.gauge(
+    "threadpool_threads",
+    "Threads of the sync-route threadpool, sampled at scrape time.",
+    ("state",),
+)
+db_pool_connections = registry.gauge(
+    "db_pool_connections",
+    "Connections of the database pool, sampled at scrape time.",
+    ("state",),
+)
+password_hash_pending = registry.gauge(
+    "password_hash_pending", "Hashing calls admitted and not finished."
+)
+password_hash_rejected = registry.counter(
+    "password_hash_rejected_total",
+    "Hashing calls rejected because the queue was full.",
+)
+password_hash_rejected.inc(0)
+password_hash_seconds = registry.histogram(
+    "password_hash_seconds",
+    "bcrypt time including the wait for a hashing worker.",
+    ("operation",),
+)
+
+
+# Per request -------------------------------------------------------------------
+@dataclass
+class RequestStats:
+    queries: int = 0
+    query_seconds: float = 0.0
+
+
+# Sync routes run in the threadpool with a copy of the context, so the stats object
+# is mutated in place rather than replaced.
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "request_stats", default=None
+)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware timing every HTTP request by its route template."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        http_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_in_flight.dec()
+            request_stats.reset(token)
+
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            http_requests.inc(method=method, route=template, status=str(status))
+            http_request_seconds.observe(elapsed, method=method, route=template)
+            db_queries_per_request.observe(stats.queries, route=template)
+            db_seconds_per_request.observe(stats.query_seconds, route=template)
+
+
+# Database ----------------------------------------------------------------------
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    db_query_seconds.observe(elapsed)
+
+    stats = request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.query_seconds += elapsed
+
+
+@event.listens_for(Engine, "handle_error")
+def _drop_query_timer(context):
+    connection = context.connection
+    if connection is not None and connection.info.get("query_started"):
+        connection.info["query_started"].pop()
+
+
+# (finished at, duration) of the latest commits, for the readiness probe.
+_recent_commits: "deque[Tuple[float, float]]" = deque(maxlen=1024)
+
+
+def recent_commit_seconds(window: float, quantile: float = 0.95) -> Optional[float]:
+    """
+    A quantile of the session commit durations of this process over a time window.
+
+    Args:
+        window (float)  : Only commits that finished in the last `window` seconds count.
+        quantile (float): Quantile of those durations, 0.95 for p95.
+
+    Returns:
+        Optional[float]: The quantile in seconds, None without commits in the window.
+    """
+    since = time.monotonic() - window
+    durations = sorted(
+        seconds for finished, seconds in list(_recent_commits) if finished >= since
+    )
+    if not durations:
+        return None
+
+    return durations[max(math.ceil(quantile * len(durations)) - 1, 0)]
+
+
+@event.listens_for(Session, "before_commit")
+def _start_commit_timer(session: Session) -> None:
+    session.info["commit_started"] = time.perf_counter()
+
+
+@event.listens_for(Session, "after_commit")
+def _stop_commit_timer(session: Session) -> None:
+    started = session.info.pop("commit_started", None)
+    if started is not None:
+        elapsed = time.perf_counter() - started
+        _recent_commits.append((time.monotonic(), elapsed))
+        db_commit_seconds.observe(elapsed)
+
+
+class CheckoutTimer:
+    """Pool mixin recording how long each checkout waited for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_wait_seconds.observe(time.perf_counter() - started)
+
+
+class TimedQueuePool(CheckoutTimer, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(CheckoutTimer, AsyncAdaptedQueuePool):
+    pass
@@ -0,0 +1,41 @@
+"""
+Cache of verified principals for `get_current_user`.
+
+Every authenticated request used to load the `Users` row behind its token. The
+principal (id, username, email) is cached here by user ID for
+`PRINCIPAL_CACHE_TTL_SECONDS`, so repeated requests from the same user skip that query.
+With a shared `SHARED_STATE_URL` the cache lives there and is seen by every worker.
+
+Invalidation:
+- ORM updates and deletes of `Users` (password change, account removal) drop the
+  entry automatically through mapper events, for every worker when shared.
+- Code that changes users with Core statements must call `invalidate_principal`.
+"""
+
+from uuid import UUID
+
+from sqlalchemy import event
+
+from app.config import config
+from app.models import Users
+from app.schemas import Principal
+
+from .shared_state import shared_cache
+
+principal_cache = shared_cache(
+    "principal",
+    Principal,
+    config.PRINCIPAL_CACHE_SIZE,
+    ttl=config.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_principal(user_id: UUID) -> None:
+    """Drop the cached principal of a user so the next request reloads it."""
+    principal_cache.delete(user_id)
+
+
+@event.listens_for(Users, "after_update")
+@event.listens_for(Users, "after_delete")
+def _invalidate_changed_user(mapper, connection, target: Users) -> None:
+    invalidate_principal(target.id)
@@ -0,0 +1,117 @@
+"""
+Helpers to capture the SQL an engine runs and inspect SQLite query plans.
+
+Classes:
+- QueryRecorder: Context manager that records every statement executed on an engine.
+- QueryPlan    : A recorded statement with its `EXPLAIN QUERY PLAN` output.
+
+Functions:
+- explain_queries: Run `EXPLAIN QUERY PLAN` on recorded statements and flag table scans.
+- is_scan        : Whether a plan line reads a whole table or sorts the rows it read.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, List, Tuple
+
+from sqlalchemy import Engine, event
+
+SCAN_PATTERN = re.compile(r"^SCAN (?!CONSTANT ROW)")
+INDEX_WALK_PATTERN = re.compile(r"^SCAN \S+ USING (COVERING )?INDEX ")
+SORT_PATTERN = re.compile(r"^USE TEMP B-TREE FOR .*ORDER BY")
+LIMIT_PATTERN = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+WHERE_PATTERN = re.compile(r"\bWHERE\b", re.IGNORECASE)
+EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+
+@dataclass
+class QueryPlan:
+    """A statement, the plan SQLite picked for it and the scans and sorts in that plan."""
+
+    statement: str
+    plan: List[str] = field(default_factory=list)
+    scans: List[str] = field(default_factory=list)
+
+
+class QueryRecorder:
+    """Record `(statement, parameters)` for every cursor execution on an engine."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.queries: List[Tuple[str, Any]] = []
+
+    def __enter__(self) -> "QueryRecorder":
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if executemany and parameters and isinstance(parameters[0], (list, tuple)):
+            parameters = parameters[0]
+        self.queries.append((statement, parameters))
+
+
+def explain_queries(engine: Engine, queries: List[Tuple[str, Any]]) -> List[QueryPlan]:
+    """
+    Run `EXPLAIN QUERY PLAN` once for every distinct statement.
+
+    Args:
+        engine (Engine)                 : SQLite engine the statements were recorded on.
+        queries (List[Tuple[str, Any]]) : Statements and parameters from a `QueryRecorder`.
+
+    Returns:
+        List[QueryPlan]: One plan per distinct statement, in first-seen order.
+    """
+    plans: List[QueryPlan] = []
+    seen = set()
+
+    with engine.connect() as connection:
+        for statement, parameters in queries:
+            if statement in seen or not statement.lstrip().upper().startswith(
+                EXPLAINABLE
+            ):
+                continue
+            seen.add(statement)
+
+            explain = f"EXPLAIN QUERY PLAN {statement}"
+            rows = (
+                connection.exec_driver_sql(explain, tuple(parameters))
+                if parameters
+                else connection.exec_driver_sql(explain)
+            ).all()
+            plan = [row[-1] for row in rows]
+            plans.append(
+                QueryPlan(
+                    statement=" ".join(statement.split()),
+                    plan=plan,
+                    scans=[line for line in plan if is_scan(line, statement, plan)],
+                )
+            )
+
+    return plans
+
+
+def is_scan(line: str, statement: str, plan: List[str]) -> bool:
+    """
+    Whether a plan line reads a whole table or sorts the rows it read.
+
+    Walking an index in `ORDER BY` order under a `LIMIT` stops after the page is
+    filled (keyset pagination), so it is not counted unless SQLite sorts afterwards or
+    the statement filters the rows, which can walk the whole index to fill a page.
+    A temporary B-tree for `ORDER BY` is counted even after an index search, since
+    every matching row is read and sorted before the `LIMIT` applies.
+    """
+    if SORT_PATTERN.match(line):
+        return True
+    if not SCAN_PATTERN.match(line):
+        return False
+
+    bounded = (
+        INDEX_WALK_PATTERN.match(line)
+        and LIMIT_PATTERN.search(statement)
+        and not WHERE_PATTERN.search(statement)
+        and not any("TEMP B-TREE" in step for step in plan)
+    )
+    return not bounded
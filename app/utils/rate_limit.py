@@ -0,0 +1,67 @@
+"""
+Fixed-window rate limiting on the shared state backend.
+
+Each key gets one counter per window in `shared_state`, so the limit holds across
+every worker instead of per process. When the backend cannot be reached the hit is
+logged and allowed, so an outage of the shared state does not take logins down.
+
+Classes:
+- RateLimiter: Counts hits per key and window and reports when a key is over its limit.
+"""
+
+import logging
+import math
+import time
+
+from app.config import config
+
+from .shared_state import SharedStateBackend, shared_state
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+
+    def __init__(
+        self, backend: SharedStateBackend, prefix: str, limit: int, window: float
+    ):
+        self.backend = backend
+        self.prefix = prefix
+        self.limit = limit
+        self.window = window
+
+    @property
+    def enabled(self) -> bool:
+        return self.limit > 0 and self.window > 0
+
+    def hit(self, key: str) -> int:
+        """
+        Count one hit for a key.
+
+        Args:
+            key (str): What is being limited, e.g. a username.
+
+        Returns:
+            int: 0 if the hit is allowed or could not be counted, otherwise the seconds
+                 until the window resets.
+        """
+        if not self.enabled:
+            return 0
+
+        now = time.time()
+        window = int(now // self.window)
+        try:
+            hits = self.backend.incr(f"{self.prefix}:{key}:{window}", ttl=self.window)
+        except Exception:
+            logger.warning("Rate limit check failed for %s", self.prefix, exc_info=True)
+            return 0
+
+        if hits <= self.limit:
+            return 0
+
+        return max(1, math.ceil((window + 1) * self.window - now))
+
+
+login_rate_limiter = RateLimiter(
+    shared_state, "login", config.LOGIN_RATE_LIMIT, config.LOGIN_RATE_WINDOW_SECONDS
+)
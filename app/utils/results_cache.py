@@ -0,0 +1,130 @@
+"""
+Shared vote versions and cached tallies of events.
+
+Every committed change to an event's vote counters bumps its version counter in
+`shared_state`. Tallies are cached together with the version they were computed at,
+so any worker can answer `GET /event/{id}/results` without the database until the
+next vote on that event. Rebuilding every counter bumps a global epoch instead.
+
+Functions:
+- track_vote_counts: Note, inside a transaction, that an event's counters changed.
+- vote_version     : Current (epoch, version) of an event.
+- get_results      : Cached tally of an event and the version to cache a fresh one at.
+- cache_results    : Store a tally under the version it was computed at.
+"""
+
+import json
+import logging
+from collections import Counter
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import config
+
+from .shared_state import shared_state
+
+logger = logging.getLogger(__name__)
+
+EPOCH_KEY = "votes:epoch"
+PENDING_KEY = "changed_vote_counts"
+ALL_EVENTS = "*"
+
+Version = Tuple[int, int]
+
+
+def _version_key(event_id: UUID) -> str:
+    return f"votes:{event_id}"
+
+
+def _results_key(event_id: UUID) -> str:
+    return f"results:{event_id}"
+
+
+def track_vote_counts(
+    session: Session, event_id: Optional[UUID], amount: int = 1
+) -> None:
+    """
+    Record that the counters of an event changed in the session's transaction.
+
+    The version is bumped once the transaction commits and forgotten on rollback.
+
+    Args:
+        session (Session)        : Session holding the transaction.
+        event_id (Optional[UUID]): ID of the event, None when every event changed.
+        amount (int)             : Number of changes to add to the version.
+    """
+    session.info.setdefault(PENDING_KEY, Counter())[event_id or ALL_EVENTS] += amount
+
+
+def vote_version(event_id: UUID) -> Version:
+    """Return the (epoch, version) of an event's vote counters, (0, 0) if unknown."""
+    epoch, version = shared_state.get_many([EPOCH_KEY, _version_key(event_id)])
+    return int(epoch or 0), int(version or 0)
+
+
+def get_results(event_id: UUID) -> Tuple[Version, Optional[List[Tuple[str, int]]]]:
+    """
+    Look up the cached tally of an event.
+
+    Args:
+        event_id (UUID): ID of the event.
+
+    Returns:
+        Tuple[Version, Optional[List[Tuple[str, int]]]]:
+            - The current version, to cache a freshly computed tally at.
+            - The tally if one was cached at the current version, otherwise None.
+    """
+    try:
+        epoch, version, cached = shared_state.get_many(
+            [EPOCH_KEY, _version_key(event_id), _results_key(event_id)]
+        )
+    except Exception:
+        logger.warning("Results cache read failed", exc_info=True)
+        return (-1, -1), None
+
+    current = (int(epoch or 0), int(version or 0))
+    if cached:
+        data = json.loads(cached)
+        if tuple(data["version"]) == current:
+            return current, [tuple(item) for item in data["results"]]
+
+    return current, None
+
+
+def cache_results(
+    event_id: UUID, version: Version, results: List[Tuple[str, int]]
+) -> None:
+    """Store the tally of an event under the version it was computed at."""
+    if version[0] < 0 or not results:
+        return
+
+    try:
+        shared_state.set(
+            _results_key(event_id),
+            json.dumps({"version": version, "results": results}),
+            config.RESULTS_CACHE_TTL_SECONDS,
+        )
+    except Exception:
+        logger.warning("Results cache write failed", exc_info=True)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_versions(session: Session) -> None:
+    changed = session.info.pop(PENDING_KEY, None)
+    if not changed:
+        return
+
+    try:
+        for event_id, amount in changed.items():
+            key = EPOCH_KEY if event_id == ALL_EVENTS else _version_key(event_id)
+            shared_state.incr(key, amount)
+    except Exception:
+        logger.warning("Failed to bump vote versions", exc_info=True)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_versions(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
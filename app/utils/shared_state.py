@@ -0,0 +1,277 @@
+"""
+Key/value state shared by every worker of a deployment.
+
+In-process caches only help the worker that filled them. The backends here give
+caches, counters and rate limits one home that all workers (and nodes) can see.
+The backend is chosen by `SHARED_STATE_URL`:
+- `memory://`                     : Process-local, the default for a single worker.
+- `redis://`, `rediss://`, `unix://`: Any Redis-protocol server, needs the `redis` package.
+  Counters with a TTL use `PEXPIRE ... NX`, available from Redis 7.0.
+
+Classes:
+- SharedStateBackend: Interface every backend implements. Values are strings.
+- MemoryBackend     : Bounded in-process implementation with per-key expiry.
+- RedisBackend      : Implementation on a Redis-protocol client.
+- SharedCache       : Typed cache of pydantic models stored in a backend.
+
+Functions:
+- create_backend: Build the backend for a URL.
+- shared_cache  : Build a cache that stays in-process when the backend is local.
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, List, Optional, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+from app.config import config
+
+from .cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class SharedStateBackend(ABC):
+    """Minimal key/value and counter operations shared state needs."""
+
+    shared: bool = True
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the value of a key, or None if it is missing or expired."""
+
+    @abstractmethod
+    def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        """Return the values of several keys in one round trip."""
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Store a value, expiring it after `ttl` seconds when given."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove a key if it exists."""
+
+    @abstractmethod
+    def incr(self, key: str, amount: int = 1, ttl: Optional[float] = None) -> int:
+        """
+        Atomically add `amount` to an integer key and return the new value.
+
+        A missing key starts at 0. `ttl` only applies when the key is created, so
+        a counter used as a fixed window expires at the end of that window.
+        """
+
+    def close(self) -> None:
+        """Release connections held by the backend."""
+
+
+class MemoryBackend(SharedStateBackend):
+    """Thread-safe in-process backend, evicting the least recently used key when full."""
+
+    shared = False
+
+    def __init__(self, max_size: int = 100000):
+        self.max_size = max_size
+        self._data: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[Tuple[float, str]]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        if item[0] and item[0] < time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return item
+
+    def _set(self, key: str, expires: float, value: str) -> None:
+        self._data[key] = (expires, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            item = self._get(key)
+            return item[1] if item else None
+
+    def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        with self._lock:
+            return [item[1] if item else None for item in map(self._get, keys)]
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._set(key, time.monotonic() + ttl if ttl else 0.0, value)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def incr(self, key: str, amount: int = 1, ttl: Optional[float] = None) -> int:
+        with self._lock:
+            item = self._get(key)
+            if item is None:
+                item = (time.monotonic() + ttl if ttl else 0.0, "0")
+
+            value = int(item[1]) + amount
+            self._set(key, item[0], str(value))
+            return value
+
+
+class RedisBackend(SharedStateBackend):
+    """Backend on a Redis-protocol server, built from a URL or an existing client."""
+
+    def __init__(self, url: Optional[str] = None, client: Any = None):
+        if client is None:
+            try:
+                import redis
+            except ImportError as exc:
+                raise RuntimeError(
+                    "SHARED_STATE_URL points to Redis but the `redis` package is not installed"
+                ) from exc
+
+            client = redis.Redis.from_url(url, decode_responses=True)
+
+        self.client = client
+
+    @staticmethod
+    def _decode(value: Union[None, str, bytes]) -> Optional[str]:
+        return value.decode() if isinstance(value, bytes) else value
+
+    def get(self, key: str) -> Optional[str]:
+        return self._decode(self.client.get(key))
+
+    def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        return [self._decode(value) for value in self.client.mget(keys)]
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        self.client.set(key, value, px=int(ttl * 1000) if ttl else None)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(key)
+
+    def incr(self, key: str, amount: int = 1, ttl: Optional[float] = None) -> int:
+        if not ttl:
+            return self.client.incrby(key, amount)
+
+        # One MULTI, so a dropped connection cannot leave a counter without expiry;
+        # NX (Redis 7+) keeps the expiry set when the key was created.
+        pipeline = self.client.pipeline(transaction=True)
+        pipeline.incrby(key, amount)
+        pipeline.pexpire(key, int(ttl * 1000), nx=True)
+        value, _ = pipeline.execute()
+        return value
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class SharedCache(Generic[M]):
+    """
+    Cache of pydantic models serialized as JSON in a shared backend.
+
+    Exposes the same `get`/`set`/`delete`/`clear` methods as `LRUCache`. Backend
+    errors are logged and treated as misses, so an unreachable server slows
+    requests down instead of failing them.
+    """
+
+    def __init__(
+        self,
+        backend: SharedStateBackend,
+        prefix: str,
+        model: Type[M],
+        ttl: Optional[float] = None,
+    ):
+        self.backend = backend
+        self.prefix = prefix
+        self.model = model
+        self.ttl = ttl
+
+    def _key(self, key: Hashable) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: Hashable, default: Any = None) -> Optional[M]:
+        try:
+            value = self.backend.get(self._key(key))
+        except Exception:
+            logger.warning(
+                "Shared cache read failed for %s", self.prefix, exc_info=True
+            )
+            return default
+
+        return self.model.model_validate_json(value) if value else default
+
+    def set(self, key: Hashable, value: M) -> None:
+        try:
+            self.backend.set(self._key(key), value.model_dump_json(), self.ttl)
+        except Exception:
+            logger.warning(
+                "Shared cache write failed for %s", self.prefix, exc_info=True
+            )
+
+    def delete(self, key: Hashable) -> None:
+        try:
+            self.backend.delete(self._key(key))
+        except Exception:
+            logger.warning(
+                "Shared cache delete failed for %s", self.prefix, exc_info=True
+            )
+
+    def clear(self) -> None:
+        """Shared entries are only dropped key by key or when they expire."""
+
+
+def create_backend(url: str) -> SharedStateBackend:
+    """
+    Build the shared state backend for a URL.
+
+    Args:
+        url (str): `memory://` or a Redis URL (`redis://`, `rediss://`, `unix://`).
+
+    Returns:
+        SharedStateBackend: The backend.
+
+    Raises:
+        ValueError: If the URL scheme is not supported.
+    """
+    scheme = url.split("://", 1)[0].lower()
+    if scheme == "memory":
+        return MemoryBackend(config.SHARED_STATE_MAX_KEYS)
+
+    if scheme in ("redis", "rediss", "unix"):
+        return RedisBackend(url)
+
+    raise ValueError(f"Unsupported SHARED_STATE_URL scheme: {scheme}")
+
+
+shared_state = create_backend(config.SHARED_STATE_URL)
+
+
+def shared_cache(
+    prefix: str, model: Type[M], max_size: int, ttl: Optional[float] = None
+) -> Union[LRUCache[M], SharedCache[M]]:
+    """
+    Build a cache on `shared_state`.
+
+    A local backend gains nothing from serializing, so the cache then stays a plain
+    `LRUCache` holding the model objects themselves.
+
+    Args:
+        prefix (str)         : Key prefix in the backend.
+        model (Type[M])      : Pydantic model of the cached values.
+        max_size (int)       : Entry limit of the in-process cache.
+        ttl (Optional[float]): Seconds an entry stays valid.
+    """
+    if not shared_state.shared:
+        return LRUCache(max_size, ttl=ttl)
+
+    return SharedCache(shared_state, prefix, model, ttl=ttl)
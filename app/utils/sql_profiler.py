@@ -0,0 +1,333 @@
+"""
+Per-request SQL profiler and N+1 detector, enabled with `SQL_PROFILE_ENABLED`.
+
+`Event`, `Choice`, `Vote` and `Users` declare lazy relationships, so code walking
+`event.choices` or `choice.votes` issues one query per row. The profiler records every
+statement a request runs and groups identical ones; bound parameters keep the SQL text
+of such a loop constant, so a SELECT repeated `SQL_PROFILE_N_PLUS_ONE` times or more in
+one request is reported as N+1.
+
+Each profiled response carries an `X-SQL-Profile` header, and the latest
+`SQL_PROFILE_HISTORY` profiles are served by `GET /debug/sql-profiles`. With
+`SQL_PROFILE_DIR` set, endpoints also run under cProfile and requests slower than
+`SQL_PROFILE_SLOW_MS` write their `.prof` file there (read it with `pstats` or
+`snakeviz`). Since Python 3.12 a profiler observes the whole process, so one request
+is profiled at a time and the others run unprofiled meanwhile.
+
+Meant for development: every statement of every request is recorded.
+
+Classes:
+- SQLProfiler          : Engine listeners and the recent request profiles.
+- SQLProfilerMiddleware: Pure ASGI middleware profiling each HTTP request.
+
+Functions:
+- profile_endpoints: Run the endpoints of API routes under cProfile.
+"""
+
+import asyncio
+import cProfile
+import functools
+import itertools
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, Iterable, List, Optional
+
+from fastapi.routing import APIRoute
+from sqlalchemy import Engine, event
+from starlette.datastructures import MutableHeaders
+
+from app.config import config
+from app.schemas import RequestProfile, StatementProfile
+
+logger = logging.getLogger(__name__)
+
+HEADER = "X-SQL-Profile"
+EXCLUDED_PREFIX = "/debug/"
+
+
+@dataclass
+class Recording:
+    """Statements of one request in progress: text -> [count, seconds]."""
+
+    id: int
+    statements: Dict[str, List[float]] = field(default_factory=dict)
+    queries: int = 0
+    seconds: float = 0.0
+    profiler: Optional[cProfile.Profile] = None
+    closed: bool = False
+
+
+# Sync routes run in the threadpool with a copy of the context, so the recording is
+# mutated in place rather than replaced.
+_recording: ContextVar[Optional[Recording]] = ContextVar("sql_recording", default=None)
+# cProfile is process-wide since Python 3.12, see the module docstring.
+_cprofile_lock = threading.Lock()
+
+
+def _start_statement(conn, cursor, statement, parameters, context, executemany):
+    recording = _recording.get()
+    if recording is not None and not recording.closed:
+        conn.info.setdefault("profile_started", []).append(time.perf_counter())
+
+
+def _stop_statement(conn, cursor, statement, parameters, context, executemany):
+    recording = _recording.get()
+    if recording is None or recording.closed or not conn.info.get("profile_started"):
+        return
+
+    elapsed = time.perf_counter() - conn.info["profile_started"].pop()
+    stats = recording.statements.setdefault(" ".join(statement.split()), [0, 0.0])
+    stats[0] += 1
+    stats[1] += elapsed
+    recording.queries += 1
+    recording.seconds += elapsed
+
+
+def _drop_statement(context):
+    connection = context.connection
+    if connection is not None and connection.info.get("profile_started"):
+        connection.info["profile_started"].pop()
+
+
+class SQLProfiler:
+
+    def __init__(
+        self,
+        history: int,
+        n_plus_one: int,
+        profile_dir: Optional[str] = None,
+        slow_ms: float = 500.0,
+    ):
+        self.n_plus_one = n_plus_one
+        self.profile_dir = profile_dir
+        self.slow_ms = slow_ms
+        self.profiles: Deque[RequestProfile] = deque(maxlen=history)
+        self._ids = itertools.count(1)
+        self._installed = False
+
+    def install(self) -> None:
+        """Start listening to the statements of every engine."""
+        if self._installed:
+            return
+
+        event.listen(Engine, "before_cursor_execute", _start_statement)
+        event.listen(Engine, "after_cursor_execute", _stop_statement)
+        event.listen(Engine, "handle_error", _drop_statement)
+        self._installed = True
+
+    def start(self) -> Recording:
+        return Recording(id=next(self._ids))
+
+    def is_n_plus_one(self, statement: str, count: int) -> bool:
+        return count >= self.n_plus_one and statement.lstrip().upper().startswith(
+            "SELECT"
+        )
+
+    def summary(self, recording: Recording) -> str:
+        """Value of the `X-SQL-Profile` header."""
+        n_plus_one = sum(
+            self.is_n_plus_one(statement, int(count))
+            for statement, (count, _) in recording.statements.items()
+        )
+        return (
+            f"id={recording.id}; queries={recording.queries}; "
+            f"time_ms={recording.seconds * 1000:.2f}; n_plus_one={n_plus_one}"
+        )
+
+    def finish(
+        self, recording: Recording, scope: dict, status: int, seconds: float
+    ) -> RequestProfile:
+        """
+        Close a recording and keep its profile.
+
+        Args:
+            recording (Recording): Statements recorded during the request.
+            scope (dict)         : ASGI scope of the request.
+            status (int)         : Response status code.
+            seconds (float)      : Duration of the whole request.
+
+        Returns:
+            RequestProfile: The profile, with the most expensive statements first.
+        """
+        recording.closed = True
+        route = getattr(scope.get("route"), "path", None)
+
+        statements = sorted(
+            (
+                StatementProfile(
+                    statement=statement,
+                    count=int(count),
+                    total_ms=round(total * 1000, 3),
+                    n_plus_one=self.is_n_plus_one(statement, int(count)),
+                )
+                for statement, (count, total) in recording.statements.items()
+            ),
+            key=lambda stats: stats.total_ms,
+            reverse=True,
+        )
+        profile = RequestProfile(
+            id=recording.id,
+            method=scope["method"],
+            path=scope["path"],
+            route=route,
+            status=status,
+            duration_ms=round(seconds * 1000, 3),
+            queries=recording.queries,
+            query_ms=round(recording.seconds * 1000, 3),
+            n_plus_one=sum(stats.n_plus_one for stats in statements),
+            statements=statements,
+        )
+
+        if recording.profiler is not None and profile.duration_ms >= self.slow_ms:
+            profile.cprofile = self._dump(recording.profiler, profile)
+
+        if profile.n_plus_one:
+            logger.warning(
+                "Possible N+1 queries in %s %s: %s",
+                profile.method,
+                route or profile.path,
+                "; ".join(
+                    f"{stats.count}x {stats.statement[:120]}"
+                    for stats in statements
+                    if stats.n_plus_one
+                ),
+            )
+
+        self.profiles.append(profile)
+        return profile
+
+    def recent(
+        self, limit: Optional[int] = None, n_plus_one: bool = False
+    ) -> List[RequestProfile]:
+        """Kept profiles, newest first, optionally only those with N+1 queries."""
+        profiles = [
+            profile
+            for profile in reversed(self.profiles)
+            if profile.n_plus_one or not n_plus_one
+        ]
+        return profiles[:limit] if limit is not None else profiles
+
+    def clear(self) -> None:
+        self.profiles.clear()
+
+    def _dump(
+        self, profiler: cProfile.Profile, profile: RequestProfile
+    ) -> Optional[str]:
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", profile.route or profile.path).strip("_")
+        path = os.path.join(
+            self.profile_dir,
+            f"{int(time.time())}-{profile.id}-{profile.method}-{slug or 'root'}.prof",
+        )
+        try:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            profiler.dump_stats(path)
+        except OSError:
+            logger.exception("Failed to write the profile of request %s", profile.id)
+            return None
+        return path
+
+
+class SQLProfilerMiddleware:
+    """Pure ASGI middleware recording the SQL of every HTTP request."""
+
+    def __init__(self, app, profiler: Optional[SQLProfiler] = None):
+        self.app = app
+        self.profiler = profiler or sql_profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(EXCLUDED_PREFIX):
+            await self.app(scope, receive, send)
+            return
+
+        recording = self.profiler.start()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append(HEADER, self.profiler.summary(recording))
+            await send(message)
+
+        token = _recording.set(recording)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _recording.reset(token)
+            self.profiler.finish(
+                recording, scope, status, time.perf_counter() - started
+            )
+
+
+def _profiled(call: Callable) -> Callable:
+    """Wrap an endpoint so it runs under cProfile when no other request is profiled."""
+
+    def begin() -> Optional[cProfile.Profile]:
+        recording = _recording.get()
+        if recording is None or not _cprofile_lock.acquire(blocking=False):
+            return None
+
+        profiler = recording.profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiling tool is active in the process.
+            recording.profiler = None
+            _cprofile_lock.release()
+            return None
+        return profiler
+
+    def end(profiler: Optional[cProfile.Profile]) -> None:
+        if profiler is not None:
+            profiler.disable()
+            _cprofile_lock.release()
+
+    if asyncio.iscoroutinefunction(call):
+
+        @functools.wraps(call)
+        async def async_wrapper(*args, **kwargs):
+            profiler = begin()
+            try:
+                return await call(*args, **kwargs)
+            finally:
+                end(profiler)
+
+        return async_wrapper
+
+    @functools.wraps(call)
+    def wrapper(*args, **kwargs):
+        profiler = begin()
+        try:
+            return call(*args, **kwargs)
+        finally:
+            end(profiler)
+
+    return wrapper
+
+
+def profile_endpoints(routes: Iterable) -> None:
+    """
+    Run the endpoint of every API route under cProfile.
+
+    The request handler of a route calls `route.dependant.call`, so swapping it keeps
+    dependency injection, validation and serialization as they were.
+    """
+    for route in routes:
+        if isinstance(route, APIRoute) and route.dependant.call is not None:
+            route.dependant.call = _profiled(route.dependant.call)
+
+
+sql_profiler = SQLProfiler(
+    config.SQL_PROFILE_HISTORY,
+    config.SQL_PROFILE_N_PLUS_ONE,
+    config.SQL_PROFILE_DIR,
+    config.SQL_PROFILE_SLOW_MS,
+)
@@ -0,0 +1,95 @@
+"""
+Encoding of vote exports as NDJSON or CSV, compressed with gzip on the fly.
+
+Rows arrive in chunks and leave as one bytes block per chunk, so an export of any size
+holds a single chunk in memory.
+
+Functions:
+- accepts_gzip: Whether an `Accept-Encoding` header allows gzip.
+- encode_votes: Encode chunks of vote rows in an export format.
+- gzip_stream : Compress a stream of bytes blocks into one gzip member.
+"""
+
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Iterable, Iterator, List, Literal, Optional, Tuple
+from uuid import UUID
+
+ExportFormat = Literal["ndjson", "csv"]
+VoteRow = Tuple[UUID, int, Optional[datetime]]
+
+FIELDS = ("user_id", "choice_id", "time_logs")
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Whether `gzip` is listed in an `Accept-Encoding` header with a non-zero q."""
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() not in ("gzip", "*"):
+            continue
+
+        quality = params.strip().removeprefix("q=")
+        try:
+            return not quality or float(quality) > 0
+        except ValueError:
+            return False
+    return False
+
+
+def encode_votes(
+    chunks: Iterable[List[VoteRow]], export_format: ExportFormat
+) -> Iterator[bytes]:
+    """
+    Encode chunks of (user_id, choice_id, time_logs) rows.
+
+    Args:
+        chunks (Iterable[List[VoteRow]]): Vote rows, one list per chunk.
+        export_format (ExportFormat)    : "ndjson" for one JSON object per line, "csv"
+                                          for a header line followed by the rows.
+
+    Yields:
+        bytes: The encoded rows of one chunk, the CSV header first.
+    """
+    if export_format == "csv":
+        yield (",".join(FIELDS) + "\n").encode()
+
+    for rows in chunks:
+        buffer = io.StringIO()
+        if export_format == "csv":
+            csv.writer(buffer, lineterminator="\n").writerows(
+                (user_id, choice_id, time_logs.isoformat() if time_logs else "")
+                for user_id, choice_id, time_logs in rows
+            )
+        else:
+            for user_id, choice_id, time_logs in rows:
+                record = {
+                    "user_id": str(user_id),
+                    "choice_id": choice_id,
+                    "time_logs": time_logs.isoformat() if time_logs else None,
+                }
+                buffer.write(json.dumps(record, separators=(",", ":")) + "\n")
+        yield buffer.getvalue().encode()
+
+
+def gzip_stream(blocks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """
+    Compress bytes blocks as they come into a single gzip member.
+
+    Args:
+        blocks (Iterable[bytes]): Uncompressed blocks.
+        level (int)             : zlib compression level.
+
+    Yields:
+        bytes: Compressed data, skipping blocks the compressor only buffered.
+    """
+    # wbits 16 + 15 writes the gzip header and trailer around the deflate stream.
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for block in blocks:
+        data = compressor.compress(block)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,318 @@
+"""
+Load test of the HTTP API: votes, event reads, logins and event creation.
+
+Every scenario is driven by `--concurrency` clients, either in-process through the
+ASGI app (lifespan included, against a fresh seeded SQLite file) or against a
+running server given with `--url` (seeded through the API, which costs two bcrypt
+hashes per user). Each scenario reports throughput, latency percentiles and, when
+`/metrics` is enabled, SQL statements per request taken from
+`db_queries_per_request` (scrape a single worker for exact numbers).
+
+Scenarios:
+- vote        : POST /vote/{event_id}/{choice}, each user once per event.
+- get_event   : GET /event/{event_id} on random seeded events.
+- login       : POST /users/login, bounded by bcrypt.
+- create_event: POST /events/ with two choices.
+
+Usage:
+    python -m benchmarks.bench_http --requests 2000 --concurrency 32 --json http.json
+    python -m benchmarks.bench_http --url http://localhost:8000 --users 100
+"""
+
+import argparse
+import asyncio
+import random
+import re
+import shutil
+import tempfile
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.common import (
+    BENCH_PASSWORD,
+    seed_events,
+    seed_users,
+    setup_environment,
+    summarize,
+    write_results,
+)
+
+WORKDIR = tempfile.mkdtemp(prefix="bench-http-")
+setup_environment(f"sqlite:///{WORKDIR}/bench.db")
+
+import httpx  # noqa: E402
+
+SCENARIOS = ["vote", "get_event", "login", "create_event"]
+ROUTES = {
+    "vote": "/vote/{event_id}/{choice}",
+    "get_event": "/event/{event_id}",
+    "login": "/users/login",
+    "create_event": "/events/",
+}
+QUERIES_SAMPLE = re.compile(
+    r'^db_queries_per_request_(sum|count)\{route="([^"]*)"\} (\S+)$', re.MULTILINE
+)
+
+Request = Tuple[str, str, Dict[str, Any]]
+
+
+@dataclass
+class Seed:
+    """Users and events a scenario draws its requests from."""
+
+    usernames: List[str] = field(default_factory=list)
+    tokens: List[str] = field(default_factory=list)
+    event_ids: List[str] = field(default_factory=list)
+
+
+# Clients -----------------------------------------------------------------------
+@asynccontextmanager
+async def in_process_client(
+    users: int, events: int, rng: random.Random
+) -> AsyncIterator[Tuple[httpx.AsyncClient, Seed]]:
+    """Client calling the ASGI app directly, with the database seeded in-process."""
+    # Imported here so that `--url` runs never build the app's engine.
+    from sqlmodel import Session
+
+    from app.databases import engine
+    from app.main import app
+    from app.services import UserService
+    from app.utils import AuthUtils
+
+    async with app.router.lifespan_context(app):
+        with Session(engine) as session:
+            usernames = seed_users(
+                session, users, AuthUtils.encrypted_password(BENCH_PASSWORD)
+            )
+            user_ids = list(usernames)
+            event_ids = seed_events(session, user_ids, events, rng)
+
+        seed = Seed(
+            usernames=list(usernames.values()),
+            tokens=[UserService.issue_token(user_id) for user_id in user_ids],
+            event_ids=[str(event_id) for event_id in event_ids],
+        )
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            yield client, seed
+
+    engine.dispose()
+
+
+@asynccontextmanager
+async def remote_client(
+    url: str, users: int, events: int, concurrency: int
+) -> AsyncIterator[Tuple[httpx.AsyncClient, Seed]]:
+    """Client of a running server, seeded through the API."""
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        seed = Seed(usernames=[uuid.uuid4().hex for _ in range(users)])
+
+        async def register(username: str) -> str:
+            response = await client.post(
+                "/users/",
+                json={
+                    "email": f"{username}@bench.io",
+                    "username": username,
+                    "password": BENCH_PASSWORD,
+                },
+            )
+            response.raise_for_status()
+            response = await client.post(
+                "/users/login",
+                data={"username": username, "password": BENCH_PASSWORD},
+            )
+            response.raise_for_status()
+            return response.json()["access_token"]
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(username: str) -> str:
+            async with semaphore:
+                return await register(username)
+
+        seed.tokens = await asyncio.gather(*map(bounded, seed.usernames))
+
+        response = await client.post(
+            "/events/bulk",
+            json=[event_payload(index) for index in range(events)],
+            headers=auth(seed.tokens[0]),
+        )
+        response.raise_for_status()
+        seed.event_ids = [item["id"] for item in response.json()["created"]]
+
+        yield client, seed
+
+
+# Scenarios ---------------------------------------------------------------------
+def auth(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def event_payload(index: int) -> Dict[str, Any]:
+    return {
+        "name": f"bench {index}",
+        "description": "bench",
+        "choices": [{"choice": "A"}, {"choice": "B"}],
+    }
+
+
+def build_requests(
+    scenario: str, seed: Seed, count: int, rng: random.Random
+) -> List[Request]:
+    """The requests of one scenario, in the order they are sent."""
+    users, events = len(seed.tokens), len(seed.event_ids)
+
+    if scenario == "vote":
+        # Pairs are walked user-major so that concurrent votes hit the same event.
+        count = min(count, users * events)
+        return [
+            (
+                "POST",
+                f"/vote/{seed.event_ids[index // users]}/{rng.choice('AB')}",
+                {"headers": auth(seed.tokens[index % users])},
+            )
+            for index in range(count)
+        ]
+
+    if scenario == "get_event":
+        return [
+            ("GET", f"/event/{rng.choice(seed.event_ids)}", {}) for _ in range(count)
+        ]
+
+    if scenario == "login":
+        return [
+            (
+                "POST",
+                "/users/login",
+                {
+                    "data": {
+                        "username": rng.choice(seed.usernames),
+                        "password": BENCH_PASSWORD,
+                    }
+                },
+            )
+            for _ in range(count)
+        ]
+
+    return [
+        (
+            "POST",
+            "/events/",
+            {"json": event_payload(index), "headers": auth(rng.choice(seed.tokens))},
+        )
+        for index in range(count)
+    ]
+
+
+async def queries_by_route(client: httpx.AsyncClient) -> Dict[str, List[float]]:
+    """`[sum, count]` of `db_queries_per_request` per route, empty without metrics."""
+    response = await client.get("/metrics")
+    if response.status_code != 200:
+        return {}
+
+    samples: Dict[str, List[float]] = {}
+    for kind, route, value in QUERIES_SAMPLE.findall(response.text):
+        samples.setdefault(route, [0.0, 0.0])[kind == "count"] = float(value)
+    return samples
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: str,
+    requests: List[Request],
+    concurrency: int,
+) -> Dict[str, Any]:
+    pending = iter(requests)
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+
+    async def worker() -> None:
+        for method, url, kwargs in pending:
+            started = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            elapsed = time.perf_counter() - started
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            if response.is_success:
+                latencies.append(elapsed)
+
+    before = await queries_by_route(client)
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    after = await queries_by_route(client)
+
+    route = ROUTES[scenario]
+    queries: Optional[float] = None
+    if route in after:
+        total, count = (
+            now - then for now, then in zip(after[route], before.get(route, [0, 0]))
+        )
+        queries = round(total / count, 2) if count else None
+
+    return {
+        "scenario": scenario,
+        "requests": len(requests),
+        **summarize(latencies, elapsed),
+        "queries_per_request": queries,
+        "statuses": {str(code): count for code, count in sorted(statuses.items())},
+    }
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    rng = random.Random(args.seed)
+    client_factory: Callable = (
+        (lambda: remote_client(args.url, args.users, args.events, args.concurrency))
+        if args.url
+        else (lambda: in_process_client(args.users, args.events, rng))
+    )
+
+    rows = []
+    async with client_factory() as (client, seed):
+        for scenario in args.scenarios:
+            count = args.login_requests if scenario == "login" else args.requests
+            requests = build_requests(scenario, seed, count, rng)
+            row = await run_scenario(client, scenario, requests, args.concurrency)
+            rows.append(row)
+            print(
+                f"{row['scenario']:<13} {row['per_sec']:>9} req/s  "
+                f"p50 {row['p50_ms']} ms  p95 {row['p95_ms']} ms  "
+                f"p99 {row['p99_ms']} ms  queries/req {row['queries_per_request']}  "
+                f"statuses {row['statuses']}"
+            )
+
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default=None, help="running server, else in-process")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--login-requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument(
+        "--json", dest="json_path", default=None, help="write results here"
+    )
+    args = parser.parse_args()
+
+    try:
+        rows = asyncio.run(run(args))
+    finally:
+        shutil.rmtree(WORKDIR, ignore_errors=True)
+
+    if args.json_path:
+        params = {key: value for key, value in vars(args).items() if key != "json_path"}
+        write_results(args.json_path, rows, **params)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Micro-benchmarks of the hot functions behind the vote and auth paths.
+
+Each case is called `--iterations` times in a loop on one thread, against a fresh
+seeded SQLite file, and timed per call. No HTTP, threadpool or serialization is
+involved, so the numbers are the floor of what a request using them can cost.
+
+Cases:
+- create_vote          : `EventService.create_vote`, one vote per seeded user.
+- get_current_user     : `get_current_user` of one user, principal cached.
+- get_current_user_cold: Same with the principal evicted before every call.
+- jwt_encode           : `UserService.issue_token`.
+- jwt_decode           : `decode_token`.
+
+Usage:
+    python -m benchmarks.bench_micro --iterations 5000 --json micro.json
+"""
+
+import argparse
+import random
+import shutil
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.common import (
+    seed_events,
+    seed_users,
+    setup_environment,
+    summarize,
+    write_results,
+)
+
+WORKDIR = tempfile.mkdtemp(prefix="bench-micro-")
+setup_environment(f"sqlite:///{WORKDIR}/bench.db")
+
+from sqlmodel import Session  # noqa: E402
+
+from app.databases import create_all_tables, engine  # noqa: E402
+from app.routes.deps import decode_token, get_current_user  # noqa: E402
+from app.services import EventService, UserService  # noqa: E402
+from app.utils import principal_cache  # noqa: E402
+
+CASES = [
+    "create_vote",
+    "get_current_user",
+    "get_current_user_cold",
+    "jwt_encode",
+    "jwt_decode",
+]
+
+
+def measure(call: Callable[[int], Any], iterations: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for index in range(iterations):
+        begin = time.perf_counter()
+        call(index)
+        latencies.append(time.perf_counter() - begin)
+    return summarize(latencies, time.perf_counter() - started)
+
+
+def build_cases(iterations: int, rng: random.Random) -> Dict[str, Callable]:
+    with Session(engine) as session:
+        user_ids = list(seed_users(session, iterations))
+        event_id = seed_events(session, user_ids, 1, rng)[0]
+
+    tokens = [UserService.issue_token(user_id) for user_id in user_ids]
+    choices = [rng.choice("AB") for _ in user_ids]
+
+    def create_vote(index: int) -> None:
+        with Session(engine) as session:
+            success, message = EventService.create_vote(
+                session, user_ids[index], event_id, choices[index]
+            )
+        if not success:
+            raise RuntimeError(message)
+
+    def current_user(index: int) -> None:
+        # Always the first user, whose principal stays cached after the first call.
+        with Session(engine) as session:
+            get_current_user(session, tokens[0])
+
+    def current_user_cold(index: int) -> None:
+        principal_cache.delete(user_ids[index])
+        with Session(engine) as session:
+            get_current_user(session, tokens[index])
+
+    return {
+        "create_vote": create_vote,
+        "get_current_user": current_user,
+        "get_current_user_cold": current_user_cold,
+        "jwt_encode": lambda index: UserService.issue_token(user_ids[index]),
+        "jwt_decode": lambda index: decode_token(tokens[index]),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=CASES)
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument(
+        "--json", dest="json_path", default=None, help="write results here"
+    )
+    args = parser.parse_args()
+
+    rows = []
+    try:
+        create_all_tables()
+        cases = build_cases(args.iterations, random.Random(args.seed))
+        for name in args.cases:
+            row = {"case": name, **measure(cases[name], args.iterations)}
+            rows.append(row)
+            print(
+                f"{row['case']:<22} {row['per_sec']:>10} ops/s  "
+                f"p50 {row['p50_ms']:>8} ms  p95 {row['p95_ms']:>8} ms  "
+                f"p99 {row['p99_ms']:>8} ms"
+            )
+    finally:
+        engine.dispose()
+        shutil.rmtree(WORKDIR, ignore_errors=True)
+
+    if args.json_path:
+        params = {key: value for key, value in vars(args).items() if key != "json_path"}
+        write_results(args.json_path, rows, **params)
+
+
+if __name__ == "__main__":
+    main()
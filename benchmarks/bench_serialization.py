@@ -0,0 +1,168 @@
+"""
+Per-request cost of turning a route's return value into a JSON response.
+
+Each payload is a model a route builds (`Feedback` of a vote, `TokenSchema` of a
+login, a 20-event `EventPage`), encoded `--iterations` times through every path:
+
+Paths:
+- fastapi       : What FastAPI does for a `response_model` route: `serialize_response`
+                  (revalidation and `jsonable_encoder`), then `JSONResponse`.
+- fastapi_orjson: Same with `ORJSONResponse`, the `FAST_JSON` default response class
+                  (skipped without the `orjson` package).
+- model_dump    : `model_response`, the `FAST_JSON` path of routes returning a model.
+- preencoded    : `feedback_response`, cached bytes of a fixed `Feedback` message.
+
+No database or HTTP is involved; run `bench_http` with and without `FAST_JSON=true`
+for the end-to-end difference.
+
+Usage:
+    python -m benchmarks.bench_serialization --iterations 20000 --json serialization.json
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List
+
+from benchmarks.common import setup_environment, summarize, write_results
+
+setup_environment()
+os.environ["FAST_JSON"] = "true"
+
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+from app.schemas import (  # noqa: E402
+    ChoiceSchema,
+    EventPage,
+    EventSummary,
+    Feedback,
+    TokenSchema,
+)
+from app.utils import feedback_response, model_response  # noqa: E402
+
+PAYLOADS = ["feedback", "token", "event_page"]
+PATHS = ["fastapi", "fastapi_orjson", "model_dump", "preencoded"]
+
+HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+
+
+def build_payloads() -> Dict[str, BaseModel]:
+    now = datetime.now()
+    page = EventPage(
+        items=[
+            EventSummary(
+                id=uuid.uuid4(),
+                title=f"event {index}",
+                desc="benchmark event",
+                expires_at=now + timedelta(days=index),
+                creator_id=uuid.uuid4(),
+                choices=[ChoiceSchema(choice=choice) for choice in "ABCD"],
+            )
+            for index in range(20)
+        ],
+        next_cursor="AAAAAAAAAAAAAAAAAAAAAA",
+    )
+    return {
+        "feedback": Feedback(detail="Successfully votes event"),
+        "token": TokenSchema(access_token="x" * 160, token_type="bearer"),
+        "event_page": page,
+    }
+
+
+def build_path(path: str, model: BaseModel) -> Callable[[], Awaitable[Any]]:
+    """One encoding of `model` through `path`, as a coroutine function."""
+    field = create_model_field(
+        name=f"Response_{type(model).__name__}", type_=type(model), mode="serialization"
+    )
+
+    async def fastapi(response_class=JSONResponse) -> Any:
+        content = await serialize_response(field=field, response_content=model)
+        return response_class(content)
+
+    async def fastapi_orjson() -> Any:
+        return await fastapi(ORJSONResponse)
+
+    async def model_dump() -> Any:
+        return model_response(model)
+
+    async def preencoded() -> Any:
+        return feedback_response(model.detail)
+
+    return {
+        "fastapi": fastapi,
+        "fastapi_orjson": fastapi_orjson,
+        "model_dump": model_dump,
+        "preencoded": preencoded,
+    }[path]
+
+
+async def measure(
+    call: Callable[[], Awaitable[Any]], iterations: int
+) -> Dict[str, Any]:
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        begin = time.perf_counter()
+        await call()
+        latencies.append(time.perf_counter() - begin)
+    elapsed = time.perf_counter() - started
+    return {
+        **summarize(latencies, elapsed),
+        "mean_us": round(sum(latencies) / len(latencies) * 1e6, 2),
+    }
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    payloads = build_payloads()
+    rows = []
+    for name in args.payloads:
+        model = payloads[name]
+        body = model_response(model).body
+        for path in args.paths:
+            if path == "fastapi_orjson" and not HAS_ORJSON:
+                continue
+            if path == "preencoded" and not isinstance(model, Feedback):
+                continue
+
+            call = build_path(path, model)
+            await measure(call, min(args.iterations, 1000))  # warm up
+            row = {
+                "payload": name,
+                "path": path,
+                "bytes": len(body),
+                **await measure(call, args.iterations),
+            }
+            rows.append(row)
+            print(
+                f"{row['payload']:<11} {row['path']:<15} {row['per_sec']:>11} ops/s  "
+                f"mean {row['mean_us']:>8} us  p99 {row['p99_ms']:>7} ms"
+            )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--payloads", nargs="+", choices=PAYLOADS, default=PAYLOADS)
+    parser.add_argument("--paths", nargs="+", choices=PATHS, default=PATHS)
+    parser.add_argument(
+        "--json", dest="json_path", default=None, help="write results here"
+    )
+    args = parser.parse_args()
+
+    rows = asyncio.run(run(args))
+
+    if args.json_path:
+        params = {key: value for key, value in vars(args).items() if key != "json_path"}
+        write_results(args.json_path, rows, orjson=HAS_ORJSON, **params)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Benchmark the SQLite pragma profile against the vote write path.
+
+Each profile adds one pragma on top of the previous one, starting from the SQLite
+defaults (rollback journal, synchronous=FULL, no busy timeout). For every profile a
+fresh database file is seeded and `EventService.create_vote` is driven from writer
+threads while reader threads keep calling `EventService.get_event_by_id`, so the
+numbers show both commit cost and reader/writer blocking.
+
+Usage:
+    python -m benchmarks.bench_sqlite_pragmas --votes 2000 --writers 8 --readers 4
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from benchmarks.common import (
+    percentile,
+    seed_events,
+    seed_users,
+    setup_environment,
+    write_results,
+)
+
+setup_environment("sqlite://")
+
+from sqlmodel import Session, SQLModel  # noqa: E402
+
+from app.databases import build_engine  # noqa: E402
+from app.services import EventService  # noqa: E402
+
+DEFAULTS = {
+    "busy_timeout": None,
+    "journal_mode": None,
+    "synchronous": None,
+    "cache_size": None,
+    "mmap_size": None,
+    "temp_store": None,
+}
+
+STEPS = [
+    ("defaults", {}),
+    ("+busy_timeout=5000", {"busy_timeout": 5000}),
+    ("+journal_mode=WAL", {"journal_mode": "WAL"}),
+    ("+synchronous=NORMAL", {"synchronous": "NORMAL"}),
+    ("+cache_size=-64000", {"cache_size": -64000}),
+    ("+mmap_size=256MiB", {"mmap_size": 268435456}),
+    ("+temp_store=MEMORY", {"temp_store": "MEMORY"}),
+]
+
+
+def seed(engine, voters: int) -> Dict[str, Any]:
+    """Create one event with two choices and `voters` users, returning their IDs."""
+    with Session(engine) as session:
+        user_ids = list(seed_users(session, voters))
+        event_id = seed_events(session, user_ids[:1], 1, random.Random(0))[0]
+
+    return {"user_ids": user_ids, "event_id": event_id}
+
+
+def run_profile(
+    name: str, pragmas: Dict[str, Any], votes: int, writers: int, readers: int
+) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = build_engine(
+            f"sqlite:///{os.path.join(workdir, 'bench.db')}", pragmas=pragmas
+        )
+        SQLModel.metadata.create_all(engine)
+        data = seed(engine, votes)
+
+        stop = threading.Event()
+        reads = [0]
+        read_errors = [0]
+
+        def reader() -> None:
+            while not stop.is_set():
+                try:
+                    with Session(engine) as session:
+                        EventService.get_event_by_id(session, data["event_id"])
+                    reads[0] += 1
+                except Exception:
+                    read_errors[0] += 1
+
+        def vote(index: int) -> Optional[float]:
+            started = time.perf_counter()
+            with Session(engine) as session:
+                success, _ = EventService.create_vote(
+                    session, data["user_ids"][index], data["event_id"], "AB"[index % 2]
+                )
+            return time.perf_counter() - started if success else None
+
+        reader_threads = [threading.Thread(target=reader) for _ in range(readers)]
+        for thread in reader_threads:
+            thread.start()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(writers) as pool:
+            results = list(pool.map(vote, range(votes)))
+        elapsed = time.perf_counter() - started
+
+        stop.set()
+        for thread in reader_threads:
+            thread.join()
+        engine.dispose()
+
+    latencies = [latency for latency in results if latency is not None]
+    return {
+        "profile": name,
+        "pragmas": {key: value for key, value in pragmas.items() if value is not None},
+        "votes": len(latencies),
+        "failed": votes - len(latencies),
+        "votes_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2) if latencies else None,
+        "reads_per_sec": round(reads[0] / elapsed, 1),
+        "read_errors": read_errors[0],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--votes", type=int, default=2000)
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument(
+        "--json", dest="json_path", default=None, help="write results here"
+    )
+    args = parser.parse_args()
+
+    pragmas = dict(DEFAULTS)
+    rows = []
+    for name, change in STEPS:
+        pragmas.update(change)
+        row = run_profile(name, dict(pragmas), args.votes, args.writers, args.readers)
+        rows.append(row)
+        print(
+            f"{row['profile']:<22} {row['votes_per_sec']:>9} votes/s "
+            f"p50 {row['p50_ms']:>8} ms  p99 {row['p99_ms']:>8} ms  "
+            f"reads {row['reads_per_sec']:>9}/s  failed {row['failed']}"
+        )
+
+    if args.json_path:
+        params = {key: value for key, value in vars(args).items() if key != "json_path"}
+        write_results(args.json_path, rows, **params)
+
+
+if __name__ == "__main__":
+    main()
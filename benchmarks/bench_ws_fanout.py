@@ -0,0 +1,214 @@
+"""
+Benchmark the results websocket: memory per idle connection and fan-out latency.
+
+Connections are opened in-process against the ASGI app, so the numbers cover
+everything the app keeps per connection (endpoint and helper tasks, topic queue,
+Starlette objects) but not the server's socket buffers. For each connection count
+the script:
+- measures traced Python memory before and after opening the idle connections,
+- casts votes through `EventService.create_vote` and times how long every
+  connection takes to receive the new tally after the commit.
+
+Fan-out latency includes the wait for the next broadcaster tick, so it is reported
+next to `--tick-ms`.
+
+Usage:
+    python -m benchmarks.bench_ws_fanout --connections 1000 10000 --rounds 20
+"""
+
+import argparse
+import asyncio
+import gc
+import random
+import shutil
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+from benchmarks.common import (
+    percentile,
+    seed_events,
+    seed_users,
+    setup_environment,
+    write_results,
+)
+
+WORKDIR = tempfile.mkdtemp(prefix="bench-ws-")
+setup_environment(f"sqlite:///{WORKDIR}/bench.db")
+
+from fastapi.concurrency import run_in_threadpool  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+
+from app.databases import create_all_tables, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services import EventService, UserService, results_broadcaster  # noqa: E402
+
+
+def seed(voters: int) -> Dict[str, Any]:
+    """Create an event with two choices, its creator and `voters` users."""
+    with Session(engine) as session:
+        user_ids = list(seed_users(session, voters + 1))
+        event_id = seed_events(session, user_ids[:1], 1, random.Random(0))[0]
+
+    return {
+        "token": UserService.issue_token(user_ids[0]),
+        "voter_ids": user_ids[1:],
+        "event_id": event_id,
+    }
+
+
+class Connection:
+    """One websocket client driven through the ASGI interface."""
+
+    def __init__(self, path: str, token: str, fanout: "Fanout"):
+        self.inbox: asyncio.Queue = asyncio.Queue()
+        self.accepted = asyncio.Event()
+        self.fanout = fanout
+        self.scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "http_version": "1.1",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": f"token={token}".encode(),
+            "root_path": "",
+            "headers": [],
+            "client": ("127.0.0.1", 0),
+            "server": ("bench", 80),
+            "subprotocols": [],
+        }
+
+    def open(self) -> asyncio.Task:
+        self.inbox.put_nowait({"type": "websocket.connect"})
+        return asyncio.create_task(app(self.scope, self.inbox.get, self.send))
+
+    def close(self) -> None:
+        self.inbox.put_nowait({"type": "websocket.disconnect", "code": 1000})
+
+    async def send(self, message: Dict[str, Any]) -> None:
+        if message["type"] == "websocket.accept":
+            return
+        if message["type"] == "websocket.close":
+            raise RuntimeError(f"Connection refused: {message.get('reason')}")
+
+        if not self.accepted.is_set():
+            # The first message is the tally at connect time.
+            self.accepted.set()
+        elif '"type":"results"' in message.get("text", ""):
+            self.fanout.received()
+
+
+class Fanout:
+    """Collects the arrival times of one tally update across all connections."""
+
+    def __init__(self, expected: int):
+        self.expected = expected
+        self.arrivals: List[float] = []
+        self.done = asyncio.Event()
+
+    def received(self) -> None:
+        self.arrivals.append(time.perf_counter())
+        if len(self.arrivals) >= self.expected:
+            self.done.set()
+
+    def reset(self) -> None:
+        self.arrivals = []
+        self.done = asyncio.Event()
+
+
+async def run_size(data: Dict[str, Any], size: int, rounds: int) -> Dict[str, Any]:
+    path = f"/ws/event/{data['event_id']}"
+    fanout = Fanout(size)
+    connections = [Connection(path, data["token"], fanout) for _ in range(size)]
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    tasks = [connection.open() for connection in connections]
+    await asyncio.gather(*(connection.accepted.wait() for connection in connections))
+    await asyncio.sleep(results_broadcaster.tick * 2)
+
+    gc.collect()
+    per_connection = (tracemalloc.get_traced_memory()[0] - before) / size
+    tracemalloc.stop()
+
+    latencies: List[float] = []
+    last_delivery: List[float] = []
+    for index in range(rounds):
+        fanout.reset()
+        voter_id = data["voter_ids"][index]
+
+        def vote() -> float:
+            with Session(engine) as session:
+                EventService.create_vote(
+                    session, voter_id, data["event_id"], "AB"[index % 2]
+                )
+            return time.perf_counter()
+
+        committed = await run_in_threadpool(vote)
+        await asyncio.wait_for(fanout.done.wait(), 60)
+        latencies.extend(arrival - committed for arrival in fanout.arrivals)
+        last_delivery.append(max(fanout.arrivals) - committed)
+
+    for connection in connections:
+        connection.close()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    return {
+        "connections": size,
+        "kib_per_connection": round(per_connection / 1024, 2),
+        "tick_ms": round(results_broadcaster.tick * 1000),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "last_delivery_p50_ms": round(statistics.median(last_delivery) * 1000, 2),
+    }
+
+
+async def run(sizes: List[int], rounds: int) -> List[Dict[str, Any]]:
+    create_all_tables()
+    data = seed(rounds * len(sizes))
+
+    rows = []
+    for offset, size in enumerate(sizes):
+        voters = data["voter_ids"][offset * rounds : (offset + 1) * rounds]
+        row = await run_size({**data, "voter_ids": voters}, size, rounds)
+        rows.append(row)
+        print(
+            f"{row['connections']:>6} connections  {row['kib_per_connection']:>7} KiB/conn  "
+            f"tick {row['tick_ms']} ms  p50 {row['p50_ms']:>8} ms  p99 {row['p99_ms']:>8} ms  "
+            f"all delivered p50 {row['last_delivery_p50_ms']:>8} ms"
+        )
+
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--connections", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--tick-ms", type=int, default=None)
+    parser.add_argument(
+        "--json", dest="json_path", default=None, help="write results here"
+    )
+    args = parser.parse_args()
+
+    if args.tick_ms is not None:
+        results_broadcaster.tick = args.tick_ms / 1000
+
+    try:
+        rows = asyncio.run(run(args.connections, args.rounds))
+    finally:
+        engine.dispose()
+        shutil.rmtree(WORKDIR, ignore_errors=True)
+
+    if args.json_path:
+        params = {key: value for key, value in vars(args).items() if key != "json_path"}
+        write_results(args.json_path, rows, **params)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Shared helpers of the benchmark scripts.
+
+The app reads its settings at import time, so a benchmark calls `setup_environment`
+before importing anything from `app`. Seeding helpers import the models lazily for
+the same reason.
+
+Functions:
+- setup_environment: Settings needed to import the app, with a benchmark database.
+- percentile       : Nearest-rank percentile of a list of samples.
+- summarize        : Throughput and latency percentiles of one run.
+- seed_users       : Insert users sharing one password hash.
+- seed_events      : Insert events with two choices each.
+- write_results    : Write rows to JSON with the commit and interpreter they ran on.
+"""
+
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+BENCH_PASSWORD = "bench-password"
+
+
+def setup_environment(database_url: Optional[str] = None) -> None:
+    """Set the settings the app requires, keeping any the caller exported."""
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    os.environ.setdefault("FRONTEND_HOST", "http://localhost")
+    os.environ.setdefault("APP_VERSION", "benchmark")
+    if database_url is not None:
+        os.environ.setdefault("DATABASE_URL", database_url)
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(latencies: Sequence[float], elapsed: float) -> Dict[str, Any]:
+    """
+    Throughput and latency percentiles of one run.
+
+    Args:
+        latencies (Sequence[float]): Seconds per successful operation.
+        elapsed (float)            : Wall time of the whole run in seconds.
+
+    Returns:
+        Dict[str, Any]: `count`, `per_sec` and `p50_ms`/`p95_ms`/`p99_ms`.
+    """
+    if not latencies:
+        return {
+            "count": 0,
+            "per_sec": 0.0,
+            "p50_ms": None,
+            "p95_ms": None,
+            "p99_ms": None,
+        }
+
+    return {
+        "count": len(latencies),
+        "per_sec": round(len(latencies) / elapsed, 1) if elapsed else None,
+        "p50_ms": round(statistics.median(latencies) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def seed_users(session, count: int, password_hash: str = "x") -> Dict[uuid.UUID, str]:
+    """Insert `count` users with the same password hash, returns their usernames by ID."""
+    from app.models import Users
+
+    users = [
+        Users(
+            email=f"{uuid.uuid4().hex}@bench.io",
+            username=uuid.uuid4().hex,
+            password=password_hash,
+        )
+        for _ in range(count)
+    ]
+    # Read before the commit expires the instances.
+    usernames = {user.id: user.username for user in users}
+    session.add_all(users)
+    session.commit()
+    return usernames
+
+
+def seed_events(
+    session, creator_ids: Sequence[uuid.UUID], count: int, rng: random.Random
+) -> List[uuid.UUID]:
+    """Insert `count` events with choices `A` and `B`, created by random users."""
+    from app.models import Choice, Event
+
+    events = [
+        Event(title=f"bench {index}", desc="bench", creator_id=rng.choice(creator_ids))
+        for index in range(count)
+    ]
+    event_ids = [event.id for event in events]
+    session.add_all(events)
+    session.commit()
+
+    session.add_all(
+        [
+            Choice(choice=choice, event_id=event_id)
+            for event_id in event_ids
+            for choice in "AB"
+        ]
+    )
+    session.commit()
+    return event_ids
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(path: str, rows: List[Dict[str, Any]], **params: Any) -> None:
+    """
+    Write benchmark rows to JSON, tagged so runs can be compared across commits.
+
+    Args:
+        path (str)                : Output file.
+        rows (List[Dict[str, Any]]): One row per measured configuration.
+        **params (Any)            : Benchmark arguments the rows depend on.
+    """
+    document = {
+        "benchmark": os.path.splitext(os.path.basename(sys.argv[0]))[0],
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "params": params,
+        "results": rows,
+    }
+    with open(path, "w") as handle:
+        json.dump(document, handle, indent=2, default=str)
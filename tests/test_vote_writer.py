@@ -0,0 +1,68 @@
+"""
+Tests for the write-behind `VoteWriter`.
+
+Run with `python -m unittest discover tests`.
+"""
+
+import os
+import sqlite3
+import unittest
+import uuid
+
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("FRONTEND_HOST", "http://localhost")
+os.environ.setdefault("APP_VERSION", "0")
+
+from sqlalchemy import event  # noqa: E402
+from sqlmodel import Session, SQLModel, func, select  # noqa: E402
+
+from app.databases import build_engine  # noqa: E402
+from app.models import Vote  # noqa: E402
+from app.services.vote_writer import FAILED, SUCCESS, VoteWriter  # noqa: E402
+
+
+class VoteWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = build_engine("sqlite://")
+        SQLModel.metadata.create_all(self.engine)
+        self.writer = VoteWriter(batch_size=10, batch_interval_ms=1)
+        self.event_id = uuid.uuid4()
+
+    def tearDown(self):
+        self.writer.stop()
+        self.engine.dispose()
+
+    def flush(self, user_ids):
+        futures = [
+            self.writer.submit(user_id, self.event_id, 1) for user_id in user_ids
+        ]
+        self.writer.start(self.engine)
+        self.writer.stop()
+        return [future.result(timeout=5) for future in futures]
+
+    def count_votes(self):
+        with Session(self.engine) as session:
+            return session.exec(select(func.count(Vote.id))).one()
+
+    def test_flush_writes_votes(self):
+        outcomes = self.flush([uuid.uuid4(), uuid.uuid4()])
+
+        self.assertEqual(outcomes, [(True, SUCCESS), (True, SUCCESS)])
+        self.assertEqual(self.count_votes(), 2)
+
+    def test_failed_duplicate_check_settles_every_vote(self):
+        def lock_duplicate_check(conn, cursor, statement, *args):
+            if statement.lstrip().startswith("SELECT vote.user_id"):
+                raise sqlite3.OperationalError("database is locked")
+
+        event.listen(self.engine, "before_cursor_execute", lock_duplicate_check)
+        outcomes = self.flush([uuid.uuid4(), uuid.uuid4()])
+        event.remove(self.engine, "before_cursor_execute", lock_duplicate_check)
+
+        self.assertEqual(outcomes, [(False, FAILED), (False, FAILED)])
+        self.assertEqual(self.count_votes(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()